@@ -49,6 +49,7 @@ def register_plugin(registry: "Registry") -> None:
     registry.register_subcommand(add_raster.create_add_raster_command)
     registry.register_subcommand(copy.create_copy_command)
     registry.register_subcommand(create.create_create_item_command)
+    registry.register_subcommand(copy.create_execute_transfers_command)
     registry.register_subcommand(copy.create_move_assets_command)
     registry.register_subcommand(info.create_info_command)
     registry.register_subcommand(info.create_describe_command)
@@ -1,21 +1,210 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
 import click
 import pystac
+from pystac import Item
+
+from stactools.core import add_raster_to_item, add_raster_to_items
+from stactools.core.add_raster import raster_fingerprint
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def add_raster(
+    item_path: str,
+    approximate: bool = False,
+    max_pixels: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
+    state_file: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    stac_object = pystac.read_file(item_path)
+    if isinstance(stac_object, pystac.Item):
+        item = add_raster_to_item(
+            stac_object,
+            approximate=approximate,
+            max_pixels=max_pixels,
+            max_workers=max_workers,
+            executor=executor,
+        )
+        item.save_object()
+    elif isinstance(stac_object, pystac.Catalog):
+        _add_raster_to_catalog(
+            stac_object,
+            approximate=approximate,
+            max_pixels=max_pixels,
+            max_workers=max_workers,
+            executor=executor,
+            state_file=state_file,
+            batch_size=batch_size,
+        )
+    else:
+        raise click.BadArgumentUsage(
+            f"{item_path} is not a STAC Item, Catalog, or Collection"
+        )
+
+
+def _add_raster_to_catalog(
+    catalog: pystac.Catalog,
+    approximate: bool,
+    max_pixels: Optional[int],
+    max_workers: Optional[int],
+    executor: str,
+    state_file: Optional[str],
+    batch_size: int,
+) -> None:
+    """Adds the raster extension to all items of a catalog, in batches.
+
+    When a state file is given, the fingerprint of each saved item is appended
+    to it after each batch. Items whose data assets all have raster bands and
+    whose recorded fingerprint is current are skipped, so an interrupted run
+    resumes where it stopped and an unchanged catalog is not reprocessed.
+    """
+    items = list(catalog.get_items(recursive=True))
+    state = _read_state(state_file) if state_file else {}
+
+    def fingerprint(item: Item) -> str:
+        return raster_fingerprint(item, approximate=approximate, max_pixels=max_pixels)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        fingerprints = list(pool.map(fingerprint, items))
+
+    pending = [
+        (item, fingerprint)
+        for item, fingerprint in zip(items, fingerprints)
+        if not _has_raster_bands(item)
+        or state.get(str(item.get_self_href())) != fingerprint
+    ]
+    include_self_link = catalog.catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        add_raster_to_items(
+            [item for item, _ in batch],
+            approximate=approximate,
+            max_pixels=max_pixels,
+            max_workers=max_workers,
+            executor=executor,
+        )
+        for item, _ in batch:
+            item.save_object(include_self_link=include_self_link)
+        if state_file:
+            _append_state(
+                state_file,
+                {str(item.get_self_href()): fingerprint for item, fingerprint in batch},
+            )
+
+    click.echo(
+        f"Added raster bands to {len(pending)} items, "
+        f"skipped {len(items) - len(pending)} up-to-date items"
+    )
+
+
+def _has_raster_bands(item: Item) -> bool:
+    return all(
+        "raster:bands" in asset.extra_fields
+        for asset in item.assets.values()
+        if asset.roles and "data" in asset.roles
+    )
+
 
-from stactools.core import add_raster_to_item
+def _read_state(state_file: str) -> Dict[str, str]:
+    """Reads the item fingerprints from a JSON lines state file; later lines
+    take precedence over earlier ones."""
+    state: Dict[str, str] = {}
+    if not os.path.exists(state_file):
+        return state
+    with open(state_file) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                state[entry["href"]] = entry["fingerprint"]
+    return state
 
 
-def add_raster(item_path: str) -> None:
-    item = pystac.read_file(item_path)
-    if not isinstance(item, pystac.Item):
-        raise click.BadArgumentUsage(f"{item_path} is not a STAC Item")
-    item = add_raster_to_item(item)
-    item.save_object()
+def _append_state(state_file: str, fingerprints: Dict[str, str]) -> None:
+    lines: List[str] = [
+        json.dumps({"href": href, "fingerprint": fingerprint}) + "\n"
+        for href, fingerprint in fingerprints.items()
+    ]
+    with open(state_file, "a") as f:
+        f.writelines(lines)
+        f.flush()
+        os.fsync(f.fileno())
 
 
 def create_add_raster_command(cli: click.Group) -> click.Command:
-    @cli.command("add-raster", short_help="Add raster extension to an Item.")
+    @cli.command(
+        "add-raster",
+        short_help="Add raster extension to an Item, or all Items of a Catalog.",
+    )
     @click.argument("item_path")
-    def add_raster_command(item_path: str) -> None:
-        add_raster(item_path)
+    @click.option(
+        "--approximate",
+        is_flag=True,
+        help=(
+            "Compute approximate statistics and histograms from existing GDAL "
+            "statistics metadata and overviews."
+        ),
+    )
+    @click.option(
+        "--max-pixels",
+        type=click.IntRange(min=1),
+        help=(
+            "The maximum number of pixels read per band for approximate "
+            "statistics. Implies --approximate."
+        ),
+    )
+    @click.option(
+        "-w",
+        "--max-workers",
+        type=click.IntRange(min=1),
+        help="The maximum number of assets, or bands, to process concurrently.",
+    )
+    @click.option(
+        "--executor",
+        type=click.Choice(["thread", "process"]),
+        default="thread",
+        show_default=True,
+        help="Process bands in threads, or assets in processes.",
+    )
+    @click.option(
+        "-s",
+        "--state-file",
+        type=click.Path(dir_okay=False),
+        help=(
+            "A local file to record the fingerprint of each updated Item of a "
+            "Catalog. Items with up-to-date raster bands are skipped, so an "
+            "interrupted run can be resumed by running the command again."
+        ),
+    )
+    @click.option(
+        "--batch-size",
+        type=click.IntRange(min=1),
+        default=DEFAULT_BATCH_SIZE,
+        show_default=True,
+        help="The number of Items of a Catalog processed between checkpoints.",
+    )
+    def add_raster_command(
+        item_path: str,
+        approximate: bool,
+        max_pixels: Optional[int],
+        max_workers: Optional[int],
+        executor: str,
+        state_file: Optional[str],
+        batch_size: int,
+    ) -> None:
+        add_raster(
+            item_path,
+            approximate=approximate,
+            max_pixels=max_pixels,
+            max_workers=max_workers,
+            executor=executor,
+            state_file=state_file,
+            batch_size=batch_size,
+        )
 
     return add_raster_command
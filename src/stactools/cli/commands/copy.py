@@ -4,7 +4,13 @@ import click
 import pystac
 from pystac.utils import make_absolute_href
 
-from stactools.core.copy import copy_catalog, move_all_assets
+from stactools.core.copy import (
+    copy_catalog,
+    execute_transfers,
+    move_all_assets,
+    read_transfer_manifest,
+    write_transfer_manifest,
+)
 
 
 def create_move_assets_command(cli: click.Group) -> click.Command:
@@ -26,8 +32,27 @@ def create_move_assets_command(cli: click.Group) -> click.Command:
             "their items"
         ),
     )
+    @click.option(
+        "-w",
+        "--max-workers",
+        type=click.IntRange(min=1),
+        help="The maximum number of asset files to transfer concurrently.",
+    )
+    @click.option(
+        "-p",
+        "--plan",
+        "manifest_path",
+        help=(
+            "Write the planned transfers to this JSON lines manifest, to be run "
+            "with execute-transfers, instead of moving or copying the assets."
+        ),
+    )
     def move_assets_command(
-        catalog_path: str, copy: bool, asset_subdirectory: str
+        catalog_path: str,
+        copy: bool,
+        asset_subdirectory: str,
+        max_workers: Optional[int],
+        manifest_path: Optional[str],
     ) -> None:
         """Move or copy assets in a STAC Catalog.
 
@@ -37,6 +62,9 @@ def create_move_assets_command(cli: click.Group) -> click.Command:
         called 'assets' next to the item for which they belong. If -c is used,
         assets are copied; otherwise they are moved.
 
+        If --plan is used, the catalog is saved with the new asset HREFs and
+        the transfers are written to a manifest instead of being executed.
+
         Note: If the catalog is an ABSOLUTE_PUBLISHED catalog, the assets will have
         an absolute HREF after this operation. Otherwise, it will have a relative HREF.
         """
@@ -44,8 +72,23 @@ def create_move_assets_command(cli: click.Group) -> click.Command:
         if not isinstance(catalog, pystac.Catalog):
             raise click.BadArgumentUsage(f"{catalog_path} is not a STAC Catalog")
 
+        if manifest_path is not None:
+            transfers = move_all_assets(
+                catalog,
+                asset_subdirectory=asset_subdirectory,
+                copy=copy,
+                max_workers=max_workers,
+                plan_only=True,
+            )
+            write_transfer_manifest(transfers, manifest_path)
+            catalog.save()
+            return
+
         processed = move_all_assets(
-            catalog, asset_subdirectory=asset_subdirectory, copy=copy
+            catalog,
+            asset_subdirectory=asset_subdirectory,
+            copy=copy,
+            max_workers=max_workers,
         )
 
         processed.save()
@@ -53,6 +96,41 @@ def create_move_assets_command(cli: click.Group) -> click.Command:
     return move_assets_command
 
 
+def create_execute_transfers_command(cli: click.Group) -> click.Command:
+    @cli.command(
+        "execute-transfers",
+        short_help="Execute the asset transfers of a manifest.",
+    )
+    @click.argument("manifest_path")
+    @click.option(
+        "-w",
+        "--max-workers",
+        type=click.IntRange(min=1),
+        help="The maximum number of asset files to transfer concurrently.",
+    )
+    def execute_transfers_command(
+        manifest_path: str, max_workers: Optional[int]
+    ) -> None:
+        """Execute the asset transfers in the manifest at MANIFEST_PATH.
+
+        The manifest is written by move-assets --plan, and can be split into
+        several manifests by line to run them on different machines. Transfers
+        already done are skipped, so an interrupted run is resumed by running
+        the command again.
+        """
+        report = execute_transfers(
+            read_transfer_manifest(manifest_path),
+            max_workers=max_workers,
+            resume=True,
+        )
+        click.echo(
+            f"Transferred {report.files} asset files ({report.skipped} skipped), "
+            f"{report.bytes / 1e6:.1f} MB in {report.seconds:.1f} s"
+        )
+
+    return execute_transfers_command
+
+
 def create_copy_command(cli: click.Group) -> click.Command:
     @cli.command("copy", short_help="Copy a STAC Catalog")
     @click.argument("src")
@@ -91,6 +169,26 @@ def create_copy_command(cli: click.Group) -> click.Command:
             "Use --no-resolve-links to avoid writing external child objects locally."
         ),
     )
+    @click.option(
+        "-w",
+        "--max-workers",
+        type=click.IntRange(min=1),
+        help="The maximum number of asset files to copy concurrently.",
+    )
+    @click.option(
+        "--sync",
+        is_flag=True,
+        help=(
+            "Only copy asset files that are missing from the destination or "
+            "differ from the source, compared by size, ETag, and modification "
+            "time."
+        ),
+    )
+    @click.option(
+        "--checksum",
+        is_flag=True,
+        help="With --sync, compare asset files by their SHA-256 checksums.",
+    )
     def copy_command(
         src: str,
         dst: str,
@@ -98,6 +196,9 @@ def create_copy_command(cli: click.Group) -> click.Command:
         copy_assets: bool,
         publish_location: Optional[str],
         resolve_links: bool,
+        max_workers: Optional[int],
+        sync: bool,
+        checksum: bool,
     ) -> None:
         """Copy a STAC Catalog or Collection at SRC to the directory at DST.
 
@@ -113,6 +214,9 @@ def create_copy_command(cli: click.Group) -> click.Command:
             copy_assets,
             publish_location,
             resolve_links,
+            max_workers,
+            sync,
+            checksum,
         )
 
     return copy_command
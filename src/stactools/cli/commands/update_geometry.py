@@ -1,17 +1,21 @@
 from typing import List, Optional
 
 import click
+import pystac
 from click import Command, Group
 from pystac import Item
 
 from stactools.core.utils import raster_footprint
+from stactools.core.utils.footprint_cache import DirectoryFootprintCache
+
+DEFAULT_CACHE_MAX_BYTES = 1 << 28
 
 
 def create_update_geometry_command(cli: Group) -> Command:
     @cli.command(
         "update-geometry", short_help="Update an item geometry from an asset footprint"
     )
-    @click.argument("item-path")
+    @click.argument("paths", metavar="ITEM_PATH...", nargs=-1, required=True)
     @click.option(
         "-a",
         "--asset-name",
@@ -47,6 +51,14 @@ def create_update_geometry_command(cli: Group) -> Command:
             "polygon"
         ),
     )
+    @click.option(
+        "--densification-tolerance",
+        type=float,
+        help=(
+            "Adaptively densify the polygon until the reprojected edges are "
+            "within this distance of the reprojected path, in degrees."
+        ),
+    )
     @click.option(
         "-s",
         "--simplify-tolerance",
@@ -54,6 +66,12 @@ def create_update_geometry_command(cli: Group) -> Command:
         help="All points in the simplified object will be within "
         "the tolerance distance of the original geometry, in degrees.",
     )
+    @click.option(
+        "--max-vertices",
+        type=click.IntRange(min=5),
+        help="The maximum number of coordinates in the footprint. The footprint is "
+        "simplified as needed, and always covers the unsimplified footprint.",
+    )
     @click.option(
         "-n",
         "--no-data",
@@ -70,6 +88,133 @@ def create_update_geometry_command(cli: Group) -> Command:
         default="1",
         show_default=True,
     )
+    @click.option(
+        "-w",
+        "--windowed",
+        is_flag=True,
+        help=(
+            "Build the data mask one internal block window at a time to bound "
+            "memory use on large rasters."
+        ),
+    )
+    @click.option(
+        "--max-pixels",
+        type=int,
+        help=(
+            "Compute the data mask from a decimated read (an overview level, if "
+            "available) with at most this many pixels."
+        ),
+    )
+    @click.option(
+        "--max-error",
+        type=float,
+        help=(
+            "Compute the data mask from the coarsest decimated read whose pixel "
+            "diagonal does not exceed this distance, in degrees."
+        ),
+    )
+    @click.option(
+        "-m",
+        "--mask-source",
+        type=click.Choice(
+            [source.name.lower() for source in raster_footprint.MaskSource],
+            case_sensitive=False,
+        ),
+        help="Where to get the valid data mask from.",
+        default="nodata",
+        show_default=True,
+    )
+    @click.option(
+        "-f",
+        "--footprint-mode",
+        type=click.Choice(
+            [mode.name.lower() for mode in raster_footprint.FootprintMode],
+            case_sensitive=False,
+        ),
+        help="How the footprint is derived from the data mask.",
+        default="polygonize",
+        show_default=True,
+    )
+    @click.option(
+        "--concave-hull-ratio",
+        type=click.FloatRange(0, 1),
+        help=(
+            "With the concave_hull footprint mode, the concave hull ratio between "
+            "0 (most concave) and 1 (convex hull)."
+        ),
+        default=0.5,
+        show_default=True,
+    )
+    @click.option(
+        "--min-hole-area",
+        type=float,
+        help="With the outline footprint mode, fill holes smaller than this many "
+        "pixels.",
+    )
+    @click.option(
+        "--min-island-area",
+        type=float,
+        help="With the outline or concave_hull footprint modes, drop data regions "
+        "smaller than this many pixels.",
+    )
+    @click.option(
+        "--closing-size",
+        type=int,
+        help="With the outline or concave_hull footprint modes, the size, in "
+        "pixels, of a morphological closing of the data mask.",
+        default=0,
+        show_default=True,
+    )
+    @click.option(
+        "--outline-tolerance",
+        type=float,
+        help="With the outline or concave_hull footprint modes, simplify the "
+        "outline in the native CRS with this tolerance, in pixels.",
+    )
+    @click.option(
+        "--max-workers",
+        type=int,
+        help=(
+            "The maximum number of items to process concurrently. Defaults to the "
+            "executor's default."
+        ),
+    )
+    @click.option(
+        "--executor",
+        type=click.Choice(["thread", "process"], case_sensitive=False),
+        help="Process items concurrently in threads or in processes.",
+        default="thread",
+        show_default=True,
+    )
+    @click.option(
+        "--max-asset-workers",
+        type=int,
+        help="The maximum number of assets of an item to process concurrently.",
+    )
+    @click.option(
+        "--cache-dir",
+        help=(
+            "Directory of a footprint cache. Footprints of unchanged assets "
+            "computed with the same options are read from the cache instead of "
+            "the assets."
+        ),
+    )
+    @click.option(
+        "--cache-max-entries",
+        type=click.IntRange(min=1),
+        help="The maximum number of footprints in the cache.",
+    )
+    @click.option(
+        "--cache-max-bytes",
+        type=click.IntRange(min=1),
+        help=(
+            "The maximum total size, in bytes, of the footprints in the cache. "
+            "The least recently used footprints are evicted beyond this size, "
+            "or --cache-max-entries."
+        ),
+        default=DEFAULT_CACHE_MAX_BYTES,
+        show_default=True,
+    )
     @click.option(
         "-e",
         "--skip-errors",
@@ -79,36 +224,99 @@ def create_update_geometry_command(cli: Group) -> Command:
         show_default=True,
     )
     def update_geometry_command_raster_command(
-        item_path: str,
+        paths: List[str],
         asset_names: List[str],
         precision: int,
         densification_factor: Optional[int],
         densification_distance: Optional[float],
+        densification_tolerance: Optional[float],
         simplify_tolerance: Optional[float],
+        max_vertices: Optional[int],
         no_data: Optional[int],
         bands: str,
+        windowed: bool,
+        max_pixels: Optional[int],
+        max_error: Optional[float],
+        mask_source: str,
+        footprint_mode: str,
+        concave_hull_ratio: float,
+        min_hole_area: Optional[float],
+        min_island_area: Optional[float],
+        closing_size: int,
+        outline_tolerance: Optional[float],
+        max_workers: Optional[int],
+        executor: str,
+        max_asset_workers: Optional[int],
+        cache_dir: Optional[str],
+        cache_max_entries: Optional[int],
+        cache_max_bytes: int,
         skip_errors: bool,
     ) -> None:
-        item = Item.from_file(item_path)
+        """Update the geometry of the items at ITEM_PATH from the data footprints
+        of their assets.
+
+        Each ITEM_PATH can be an item, or a catalog or collection, in which case
+        all of its items are updated. Items are processed concurrently.
+        """
+        items: List[Item] = []
+        include_self_links: List[bool] = []
+        for path in paths:
+            stac_object = pystac.read_file(path)
+            if isinstance(stac_object, Item):
+                items.append(stac_object)
+                include_self_links.append(True)
+            elif isinstance(stac_object, pystac.Catalog):
+                catalog_items = list(stac_object.get_items(recursive=True))
+                items.extend(catalog_items)
+                include_self_links.extend(
+                    [stac_object.catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED]
+                    * len(catalog_items)
+                )
+            else:
+                raise click.BadArgumentUsage(
+                    f"{path} is not a STAC Item, Catalog, or Collection"
+                )
         if bands.lower() == "all":
             band_list = []
         else:
             band_list = list(int(band) for band in bands.split(","))
-        success = raster_footprint.RasterFootprint.update_geometry_from_asset_footprint(
-            item,
+        cache = None
+        if cache_dir:
+            cache = DirectoryFootprintCache(
+                cache_dir, max_entries=cache_max_entries, max_bytes=cache_max_bytes
+            )
+        results = raster_footprint.RasterFootprint.update_geometries(
+            items,
+            max_workers=max_workers,
+            executor=executor.lower(),
             asset_names=asset_names,
             precision=precision,
             densification_factor=densification_factor,
             densification_distance=densification_distance,
+            densification_tolerance=densification_tolerance,
             simplify_tolerance=simplify_tolerance,
+            max_vertices=max_vertices,
             no_data=no_data,
             bands=band_list,
+            windowed=windowed,
+            max_pixels=max_pixels,
+            max_error=max_error,
+            mask_source=raster_footprint.MaskSource[mask_source.upper()],
+            footprint_mode=raster_footprint.FootprintMode[footprint_mode.upper()],
+            concave_hull_ratio=concave_hull_ratio,
+            min_hole_area=min_hole_area,
+            min_island_area=min_island_area,
+            closing_size=closing_size,
+            outline_tolerance=outline_tolerance,
             skip_errors=skip_errors,
+            max_asset_workers=max_asset_workers,
+            cache=cache,
         )
-        if success:
-            item.save_object()
-            click.echo(f"Item geometry updated, saved to {item.get_self_href()}")
-        else:
-            click.echo("Unable to update geometry")
+        for item, include_self_link, success in zip(items, include_self_links, results):
+            if success:
+                item.save_object(include_self_link=include_self_link)
+                click.echo(f"Item geometry updated, saved to {item.get_self_href()}")
+            else:
+                click.echo(f"Unable to update geometry for {item.get_self_href()}")
 
     return update_geometry_command_raster_command
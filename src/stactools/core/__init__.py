@@ -1,6 +1,10 @@
 from stactools.core.add import add_item
 from stactools.core.add_asset import add_asset, add_asset_to_item
-from stactools.core.add_raster import add_raster_to_item
+from stactools.core.add_raster import (
+    add_raster_to_catalog,
+    add_raster_to_item,
+    add_raster_to_items,
+)
 from stactools.core.copy import (
     copy_catalog,
     move_all_assets,
@@ -17,7 +21,9 @@ __all__ = [
     "add_item",
     "add_asset",
     "add_asset_to_item",
+    "add_raster_to_catalog",
     "add_raster_to_item",
+    "add_raster_to_items",
     "copy_catalog",
     "layout_catalog",
     "merge_all_items",
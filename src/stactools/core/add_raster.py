@@ -1,9 +1,26 @@
+import functools
+import hashlib
+import json
 import logging
-from typing import List
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import numpy
+import numpy.typing as npt
 import rasterio
-from pystac import Item
+from pystac import Catalog, Item
 from pystac.extensions.raster import (
     DataType,
     Histogram,
@@ -12,67 +29,587 @@ from pystac.extensions.raster import (
     Statistics,
 )
 from pystac.utils import make_absolute_href
+from rasterio.io import DatasetReader
+from rasterio.windows import Window
+
+from .utils import file_identity
 
 logger = logging.getLogger(__name__)
 
 BINS = 256
 
+# Bands are read in windows of about this many pixels to bound memory use
+MAX_WINDOW_PIXELS = 1 << 22
+
+# Default pixel budget per band for approximate statistics
+APPROXIMATE_MAX_PIXELS = 1 << 20
+
 
 def add_raster_to_item(
-    item: Item, statistics: bool = True, histogram: bool = True
+    item: Item,
+    statistics: bool = True,
+    histogram: bool = True,
+    approximate: bool = False,
+    max_pixels: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
 ) -> Item:
     """Adds the raster extension to an item.
 
     Args:
         item (Item): The PySTAC Item to extend.
-        statistics (bool): Compute band statistics (min/max). Defaults to True
+        statistics (bool): Compute band statistics (min/max/mean/stddev/valid
+            percent). Defaults to True
         histogram (bool): Compute band histogram. Defaults to True
+        approximate (bool): Compute approximate statistics and histograms.
+            Band minimums and maximums are taken from existing GDAL
+            ``STATISTICS_*`` metadata (e.g. from an ``.aux.xml`` file) when
+            present, and pixel values are read from the finest overview, or
+            decimated read, with at most ``max_pixels`` pixels. Defaults to
+            False
+        max_pixels (Optional[int]): The maximum number of pixels read per band
+            when ``approximate`` is set. Setting it implies ``approximate``.
+            Defaults to ``APPROXIMATE_MAX_PIXELS``
+        max_workers (Optional[int]): The maximum number of assets, or bands
+            with the ``"thread"`` executor, to process concurrently. If not
+            set, assets and bands are processed one at a time.
+        executor (str): Either ``"thread"`` (the default) or ``"process"``.
+            GDAL releases the GIL while reading, so threads, which process each
+            band separately, are usually enough. Processes handle one asset at
+            a time. Only used if ``max_workers`` is set.
 
     Returns:
         Item:
             Returns an updated Item.
             This operation mutates the Item.
     """
+    if approximate and max_pixels is None:
+        max_pixels = APPROXIMATE_MAX_PIXELS
+    if max_workers is not None:
+        _add_raster_to_items(
+            [item], statistics, histogram, max_pixels, max_workers, executor
+        )
+        return item
     RasterExtension.add_to(item)
     for asset in item.assets.values():
         if asset.roles and "data" in asset.roles:
             raster = RasterExtension.ext(asset)
             href = make_absolute_href(asset.href, item.get_self_href())
-            bands = _read_bands(href, statistics, histogram)
+            bands = _read_bands(href, statistics, histogram, max_pixels)
             if bands:
                 raster.apply(bands)
     return item
 
 
-def _read_bands(href: str, statistics: bool, histogram: bool) -> List[RasterBand]:
-    bands = []
-    with rasterio.open(href) as dataset:
-        for i, index in enumerate(dataset.indexes):
-            band = RasterBand.create()
-            band.nodata = dataset.nodatavals[i]
-            band.spatial_resolution = dataset.transform[0]
-            band.data_type = DataType(dataset.dtypes[i])
-
-            if statistics or histogram:
-                data = dataset.read(index, masked=True)
-                minimum = float(numpy.nanmin(data))
-                maximum = float(numpy.nanmax(data))
-            if statistics:
-                band.statistics = Statistics.create(minimum=minimum, maximum=maximum)
-            if histogram:
-                # the entire array is masked, or all values are NAN.
-                # won't be able to compute histogram and will return empty array.
-                if numpy.isnan(minimum):
-                    band.histogram = Histogram.create(0, minimum, maximum, [])
-                else:
-                    hist_data, _ = numpy.histogram(
-                        data, range=(minimum, maximum), bins=BINS
-                    )
-                    band.histogram = Histogram.create(
-                        BINS,
-                        minimum,
-                        maximum,
-                        hist_data.tolist(),  # type: ignore
+def add_raster_to_catalog(
+    catalog: Catalog,
+    statistics: bool = True,
+    histogram: bool = True,
+    approximate: bool = False,
+    max_pixels: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
+) -> List[Item]:
+    """Adds the raster extension to all items of a catalog, processing the
+    assets, or bands, of all items concurrently.
+
+    See :func:`add_raster_to_item` for a description of the arguments.
+
+    Args:
+        catalog (Catalog): The PySTAC Catalog or Collection whose items, at any
+            depth, are extended.
+        statistics (bool): Compute band statistics. Defaults to True
+        histogram (bool): Compute band histogram. Defaults to True
+        approximate (bool): Compute approximate statistics and histograms.
+            Defaults to False
+        max_pixels (Optional[int]): The maximum number of pixels read per band
+            for approximate statistics.
+        max_workers (Optional[int]): The maximum number of assets, or bands, to
+            process concurrently. Defaults to the executor's default.
+        executor (str): Either ``"thread"`` (the default) or ``"process"``.
+
+    Returns:
+        List[Item]: The updated Items. This operation mutates the Items, which
+        are not saved.
+    """
+    return add_raster_to_items(
+        catalog.get_items(recursive=True),
+        statistics=statistics,
+        histogram=histogram,
+        approximate=approximate,
+        max_pixels=max_pixels,
+        max_workers=max_workers,
+        executor=executor,
+    )
+
+
+def add_raster_to_items(
+    items: Iterable[Item],
+    statistics: bool = True,
+    histogram: bool = True,
+    approximate: bool = False,
+    max_pixels: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
+) -> List[Item]:
+    """Adds the raster extension to many items, processing the assets, or
+    bands, of all items concurrently.
+
+    See :func:`add_raster_to_item` for a description of the arguments.
+
+    Args:
+        items (Iterable[Item]): The PySTAC Items to extend.
+        statistics (bool): Compute band statistics. Defaults to True
+        histogram (bool): Compute band histogram. Defaults to True
+        approximate (bool): Compute approximate statistics and histograms.
+            Defaults to False
+        max_pixels (Optional[int]): The maximum number of pixels read per band
+            for approximate statistics.
+        max_workers (Optional[int]): The maximum number of assets, or bands, to
+            process concurrently. Defaults to the executor's default.
+        executor (str): Either ``"thread"`` (the default) or ``"process"``.
+
+    Returns:
+        List[Item]: The updated Items. This operation mutates the Items, which
+        are not saved.
+    """
+    if approximate and max_pixels is None:
+        max_pixels = APPROXIMATE_MAX_PIXELS
+    items = list(items)
+    _add_raster_to_items(
+        items, statistics, histogram, max_pixels, max_workers, executor
+    )
+    return items
+
+
+def raster_fingerprint(
+    item: Item,
+    statistics: bool = True,
+    histogram: bool = True,
+    approximate: bool = False,
+    max_pixels: Optional[int] = None,
+) -> str:
+    """Returns a fingerprint of the inputs of :func:`add_raster_to_item`.
+
+    The fingerprint combines the content identity of each data asset, as
+    returned by :func:`stactools.core.utils.file_identity`, with the
+    arguments. It changes when an asset changes, without reading any pixels,
+    so it can be stored to skip items whose raster bands are up to date.
+
+    Args:
+        item (Item): The PySTAC Item.
+        statistics (bool): Compute band statistics. Defaults to True
+        histogram (bool): Compute band histogram. Defaults to True
+        approximate (bool): Compute approximate statistics and histograms.
+            Defaults to False
+        max_pixels (Optional[int]): The maximum number of pixels read per band
+            for approximate statistics.
+
+    Returns:
+        str: The hex SHA-256 digest of the fingerprint.
+    """
+    if approximate and max_pixels is None:
+        max_pixels = APPROXIMATE_MAX_PIXELS
+    assets = {
+        key: file_identity(make_absolute_href(asset.href, item.get_self_href()))
+        for key, asset in item.assets.items()
+        if asset.roles and "data" in asset.roles
+    }
+    fingerprint = {
+        "assets": assets,
+        "statistics": statistics,
+        "histogram": histogram,
+        "max_pixels": max_pixels,
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+def _add_raster_to_items(
+    items: List[Item],
+    statistics: bool,
+    histogram: bool,
+    max_pixels: Optional[int],
+    max_workers: Optional[int],
+    executor: str,
+) -> None:
+    assets = []
+    for item in items:
+        RasterExtension.add_to(item)
+        for asset in item.assets.values():
+            if asset.roles and "data" in asset.roles:
+                assets.append(
+                    (asset, make_absolute_href(asset.href, item.get_self_href()))
+                )
+    hrefs = [href for _, href in assets]
+
+    if executor == "thread":
+        datasets = _DatasetCache()
+
+        def read_band(href: str, index: int) -> RasterBand:
+            try:
+                return _read_band(
+                    datasets.open(href), index, statistics, histogram, max_pixels
+                )
+            finally:
+                datasets.release(href)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as threads:
+                indexes = list(threads.map(_band_indexes, hrefs))
+                futures = []
+                for href, asset_indexes in zip(hrefs, indexes):
+                    datasets.acquire(href, len(asset_indexes))
+                    futures.append(
+                        [
+                            threads.submit(read_band, href, index)
+                            for index in asset_indexes
+                        ]
                     )
-            bands.append(band)
-    return bands
+                asset_bands = [
+                    [future.result() for future in asset_futures]
+                    for asset_futures in futures
+                ]
+        finally:
+            datasets.close()
+    elif executor == "process":
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            asset_bands = list(
+                pool.map(
+                    functools.partial(
+                        _read_bands,
+                        statistics=statistics,
+                        histogram=histogram,
+                        max_pixels=max_pixels,
+                    ),
+                    hrefs,
+                )
+            )
+    else:
+        raise ValueError(
+            f"Unrecognized executor: {executor!r}, expected 'thread' or 'process'"
+        )
+
+    for (asset, _), bands in zip(assets, asset_bands):
+        if bands:
+            RasterExtension.ext(asset).apply(bands)
+
+
+class _DatasetCache:
+    """Opens each dataset once per thread, because rasterio datasets must not
+    be shared between threads.
+
+    Each href is acquired once per read before the reads start, and released
+    after each read. The datasets of an href are closed when it is no longer
+    acquired, so only the datasets of the assets being read stay open.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._datasets: Dict[str, List[DatasetReader]] = {}
+        self._references: Dict[str, int] = {}
+
+    def acquire(self, href: str, count: int = 1) -> None:
+        with self._lock:
+            self._references[href] = self._references.get(href, 0) + count
+
+    def open(self, href: str) -> DatasetReader:
+        datasets: Optional[Dict[str, DatasetReader]] = getattr(
+            self._local, "datasets", None
+        )
+        if datasets is None:
+            datasets = self._local.datasets = {}
+        dataset = datasets.get(href)
+        if dataset is None or dataset.closed:
+            for key in [key for key, value in datasets.items() if value.closed]:
+                del datasets[key]
+            dataset = datasets[href] = rasterio.open(href)
+            with self._lock:
+                self._datasets.setdefault(href, []).append(dataset)
+        return dataset
+
+    def release(self, href: str) -> None:
+        with self._lock:
+            self._references[href] -= 1
+            if self._references[href]:
+                return
+            del self._references[href]
+            datasets = self._datasets.pop(href, [])
+        for dataset in datasets:
+            dataset.close()
+
+    def close(self) -> None:
+        with self._lock:
+            datasets = [
+                dataset for values in self._datasets.values() for dataset in values
+            ]
+            self._datasets.clear()
+            self._references.clear()
+        for dataset in datasets:
+            dataset.close()
+
+
+def _band_indexes(href: str) -> List[int]:
+    with rasterio.open(href) as dataset:
+        return list(dataset.indexes)
+
+
+def _read_bands(
+    href: str, statistics: bool, histogram: bool, max_pixels: Optional[int] = None
+) -> List[RasterBand]:
+    with rasterio.open(href) as dataset:
+        return [
+            _read_band(dataset, index, statistics, histogram, max_pixels)
+            for index in dataset.indexes
+        ]
+
+
+def _read_band(
+    dataset: DatasetReader,
+    index: int,
+    statistics: bool,
+    histogram: bool,
+    max_pixels: Optional[int],
+) -> RasterBand:
+    i = index - 1
+    band = RasterBand.create()
+    band.nodata = dataset.nodatavals[i]
+    band.spatial_resolution = dataset.transform[0]
+    band.data_type = DataType(dataset.dtypes[i])
+
+    if statistics or histogram:
+        if max_pixels is None:
+            band_statistics = _band_statistics(
+                lambda: _valid_values(dataset, index),
+                dataset.dtypes[i],
+                dataset.width * dataset.height,
+                histogram,
+            )
+        else:
+            band_statistics = _approximate_band_statistics(
+                dataset, index, histogram, max_pixels
+            )
+        minimum = band_statistics.minimum
+        maximum = band_statistics.maximum
+    if statistics:
+        band.statistics = Statistics.create(
+            minimum=minimum,
+            maximum=maximum,
+            mean=band_statistics.mean,
+            stddev=band_statistics.stddev,
+            valid_percent=band_statistics.valid_percent,
+        )
+    if histogram:
+        # the entire array is masked, or all values are NAN.
+        # won't be able to compute histogram and will return empty array.
+        if numpy.isnan(minimum):
+            band.histogram = Histogram.create(0, minimum, maximum, [])
+        else:
+            assert band_statistics.histogram is not None
+            band.histogram = Histogram.create(
+                BINS,
+                minimum,
+                maximum,
+                band_statistics.histogram.tolist(),
+            )
+    return band
+
+
+class _BandStatistics(NamedTuple):
+    minimum: float
+    maximum: float
+    mean: Optional[float]
+    stddev: Optional[float]
+    valid_percent: Optional[float]
+    histogram: Optional[npt.NDArray[numpy.int64]]
+
+
+class _Moments:
+    """Streaming count, mean, and sum of squared deviations of values, merged
+    one chunk at a time with the parallel algorithm of Chan et al., which is
+    numerically stable for large counts."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: npt.NDArray[Any]) -> None:
+        count = len(values)
+        if not count:
+            return
+        mean = float(values.mean(dtype=numpy.float64))
+        m2 = float(numpy.square(values - mean, dtype=numpy.float64).sum())
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.m2 / self.count)
+
+
+def _band_statistics(
+    read_values: Callable[[], Iterable[npt.NDArray[Any]]],
+    dtype: str,
+    total: int,
+    histogram: bool,
+    value_range: Optional[Tuple[float, float]] = None,
+) -> _BandStatistics:
+    """Computes the statistics, and optionally the histogram, of the valid
+    values of a band, from the chunks of values returned by ``read_values``.
+
+    Integer bands of at most 16 bits are read once: the count of each possible
+    value is accumulated, and the statistics and histogram are computed exactly
+    from the counts. Other bands are read twice, once for the range and the
+    moments, and once for the histogram. If ``value_range`` is given, it is
+    used as the minimum and maximum instead of the range of the values.
+    ``total`` is the number of pixels, valid or not, in the chunks.
+    """
+    data_type = numpy.dtype(dtype)
+    if data_type.kind in "iu" and data_type.itemsize <= 2:
+        offset = int(numpy.iinfo(data_type).min)
+        value_counts = numpy.zeros(1 << (8 * data_type.itemsize), dtype=numpy.int64)
+        for values in read_values():
+            value_counts += numpy.bincount(
+                values.astype(numpy.intp) - offset, minlength=len(value_counts)
+            )
+        (present,) = numpy.nonzero(value_counts)
+        if not len(present):
+            return _BandStatistics(numpy.nan, numpy.nan, None, None, 0.0, None)
+        if value_range is not None:
+            minimum, maximum = value_range
+        else:
+            minimum = float(present[0] + offset)
+            maximum = float(present[-1] + offset)
+        present_values = (present + offset).astype(numpy.float64)
+        present_counts = value_counts[present]
+        count = int(present_counts.sum())
+        mean = float((present_values * present_counts).sum() / count)
+        variance = float(
+            (numpy.square(present_values - mean) * present_counts).sum() / count
+        )
+        counts = None
+        if histogram:
+            weighted, _ = numpy.histogram(
+                present_values,
+                bins=BINS,
+                range=(minimum, maximum),
+                weights=present_counts,
+            )
+            counts = weighted.astype(numpy.int64)
+        return _BandStatistics(
+            minimum,
+            maximum,
+            mean,
+            math.sqrt(variance),
+            100 * count / total,
+            counts,
+        )
+
+    moments = _Moments()
+    if value_range is None:
+        minimum = maximum = numpy.nan
+        for values in read_values():
+            if len(values):
+                minimum = numpy.fmin(minimum, values.min())
+                maximum = numpy.fmax(maximum, values.max())
+                moments.update(values)
+    else:
+        minimum, maximum = value_range
+    counts = None
+    if histogram and not numpy.isnan(minimum):
+        counts = numpy.zeros(BINS, dtype=numpy.int64)
+        for values in read_values():
+            window_counts, _ = numpy.histogram(
+                values, bins=BINS, range=(minimum, maximum)
+            )
+            counts += window_counts
+            if value_range is not None:
+                moments.update(values)
+    elif value_range is not None:
+        for values in read_values():
+            moments.update(values)
+    if not moments.count:
+        return _BandStatistics(float(minimum), float(maximum), None, None, 0.0, None)
+    return _BandStatistics(
+        float(minimum),
+        float(maximum),
+        moments.mean,
+        moments.stddev,
+        100 * moments.count / total,
+        counts,
+    )
+
+
+def _approximate_band_statistics(
+    dataset: DatasetReader, index: int, histogram: bool, max_pixels: int
+) -> _BandStatistics:
+    """Computes approximate band statistics, reusing GDAL statistics metadata
+    when present and reading at most ``max_pixels`` pixels otherwise."""
+    tags = dataset.tags(index)
+    value_range = None
+    if "STATISTICS_MINIMUM" in tags and "STATISTICS_MAXIMUM" in tags:
+        value_range = (
+            float(tags["STATISTICS_MINIMUM"]),
+            float(tags["STATISTICS_MAXIMUM"]),
+        )
+        if not histogram and "STATISTICS_MEAN" in tags and "STATISTICS_STDDEV" in tags:
+            valid_percent = tags.get("STATISTICS_VALID_PERCENT")
+            return _BandStatistics(
+                value_range[0],
+                value_range[1],
+                float(tags["STATISTICS_MEAN"]),
+                float(tags["STATISTICS_STDDEV"]),
+                None if valid_percent is None else float(valid_percent),
+                None,
+            )
+
+    factor = _overview_factor(dataset, index, max_pixels)
+    out_shape = (
+        math.ceil(dataset.height / factor),
+        math.ceil(dataset.width / factor),
+    )
+    data = dataset.read(index, out_shape=out_shape, masked=True)
+    values = _compress(data)
+    return _band_statistics(
+        lambda: [values],
+        dataset.dtypes[index - 1],
+        data.size,
+        histogram,
+        value_range,
+    )
+
+
+def _overview_factor(dataset: DatasetReader, index: int, max_pixels: int) -> int:
+    """Returns the smallest decimation factor, preferring overview levels, for
+    which a band has at most ``max_pixels`` pixels."""
+    for factor in [1, *sorted(dataset.overviews(index))]:
+        if (
+            math.ceil(dataset.height / factor) * math.ceil(dataset.width / factor)
+            <= max_pixels
+        ):
+            return int(factor)
+    return max(math.ceil(math.sqrt(dataset.height * dataset.width / max_pixels)), 1)
+
+
+def _valid_values(dataset: DatasetReader, index: int) -> Iterator[npt.NDArray[Any]]:
+    """Yields the valid (unmasked and not NaN) values of a band, one window of
+    at most about ``MAX_WINDOW_PIXELS`` pixels at a time.
+
+    Windows span whole rows of blocks, so that each block is read only once.
+    """
+    block_height, _ = dataset.block_shapes[index - 1]
+    rows = max(MAX_WINDOW_PIXELS // dataset.width // block_height, 1) * block_height
+    for row in range(0, dataset.height, rows):
+        window = Window(0, row, dataset.width, min(rows, dataset.height - row))
+        yield _compress(dataset.read(index, window=window, masked=True))
+
+
+def _compress(data: numpy.ma.MaskedArray) -> npt.NDArray[Any]:
+    values: npt.NDArray[Any] = data.compressed()
+    if values.dtype.kind == "f":
+        values = values[~numpy.isnan(values)]
+    return values
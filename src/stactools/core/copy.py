@@ -1,16 +1,121 @@
+import json
 import logging
 import os
+import shutil
+import time
 import warnings
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+    overload,
+)
 
-import fsspec
 from fsspec.core import split_protocol
-from fsspec.registry import get_filesystem_class
+from fsspec.spec import AbstractFileSystem
 from pystac import Catalog, CatalogType, Collection, Item
 from pystac.utils import is_absolute_href, make_absolute_href, make_relative_href
 
+from .utils import file_checksum
+from .utils.filesystem import filesystem_registry, get_filesystem
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+U = TypeVar("U")
+
+# The number of times a failed transfer is retried
+DEFAULT_TRANSFER_RETRIES = 3
+
+# Seconds to wait before retrying a failed transfer, doubled for each retry
+RETRY_BACKOFF = 1.0
+
+# Seconds between progress reports while executing transfers
+PROGRESS_INTERVAL = 10.0
+
+# Bytes read and written at a time when streaming a file between filesystems
+DEFAULT_COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Keys of fsspec's info that hold a content hash, like S3's ETag
+_HASH_INFO_KEYS = ("ETag", "etag", "md5Hash")
+
+# Keys of fsspec's info that hold a modification time
+_MTIME_INFO_KEYS = ("mtime", "LastModified", "last_modified", "updated")
+
+# Protocols of local file paths
+_LOCAL_PROTOCOLS = (None, "file", "local")
+
+# Errors that retrying a transfer cannot fix
+_PERMANENT_ERRORS = (
+    FileExistsError,
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+)
+
+
+class AssetTransfer(NamedTuple):
+    """A planned move or copy of an asset file."""
+
+    source: str
+    """The absolute href of the asset file."""
+
+    destination: str
+    """The absolute href the asset file is moved or copied to."""
+
+    op: str
+    """Either ``"copy"`` or ``"move"``."""
+
+    size: Optional[int] = None
+    """The size of the asset file in bytes, if known."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns this transfer as a manifest entry."""
+        return {
+            "source": self.source,
+            "destination": self.destination,
+            "size": self.size,
+            "op": self.op,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "AssetTransfer":
+        """Creates a transfer from a manifest entry."""
+        return cls(d["source"], d["destination"], d["op"], d.get("size"))
+
+
+class TransferReport(NamedTuple):
+    """A summary of executed asset transfers."""
+
+    files: int
+    """The number of asset files moved or copied."""
+
+    skipped: int
+    """The number of transfers skipped because the destination existed."""
+
+    bytes: int
+    """The number of bytes copied. Moves within a filesystem copy no bytes."""
+
+    seconds: float
+    """The time taken, in seconds."""
+
+    @property
+    def throughput(self) -> float:
+        """The number of bytes copied per second."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
 
 def move_asset_file(
     owner: Union[Item, Collection],
@@ -18,9 +123,14 @@ def move_asset_file(
     asset_subdirectory: Optional[str] = None,
     copy: bool = False,
     ignore_conflicts: bool = False,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
 ) -> str:
     """Moves an asset file to be alongside its owner.
 
+    Files are copied without reading them into memory: local files with the
+    operating system's zero-copy calls, files on the same filesystem with its
+    server-side copy, and other files are streamed in ``buffer_size`` chunks.
+
     Args:
         owner (Item or Collection):
             The PySTAC Item or Collection to perform the asset transformation on.
@@ -35,90 +145,18 @@ def move_asset_file(
         ignore_conflicts (bool):
             If the asset destination file already exists, this function will
             throw an error unless ignore_conflicts is True.
+        buffer_size (int): The number of bytes read and written at a time when
+            streaming the file between filesystems.
 
     Returns:
         str: The new absolute href for the asset file.
     """
-    owner_href = owner.get_self_href()
-    if owner_href is None:
-        raise ValueError(
-            f"Self HREF is not available for {owner}. This operation "
-            "requires that the HREFs are available."
+    transfer = _plan_transfer(owner, asset_href, asset_subdirectory, copy)
+    if transfer.source != transfer.destination:
+        execute_transfers(
+            [transfer], ignore_conflicts=ignore_conflicts, buffer_size=buffer_size
         )
-
-    # TODO this shouldn't have to be absolute
-    if not is_absolute_href(asset_href):
-        raise ValueError("asset_href must be absolute.")
-
-    owner_dir = os.path.dirname(owner_href)
-
-    fname = os.path.basename(asset_href)
-    if asset_subdirectory is None:
-        target_dir = owner_dir
-    else:
-        target_dir = os.path.join(owner_dir, asset_subdirectory)
-    new_asset_href = os.path.join(target_dir, fname)
-
-    if asset_href != new_asset_href:
-        dest_protocol = split_protocol(new_asset_href)[0]
-        fs_dest = get_filesystem_class(dest_protocol)()
-        op = None
-
-        if fs_dest.exists(new_asset_href):
-            if not ignore_conflicts:
-                raise FileExistsError("{} already exists".format(new_asset_href))
-        else:
-            if copy:
-
-                def _op1(dry_run: bool = False) -> None:
-                    logger.info(
-                        "Copying {} to {}...".format(asset_href, new_asset_href)
-                    )
-                    if not dry_run:
-                        fs_dest.makedirs(os.path.dirname(new_asset_href), exist_ok=True)
-                        with fsspec.open(asset_href, "rb") as f_src:
-                            with fsspec.open(new_asset_href, "wb") as f_dst:
-                                f_dst.write(f_src.read())
-
-                op = _op1
-            else:
-                source_protocol = split_protocol(asset_href)[0]
-
-                if source_protocol == dest_protocol:
-
-                    def _op2(dry_run: bool = False) -> None:
-                        logger.info(
-                            "Moving {} to {}...".format(asset_href, new_asset_href)
-                        )
-                        if not dry_run:
-                            fs_dest.makedirs(
-                                os.path.dirname(new_asset_href), exist_ok=True
-                            )
-                            fs_dest.move(asset_href, new_asset_href)
-
-                    op = _op2
-                else:
-
-                    def _op3(dry_run: bool = False) -> None:
-                        logger.info(
-                            "Moving {} to {}...".format(asset_href, new_asset_href)
-                        )
-                        if not dry_run:
-                            fs_source = get_filesystem_class(source_protocol)()
-                            fs_dest.makedirs(
-                                os.path.dirname(new_asset_href), exist_ok=True
-                            )
-                            with fsspec.open(asset_href, "rb") as f_src:
-                                with fsspec.open(new_asset_href, "wb") as f_dst:
-                                    f_dst.write(f_src.read())
-                            fs_source.delete(asset_href)
-
-                    op = _op3
-
-        if op is not None:
-            op(dry_run=False)
-
-    return new_asset_href
+    return transfer.destination
 
 
 def move_asset_file_to_item(
@@ -196,34 +234,44 @@ def move_assets(
     if owner is None:
         raise TypeError("move_assets missing 1 required positional argument: 'owner'")
 
-    owner_href = owner.get_self_href()
-    if owner_href is None:
-        raise ValueError(
-            f"Self HREF is not available for {owner}. This operation "
-            "requires that HREFs are available."
-        )
+    transfers = _plan_owner_transfers(
+        owner, asset_subdirectory, make_hrefs_relative, copy
+    )
+    execute_transfers(transfers, ignore_conflicts=ignore_conflicts)
+    return owner
 
-    for asset in owner.assets.values():
-        abs_asset_href = asset.get_absolute_href()
-        if abs_asset_href is None:
-            raise ValueError(
-                f"Asset {asset.title} HREF is not available for {owner}. "
-                "This operation requires that the Asset HREFs are available."
-            )
-        new_asset_href = move_asset_file(
-            owner,
-            abs_asset_href,
-            asset_subdirectory=asset_subdirectory,
-            copy=copy,
-            ignore_conflicts=ignore_conflicts,
-        )
 
-        if make_hrefs_relative:
-            asset.href = make_relative_href(new_asset_href, owner_href)
-        else:
-            asset.href = new_asset_href
+@overload
+def move_all_assets(
+    catalog: Catalog,
+    asset_subdirectory: Optional[str] = None,
+    make_hrefs_relative: bool = True,
+    copy: bool = False,
+    ignore_conflicts: bool = False,
+    max_workers: Optional[int] = None,
+    retries: int = DEFAULT_TRANSFER_RETRIES,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+    sync: bool = False,
+    checksum: bool = False,
+    plan_only: Literal[False] = False,
+) -> Catalog: ...
 
-    return owner
+
+@overload
+def move_all_assets(
+    catalog: Catalog,
+    asset_subdirectory: Optional[str] = None,
+    make_hrefs_relative: bool = True,
+    copy: bool = False,
+    ignore_conflicts: bool = False,
+    max_workers: Optional[int] = None,
+    retries: int = DEFAULT_TRANSFER_RETRIES,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+    sync: bool = False,
+    checksum: bool = False,
+    *,
+    plan_only: Literal[True],
+) -> List[AssetTransfer]: ...
 
 
 def move_all_assets(
@@ -232,9 +280,21 @@ def move_all_assets(
     make_hrefs_relative: bool = True,
     copy: bool = False,
     ignore_conflicts: bool = False,
-) -> Catalog:
+    max_workers: Optional[int] = None,
+    retries: int = DEFAULT_TRANSFER_RETRIES,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+    sync: bool = False,
+    checksum: bool = False,
+    plan_only: bool = False,
+) -> Union[Catalog, List[AssetTransfer]]:
     """Moves assets in a catalog to be alongside the item or collections that own them.
 
+    All transfers are planned first, updating the asset HREFs, and then
+    executed by :func:`execute_transfers`. With ``plan_only``, the planned
+    transfers are returned instead of executed, e.g. to be written to a
+    manifest with :func:`write_transfer_manifest`, split across machines, and
+    executed later.
+
     Args:
         catalog (Catalog or Collection):
             The PySTAC Catalog or Collection to perform the asset transformation
@@ -252,26 +312,502 @@ def move_all_assets(
         ignore_conflicts (bool):
             If the asset destination file already exists, this function will
             throw an error unless ignore_conflicts is True.
+        max_workers (Optional[int]): The maximum number of asset files to
+            transfer concurrently. If not set, files are transferred one at a
+            time.
+        retries (int): The number of times a failed transfer is retried.
+        buffer_size (int): The number of bytes read and written at a time when
+            streaming a file between filesystems.
+        sync (bool): If True, only transfer asset files whose destination is
+            missing or differs from the source. See :func:`execute_transfers`.
+        checksum (bool): If True, sync compares file checksums instead of
+            ETags and modification times.
+        plan_only (bool): If True, only plan the transfers, including the
+            size of each asset file, without moving or copying any file.
+            The asset HREFs are still updated.
 
     Returns:
         Catalog or Collection:
             Returns the updated catalog or collection.  This operation mutates
             the catalog or collection.
+        List[AssetTransfer]:
+            With ``plan_only``, returns the planned transfers instead.
     """
-
+    transfers: List[AssetTransfer] = []
     for item in catalog.get_items(recursive=True):
-        move_assets(
-            item, asset_subdirectory, make_hrefs_relative, copy, ignore_conflicts
+        transfers.extend(
+            _plan_owner_transfers(item, asset_subdirectory, make_hrefs_relative, copy)
         )
-
     for collection in catalog.get_all_collections():
-        move_assets(
-            collection, asset_subdirectory, make_hrefs_relative, copy, ignore_conflicts
+        transfers.extend(
+            _plan_owner_transfers(
+                collection, asset_subdirectory, make_hrefs_relative, copy
+            )
         )
 
+    if plan_only:
+        transfers = list(
+            dict.fromkeys(
+                transfer
+                for transfer in transfers
+                if transfer.source != transfer.destination
+            )
+        )
+        return _ordered_map(_with_size, transfers, max_workers)
+
+    execute_transfers(
+        transfers,
+        ignore_conflicts=ignore_conflicts,
+        max_workers=max_workers,
+        retries=retries,
+        buffer_size=buffer_size,
+        sync=sync,
+        checksum=checksum,
+    )
     return catalog
 
 
+def write_transfer_manifest(transfers: Iterable[AssetTransfer], href: str) -> None:
+    """Writes asset transfers to a JSON lines manifest.
+
+    Each line is a JSON object with the ``source``, ``destination``, ``size``,
+    and ``op`` of a transfer, so manifests can be inspected and split with
+    standard line-based tools.
+
+    Args:
+        transfers (Iterable[AssetTransfer]): The transfers to write.
+        href (str): The href of the manifest.
+    """
+    fs, path = get_filesystem(href)
+    fs.makedirs(fs._parent(path), exist_ok=True)
+    with fs.open(path, "w") as f:
+        for transfer in transfers:
+            f.write(json.dumps(transfer.to_dict()) + "\n")
+
+
+def read_transfer_manifest(href: str) -> List[AssetTransfer]:
+    """Reads asset transfers from a JSON lines manifest.
+
+    Args:
+        href (str): The href of the manifest written by
+            :func:`write_transfer_manifest`, or any subset of its lines.
+
+    Returns:
+        List[AssetTransfer]: The transfers.
+    """
+    fs, path = get_filesystem(href)
+    with fs.open(path, "r") as f:
+        return [AssetTransfer.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def execute_transfers(
+    transfers: Iterable[AssetTransfer],
+    ignore_conflicts: bool = False,
+    max_workers: Optional[int] = None,
+    retries: int = DEFAULT_TRANSFER_RETRIES,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+    resume: bool = False,
+    sync: bool = False,
+    checksum: bool = False,
+) -> TransferReport:
+    """Executes planned asset transfers.
+
+    Each destination directory is created once, before any file is
+    transferred. Failed transfers are retried with an exponential backoff,
+    unless the error is permanent, e.g. a missing source file. Progress and
+    throughput are logged every ``PROGRESS_INTERVAL`` seconds.
+
+    Args:
+        transfers (Iterable[AssetTransfer]): The transfers to execute. Repeated
+            transfers are executed once.
+        ignore_conflicts (bool):
+            If an asset destination file already exists, or two transfers have
+            the same destination, this function will throw an error unless
+            ignore_conflicts is True, in which case the transfer is skipped.
+        max_workers (Optional[int]): The maximum number of asset files to
+            transfer concurrently. If not set, files are transferred one at a
+            time.
+        retries (int): The number of times a failed transfer is retried.
+        buffer_size (int): The number of bytes read and written at a time when
+            streaming a file between filesystems.
+        resume (bool): If True, transfers whose destination already exists
+            with the planned size are treated as done and skipped, and
+            destinations with another size, left by an interrupted transfer,
+            are overwritten. Transfers without a planned size are not resumed.
+            The source of a resumed move is only deleted if the destination
+            also passes the ``sync`` comparison, otherwise it is kept.
+        sync (bool): If True, existing destinations are compared with their
+            source, like rsync, and only transferred again if they changed: if
+            their sizes differ, else if their ETags (or other content hashes)
+            differ, else if the source was modified after the destination.
+            Takes precedence over ``ignore_conflicts`` and ``resume``.
+        checksum (bool): If True, sync compares the SHA-256 checksums of the
+            source and destination, which requires reading both, instead of
+            their ETags and modification times.
+
+    Returns:
+        TransferReport: A summary of the executed transfers.
+    """
+    start = time.monotonic()
+    planned: Dict[str, AssetTransfer] = {}
+    for transfer in transfers:
+        if transfer.source == transfer.destination:
+            continue
+        existing = planned.setdefault(transfer.destination, transfer)
+        if existing.source != transfer.source and not ignore_conflicts:
+            raise FileExistsError(
+                f"{existing.source} and {transfer.source} are both transferred "
+                f"to {transfer.destination}"
+            )
+
+    directories: Set[str] = {
+        os.path.dirname(transfer.destination) for transfer in planned.values()
+    }
+    for _ in _map(_makedirs, directories, max_workers):
+        pass
+
+    def execute(transfer: AssetTransfer) -> Optional[int]:
+        # The destination is only checked once, so a retry doesn't mistake a
+        # file written by a failed attempt for a conflict
+        needed = _retry(
+            lambda: _needs_transfer(transfer, ignore_conflicts, resume, sync, checksum),
+            retries,
+            transfer,
+        )
+        if not needed:
+            return None
+        return _retry(
+            lambda: _execute_transfer(transfer, buffer_size), retries, transfer
+        )
+
+    files = skipped = copied = 0
+    last_report = start
+    for size in _map(execute, planned.values(), max_workers):
+        if size is None:
+            skipped += 1
+        else:
+            files += 1
+            copied += size
+        now = time.monotonic()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            _log_progress(
+                TransferReport(files, skipped, copied, now - start), len(planned)
+            )
+
+    report = TransferReport(files, skipped, copied, time.monotonic() - start)
+    if planned:
+        _log_progress(report, len(planned))
+    return report
+
+
+def _plan_transfer(
+    owner: Union[Item, Collection],
+    asset_href: str,
+    asset_subdirectory: Optional[str],
+    copy: bool,
+) -> AssetTransfer:
+    owner_href = owner.get_self_href()
+    if owner_href is None:
+        raise ValueError(
+            f"Self HREF is not available for {owner}. This operation "
+            "requires that the HREFs are available."
+        )
+
+    # TODO this shouldn't have to be absolute
+    if not is_absolute_href(asset_href):
+        raise ValueError("asset_href must be absolute.")
+
+    owner_dir = os.path.dirname(owner_href)
+
+    fname = os.path.basename(asset_href)
+    if asset_subdirectory is None:
+        target_dir = owner_dir
+    else:
+        target_dir = os.path.join(owner_dir, asset_subdirectory)
+    new_asset_href = os.path.join(target_dir, fname)
+    return AssetTransfer(asset_href, new_asset_href, "copy" if copy else "move")
+
+
+def _plan_owner_transfers(
+    owner: Union[Item, Collection],
+    asset_subdirectory: Optional[str],
+    make_hrefs_relative: bool,
+    copy: bool,
+) -> List[AssetTransfer]:
+    """Plans the transfers of an owner's assets, and updates the asset HREFs
+    to their destinations."""
+    owner_href = owner.get_self_href()
+    if owner_href is None:
+        raise ValueError(
+            f"Self HREF is not available for {owner}. This operation "
+            "requires that HREFs are available."
+        )
+
+    transfers = []
+    for asset in owner.assets.values():
+        abs_asset_href = asset.get_absolute_href()
+        if abs_asset_href is None:
+            raise ValueError(
+                f"Asset {asset.title} HREF is not available for {owner}. "
+                "This operation requires that the Asset HREFs are available."
+            )
+        transfer = _plan_transfer(owner, abs_asset_href, asset_subdirectory, copy)
+        transfers.append(transfer)
+
+        if make_hrefs_relative:
+            asset.href = make_relative_href(transfer.destination, owner_href)
+        else:
+            asset.href = transfer.destination
+    return transfers
+
+
+def _needs_transfer(
+    transfer: AssetTransfer,
+    ignore_conflicts: bool,
+    resume: bool,
+    sync: bool,
+    checksum: bool,
+) -> bool:
+    """Returns False if the destination exists and conflicts are ignored, or
+    the transfer was already done."""
+    source, destination = transfer.source, transfer.destination
+    fs_source = _filesystem(split_protocol(source)[0])
+    fs_dest = _filesystem(split_protocol(destination)[0])
+    if sync or (resume and transfer.size is not None):
+        if sync:
+            done = not _changed(fs_source, source, fs_dest, destination, checksum)
+        else:
+            done = _size(fs_dest, destination) == transfer.size
+        if done:
+            if transfer.op == "move" and fs_source.exists(source):
+                # A matching size alone doesn't show that the destination is
+                # a copy of the source, so don't delete the only copy of it
+                if not sync and _changed(
+                    fs_source, source, fs_dest, destination, checksum
+                ):
+                    logger.warning(
+                        f"{destination} has the size of {source}, but may not "
+                        "be a copy of it; keeping the source"
+                    )
+                    return False
+                fs_source.delete(source)
+            return False
+    elif fs_dest.exists(destination):
+        if not ignore_conflicts:
+            raise FileExistsError("{} already exists".format(destination))
+        return False
+    return True
+
+
+def _execute_transfer(transfer: AssetTransfer, buffer_size: int) -> int:
+    """Executes a transfer, returning the number of bytes copied.
+
+    If the transfer fails, a partially written destination is removed, so that
+    neither a retry nor a later run mistakes it for a transferred file.
+    """
+    source, destination = transfer.source, transfer.destination
+    dest_protocol = split_protocol(destination)[0]
+    source_protocol = split_protocol(source)[0]
+    fs_source = _filesystem(source_protocol)
+    fs_dest = _filesystem(dest_protocol)
+    try:
+        if transfer.op == "copy":
+            logger.info("Copying {} to {}...".format(source, destination))
+            return _copy_file(source, destination, buffer_size)
+
+        logger.info("Moving {} to {}...".format(source, destination))
+        if source_protocol == dest_protocol:
+            fs_dest.move(source, destination)
+            return 0
+        size = _copy_file(source, destination, buffer_size)
+        fs_source.delete(source)
+        return size
+    except BaseException:
+        # A move that failed after removing its source has no other copy left
+        try:
+            if fs_source.exists(source) and fs_dest.exists(destination):
+                fs_dest.delete(destination)
+        except Exception as error:
+            logger.warning(f"Failed to remove partial file {destination}: {error!r}")
+        raise
+
+
+def _changed(
+    fs_source: AbstractFileSystem,
+    source: str,
+    fs_dest: AbstractFileSystem,
+    destination: str,
+    checksum: bool,
+) -> bool:
+    """Returns True if the destination is missing or differs from the source."""
+    try:
+        dest_info = fs_dest.info(destination)
+    except FileNotFoundError:
+        return True
+    source_info = fs_source.info(source)
+    if source_info.get("size") != dest_info.get("size"):
+        return True
+    if checksum:
+        return file_checksum(source) != file_checksum(destination)
+    for key in _HASH_INFO_KEYS:
+        if key in source_info and key in dest_info:
+            return bool(source_info[key] != dest_info[key])
+    source_mtime = _modified_time(source_info)
+    dest_mtime = _modified_time(dest_info)
+    if source_mtime is not None and dest_mtime is not None:
+        return source_mtime > dest_mtime
+    return False
+
+
+def _modified_time(info: Dict[str, Any]) -> Optional[float]:
+    """Returns the modification time in fsspec's info as a POSIX timestamp."""
+    for key in _MTIME_INFO_KEYS:
+        value = info.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue
+    return None
+
+
+def _copy_file(source: str, destination: str, buffer_size: int) -> int:
+    """Copies a file without reading it into memory, returning its size."""
+    source_protocol, source_path = split_protocol(source)
+    dest_protocol, dest_path = split_protocol(destination)
+    if source_protocol in _LOCAL_PROTOCOLS and dest_protocol in _LOCAL_PROTOCOLS:
+        return _copy_local_file(source_path, dest_path)
+    if source_protocol == dest_protocol:
+        fs = _filesystem(source_protocol)
+        size = fs.size(source)
+        fs.copy(source, destination)
+        return int(size)
+
+    fs_source, source_path = get_filesystem(source)
+    fs_dest, dest_path = get_filesystem(destination)
+    copied = 0
+    with fs_source.open(source_path, "rb") as f_src:
+        with fs_dest.open(dest_path, "wb") as f_dst:
+            while True:
+                chunk = f_src.read(buffer_size)
+                if not chunk:
+                    break
+                f_dst.write(chunk)
+                copied += len(chunk)
+    return copied
+
+
+def _copy_local_file(source: str, destination: str) -> int:
+    """Copies a local file in the kernel, with ``copy_file_range`` where
+    available, which also lets copy-on-write filesystems share the data, and
+    otherwise with ``shutil.copyfile``, which uses ``sendfile`` on Linux."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        with open(source, "rb") as f_src, open(destination, "wb") as f_dst:
+            size = os.fstat(f_src.fileno()).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    count = copy_file_range(
+                        f_src.fileno(), f_dst.fileno(), size - copied
+                    )
+                    if count == 0:
+                        # Some filesystems, e.g. FUSE, procfs or network
+                        # filesystems, stop early; fall back to shutil below
+                        break
+                    copied += count
+            except OSError:
+                # Not supported between these files, e.g. across filesystems
+                # on older kernels; fall back to shutil below
+                pass
+            if copied == size:
+                return copied
+    shutil.copyfile(source, destination)
+    return os.path.getsize(destination)
+
+
+def _with_size(transfer: AssetTransfer) -> AssetTransfer:
+    fs = _filesystem(split_protocol(transfer.source)[0])
+    return transfer._replace(size=int(fs.size(transfer.source)))
+
+
+def _size(fs: AbstractFileSystem, href: str) -> Optional[int]:
+    try:
+        return int(fs.size(href))
+    except FileNotFoundError:
+        return None
+
+
+def _makedirs(directory: str) -> None:
+    _filesystem(split_protocol(directory)[0]).makedirs(directory, exist_ok=True)
+
+
+def _filesystem(protocol: Optional[str]) -> AbstractFileSystem:
+    return filesystem_registry.get(protocol)
+
+
+def _retry(func: Callable[[], T], retries: int, transfer: AssetTransfer) -> T:
+    delay = RETRY_BACKOFF
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except _PERMANENT_ERRORS:
+            raise
+        except Exception as error:
+            if attempt == retries:
+                raise
+            logger.warning(
+                f"Transfer of {transfer.source} to {transfer.destination} failed "
+                f"({error!r}), retrying in {delay} seconds"
+            )
+            time.sleep(delay)
+            delay *= 2
+    raise AssertionError("unreachable")
+
+
+def _map(
+    func: Callable[[T], U], args: Iterable[T], max_workers: Optional[int]
+) -> Iterator[U]:
+    """Yields the results of a function, in completion order, running it in a
+    thread pool if max_workers is set."""
+    if max_workers is None:
+        for arg in args:
+            yield func(arg)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(func, arg) for arg in args]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _ordered_map(
+    func: Callable[[T], U], args: List[T], max_workers: Optional[int]
+) -> List[U]:
+    """Returns the results of a function, in order, running it in a thread
+    pool if max_workers is set."""
+    if max_workers is None:
+        return [func(arg) for arg in args]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, args))
+
+
+def _log_progress(report: TransferReport, total: int) -> None:
+    logger.info(
+        f"Transferred {report.files + report.skipped}/{total} asset files "
+        f"({report.skipped} skipped), {report.bytes / 1e6:.1f} MB in "
+        f"{report.seconds:.1f} s ({report.throughput / 1e6:.1f} MB/s)"
+    )
+
+
 def copy_catalog(
     source_catalog: Catalog,
     dest_directory: str,
@@ -279,7 +815,32 @@ def copy_catalog(
     copy_assets: bool = False,
     publish_location: Optional[str] = None,
     resolve_links: bool = True,
+    max_workers: Optional[int] = None,
+    sync: bool = False,
+    checksum: bool = False,
 ) -> None:
+    """Copies a catalog, and optionally its assets, to a directory.
+
+    Args:
+        source_catalog (Catalog): The PySTAC Catalog or Collection to copy.
+        dest_directory (str): The directory to save the copy to.
+        catalog_type (Optional[CatalogType]): The type of the saved catalog.
+            Defaults to the type of the source catalog.
+        copy_assets (bool): Copy all asset files to be alongside their new
+            owners. Defaults to False.
+        publish_location (Optional[str]): The location used for resolving
+            HREFs instead of the destination directory.
+        resolve_links (bool): Resolve and copy external child objects.
+            Defaults to True.
+        max_workers (Optional[int]): The maximum number of asset files to copy
+            concurrently. If not set, files are copied one at a time.
+        sync (bool): If True, asset files that already exist in the destination
+            are only copied again if they differ from the source, compared by
+            size, ETag, and modification time. Without it, existing asset
+            files raise a FileExistsError.
+        checksum (bool): If True, sync compares the SHA-256 checksums of asset
+            files instead of their ETags and modification times.
+    """
     if resolve_links:
         catalog = source_catalog.full_copy()
     else:
@@ -290,7 +851,14 @@ def copy_catalog(
     if copy_assets:
         catalog.make_all_asset_hrefs_absolute()
         catalog.normalize_hrefs(dest_directory, skip_unresolved=not resolve_links)
-        catalog = move_all_assets(catalog, copy=True, make_hrefs_relative=True)
+        catalog = move_all_assets(
+            catalog,
+            copy=True,
+            make_hrefs_relative=True,
+            max_workers=max_workers,
+            sync=sync,
+            checksum=checksum,
+        )
 
     if publish_location is not None:
         catalog.normalize_hrefs(publish_location, skip_unresolved=not resolve_links)
@@ -1,11 +1,15 @@
 import datetime
 import os.path
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 import rasterio
 import shapely.geometry
 from pystac import Asset, Item
 from pystac.extensions.projection import ProjectionExtension
+from rasterio.coords import BoundingBox
+from rasterio.crs import CRS
+from shapely.geometry.base import BaseGeometry
 
 import stactools.core.projection
 
@@ -37,19 +41,88 @@ def item(
     Returns:
         pystac.Item: A PySTAC Item.
     """
+    return items(
+        [href],
+        asset_key=asset_key,
+        roles=roles,
+        read_href_modifier=read_href_modifier,
+    )[0]
+
+
+def items(
+    hrefs: List[str],
+    *,
+    asset_key: str = "data",
+    roles: List[str] = ["data"],
+    read_href_modifier: Optional[ReadHrefModifier] = None,
+) -> List[Item]:
+    """Creates a STAC Item for each asset at the provided hrefs.
+
+    This is equivalent to calling :func:`item` for each href, but the item
+    geometries of all assets that share a CRS are reprojected in a single
+    batch.
+
+    Args:
+        hrefs (List[str]): The hrefs of the assets that will be used to create
+            the items.
+        asset_key (str): The unique key of the asset
+        roles (List[str]): The semantic roles of the asset
+        read_href_modifier (Optional[ReadHrefModifier]):
+            An optional callable that will be used to modify the href before reading.
+
+    Returns:
+        List[pystac.Item]: A PySTAC Item for each href, in the order of
+        ``hrefs``.
+    """
+    metadata = []
+    for href in hrefs:
+        if read_href_modifier:
+            modified_href = read_href_modifier(href)
+        else:
+            modified_href = href
+        with rasterio.open(modified_href) as dataset:
+            metadata.append(
+                (
+                    dataset.crs,
+                    dataset.bounds,
+                    list(dataset.transform)[0:6],
+                    dataset.shape,
+                )
+            )
+
+    indices_by_crs: Dict[str, List[int]] = defaultdict(list)
+    for index, (crs, *_) in enumerate(metadata):
+        indices_by_crs[crs.to_wkt()].append(index)
+    geoms: List[Optional[BaseGeometry]] = [None] * len(hrefs)
+    for indices in indices_by_crs.values():
+        reprojected = stactools.core.projection.reproject_shapes(
+            metadata[indices[0]][0],
+            "EPSG:4326",
+            [shapely.geometry.box(*metadata[index][1]) for index in indices],
+            precision=6,
+        )
+        for index, geom in zip(indices, reprojected):
+            geoms[index] = geom
+
+    return [
+        _item(href, geom, *item_metadata, asset_key=asset_key, roles=roles)
+        for href, geom, item_metadata in zip(hrefs, geoms, metadata)
+    ]
+
+
+def _item(
+    href: str,
+    geom: Optional[BaseGeometry],
+    crs: CRS,
+    proj_bbox: BoundingBox,
+    proj_transform: List[float],
+    proj_shape: Tuple[int, int],
+    *,
+    asset_key: str,
+    roles: List[str],
+) -> Item:
+    assert geom is not None
     id = os.path.splitext(os.path.basename(href))[0]
-    if read_href_modifier:
-        modified_href = read_href_modifier(href)
-    else:
-        modified_href = href
-    with rasterio.open(modified_href) as dataset:
-        crs = dataset.crs
-        proj_bbox = dataset.bounds
-        proj_transform = list(dataset.transform)[0:6]
-        proj_shape = dataset.shape
-    geom = stactools.core.projection.reproject_shape(
-        crs, "EPSG:4326", shapely.geometry.box(*proj_bbox), precision=6
-    )
     bbox = list(geom.bounds)
     geojson = shapely.geometry.mapping(geom)
     item = Item(
@@ -67,7 +140,7 @@ def item(
     else:
         projection.wkt2 = crs.to_wkt("WKT2")
     projection.transform = proj_transform
-    projection.shape = proj_shape
+    projection.shape = proj_shape  # type: ignore
 
     item.add_asset(asset_key, Asset(href=href, roles=roles))
 
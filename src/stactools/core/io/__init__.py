@@ -1,13 +1,15 @@
 """Input/output utility functions and definitions."""
 
 import os
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
-import fsspec
+import fsspec.core
+from fsspec.core import OpenFile
 from pystac.link import HREF
 from pystac.stac_io import StacIO
 
 from stactools.core import utils
+from stactools.core.utils.filesystem import get_filesystem
 
 ReadHrefModifier = Callable[[str], str]
 """Type alias for a function parameter that allows users to manipulate HREFs.
@@ -16,6 +18,9 @@ Used for reading, e.g. appending an Azure SAS Token or translating to a
 signed URL.
 """
 
+_OPEN_KWARGS = ("compression", "encoding", "errors", "newline")
+"""Keyword arguments of :func:`fsspec.open` that aren't storage options."""
+
 
 def read_text(
     href: str,
@@ -67,14 +72,20 @@ class FsspecStacIO(StacIO):
         """Reads a file as a utf-8 string using
         `fsspec <https://filesystem-spec.readthedocs.io/en/latest/>`_.
 
+        The filesystem, and its sessions and connections, is shared by all
+        reads with the same protocol and storage options, see
+        :func:`stactools.core.utils.filesystem.get_filesystem`.
+
         Args:
             href (str): The href to read.
-            **kwargs: Additional keyword arguments to be passed to fsspec.open.
+            **kwargs: The ``compression``, ``encoding``, ``errors``, and
+                ``newline`` arguments of :func:`fsspec.open`, and storage
+                options for the fsspec filesystem.
 
         Returns:
             str: The read text, decoded as utf-8 if necessary.
         """
-        with fsspec.open(href, "r", **kwargs) as f:
+        with _open(href, "r", kwargs) as f:
             s = f.read()
             if isinstance(s, str):
                 return s
@@ -108,12 +119,34 @@ class FsspecStacIO(StacIO):
         Args:
             href (str): The href to write to.
             txt (str): The text to write.
-            **kwargs: Additional keyword arguments to be passed to fsspec.open.
+            **kwargs: The ``compression``, ``encoding``, ``errors``, and
+                ``newline`` arguments of :func:`fsspec.open`, and storage
+                options for the fsspec filesystem.
         """
-        with fsspec.open(href, "w", auto_mkdir=True, **kwargs) as destination:
+        with _open(href, "w", kwargs) as destination:
             destination.write(txt)
 
 
+def _open(href: str, mode: str, kwargs: Dict[str, Any]) -> OpenFile:
+    """Opens an href on its shared filesystem, like :func:`fsspec.open`.
+
+    The arguments of :func:`fsspec.open` are split off from the storage
+    options, and the parent directory is created when writing.
+    """
+    storage_options = dict(kwargs)
+    open_kwargs = {
+        key: storage_options.pop(key) for key in _OPEN_KWARGS if key in storage_options
+    }
+    open_kwargs.setdefault("encoding", "utf8")
+    fs, path = get_filesystem(href, **storage_options)
+    if "w" in mode:
+        fs.makedirs(fs._parent(path), exist_ok=True)
+    compression = fsspec.core.get_compression(
+        path, open_kwargs.pop("compression", None)
+    )
+    return OpenFile(fs, path, mode, compression=compression, **open_kwargs)
+
+
 def use_fsspec() -> None:
     """Sets the default :py:class:`pystac.StacIO` to
     :py:class:`FsspecStacIO`."""
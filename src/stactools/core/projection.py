@@ -1,10 +1,25 @@
 import json
+import threading
 import warnings
-from typing import Any, Dict, List, Optional, Union, cast
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
+import numpy as np
+import numpy.typing as npt
 import pyproj
 import rasterio.crs
 import rasterio.transform
+import shapely
 from rasterio.warp import transform_geom
 from shapely import Geometry
 from shapely.constructive import remove_repeated_points
@@ -12,6 +27,10 @@ from shapely.geometry import mapping, shape
 
 from .geometry import GeoInterface
 
+CRSInput = Union[pyproj.CRS, rasterio.crs.CRS, str, Dict[str, Any]]
+
+DEFAULT_TRANSFORMER_CACHE_SIZE = 256
+
 
 def epsg_from_utm_zone_number(utm_zone_number: int, south: bool) -> int:
     """Returns the EPSG code for a UTM zone number.
@@ -28,6 +47,129 @@ def epsg_from_utm_zone_number(utm_zone_number: int, south: bool) -> int:
     return int(crs.to_authority()[1])
 
 
+class TransformerCacheInfo(NamedTuple):
+    """Statistics of a :class:`TransformerCache`."""
+
+    hits: int
+    """Number of transformers returned from the cache."""
+
+    misses: int
+    """Number of transformers created."""
+
+    maxsize: int
+    """Maximum number of cached transformers."""
+
+    currsize: int
+    """Current number of cached transformers."""
+
+
+class TransformerCache:
+    """A thread-safe, least-recently-used cache of :class:`pyproj.Transformer`
+    objects.
+
+    Creating a transformer is expensive compared to transforming the handful
+    of vertices of a typical footprint, so transformers are reused across
+    geometries that share a pair of CRSs.
+
+    Args:
+        maxsize (int): The maximum number of cached transformers.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TRANSFORMER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._transformers: "OrderedDict[Hashable, pyproj.Transformer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, src_crs: CRSInput, dst_crs: CRSInput, always_xy: bool = True
+    ) -> pyproj.Transformer:
+        """Returns a transformer from ``src_crs`` to ``dst_crs``, creating and
+        caching it if needed.
+
+        Args:
+            src_crs (CRSInput): The source CRS.
+            dst_crs (CRSInput): The destination CRS.
+            always_xy (bool): Whether the transformer uses x/y (longitude,
+                latitude) axis order regardless of the CRS definitions.
+                Defaults to True, which matches rasterio.
+
+        Returns:
+            pyproj.Transformer: The transformer.
+        """
+        key = (_crs_key(src_crs), _crs_key(dst_crs), always_xy)
+        with self._lock:
+            transformer = self._transformers.get(key)
+            if transformer is not None:
+                self._transformers.move_to_end(key)
+                self._hits += 1
+                return transformer
+            self._misses += 1
+        transformer = pyproj.Transformer.from_crs(
+            _pyproj_crs(src_crs), _pyproj_crs(dst_crs), always_xy=always_xy
+        )
+        with self._lock:
+            self._transformers[key] = transformer
+            self._transformers.move_to_end(key)
+            while len(self._transformers) > self.maxsize:
+                self._transformers.popitem(last=False)
+        return transformer
+
+    def cache_info(self) -> TransformerCacheInfo:
+        """Returns the hit and miss counts and the size of the cache.
+
+        Returns:
+            TransformerCacheInfo: The cache statistics.
+        """
+        with self._lock:
+            return TransformerCacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._transformers)
+            )
+
+    def clear(self) -> None:
+        """Removes all transformers from the cache and resets its statistics."""
+        with self._lock:
+            self._transformers.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+transformer_cache = TransformerCache()
+"""The transformer cache used by :func:`reproject_shape`."""
+
+
+def get_transformer(
+    src_crs: CRSInput, dst_crs: CRSInput, always_xy: bool = True
+) -> pyproj.Transformer:
+    """Returns a cached transformer from ``src_crs`` to ``dst_crs``.
+
+    Args:
+        src_crs (CRSInput): The source CRS.
+        dst_crs (CRSInput): The destination CRS.
+        always_xy (bool): Whether the transformer uses x/y axis order. Defaults
+            to True.
+
+    Returns:
+        pyproj.Transformer: The transformer.
+    """
+    return transformer_cache.get(src_crs, dst_crs, always_xy=always_xy)
+
+
+def _crs_key(crs: CRSInput) -> Hashable:
+    if isinstance(crs, dict):
+        return json.dumps(crs, sort_keys=True)
+    elif isinstance(crs, rasterio.crs.CRS):
+        return cast(str, crs.to_wkt())
+    return cast(Hashable, crs)
+
+
+def _pyproj_crs(crs: CRSInput) -> pyproj.CRS:
+    if isinstance(crs, rasterio.crs.CRS):
+        return pyproj.CRS.from_wkt(crs.to_wkt())
+    return pyproj.CRS.from_user_input(crs)
+
+
 def reproject_shape(
     src_crs: rasterio.crs.CRS,
     dst_crs: rasterio.crs.CRS,
@@ -49,11 +191,65 @@ def reproject_shape(
     Returns:
         geom: the reprojected shapely geometry object
     """
-    if precision is None:
-        precision = -1  # rasterio uses -1 for "unspecified"
-    return remove_repeated_points(
-        shape(transform_geom(src_crs, dst_crs, geom, precision=precision))
-    )
+    return reproject_shapes(src_crs, dst_crs, [geom], precision=precision)[0]
+
+
+def reproject_shapes(
+    src_crs: CRSInput,
+    dst_crs: CRSInput,
+    geoms: Union[Sequence[GeoInterface], npt.NDArray[np.object_]],
+    precision: Optional[int] = None,
+) -> List[Geometry]:
+    """Projects many geometries at once and rounds the projected vertex
+    coordinates to ``precision``.
+
+    The coordinates of all geometries are transformed with a single call to a
+    cached :class:`pyproj.Transformer`, which amortizes the per-call overhead
+    of :func:`reproject_shape` over the whole batch. Duplicate points caused by
+    rounding are removed.
+
+    Args:
+        src_crs (CRSInput): The CRS of the input geometries.
+        dst_crs (CRSInput): The CRS of the output geometries.
+        geoms (Union[Sequence[GeoInterface], numpy.NDArray[numpy.object_]]):
+            GeoJSON like dicts or shapely geometry objects to reproject.
+        precision (Optional[int]): The number of decimal places to include in
+            the final Geometry vertex coordinates.
+
+    Returns:
+        List[Geometry]: The reprojected shapely geometry objects, in the order
+        of ``geoms``.
+    """
+    geometries = np.empty(len(geoms), dtype=np.object_)
+    geometries[:] = [
+        geom if isinstance(geom, Geometry) else shape(geom) for geom in geoms
+    ]
+    transformer = get_transformer(src_crs, dst_crs)
+    coordinates = shapely.get_coordinates(geometries)
+    x, y = transformer.transform(coordinates[:, 0], coordinates[:, 1])
+    transformed = np.column_stack((x, y))
+    if precision is not None:
+        np.round(transformed, precision, out=transformed)
+    # set_coordinates replaces the geometries of the array it is given, so it
+    # gets a copy to leave ``geoms`` untouched
+    reprojected = shapely.set_coordinates(geometries.copy(), transformed)
+
+    # rasterio cuts geometries that cross the antimeridian, so those fall back
+    # to it
+    xmin, _, xmax, _ = shapely.bounds(reprojected).T
+    fallback = ~shapely.is_empty(reprojected) & ~np.isfinite(xmax - xmin)
+    if transformer.target_crs is not None and transformer.target_crs.is_geographic:
+        fallback |= xmax - xmin > 180
+    for index in np.flatnonzero(fallback):
+        reprojected[index] = shape(
+            transform_geom(
+                src_crs,
+                dst_crs,
+                geometries[index],
+                precision=-1 if precision is None else precision,
+            )
+        )
+    return list(remove_repeated_points(reprojected))
 
 
 def reproject_geom(
@@ -1,14 +1,17 @@
 """General utility functions."""
 
+import hashlib
+import json
 import warnings
 from contextlib import contextmanager
 from typing import Callable, Generator, Optional, TypeVar
 
-import fsspec
 import pystac.utils
 import rasterio
 from rasterio.errors import NotGeoreferencedWarning
 
+from .filesystem import get_filesystem
+
 T = TypeVar("T")
 U = TypeVar("U")
 
@@ -22,7 +25,8 @@ def map_opt(fn: Callable[[T], U], v: Optional[T]) -> Optional[U]:
 def href_exists(href: str) -> bool:
     """Returns true if there is a file at the given href.
 
-    Uses fssepc and its `exists
+    Uses the shared fsspec filesystem of the href, see
+    :func:`stactools.core.utils.filesystem.get_filesystem`, and its `exists
     <https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.exists>`_
     method.
 
@@ -32,8 +36,63 @@ def href_exists(href: str) -> bool:
     Returns:
         bool: True if the href exists, False if not.
     """
-    fs, _, paths = fsspec.get_fs_token_paths(href)
-    return bool(paths and fs.exists(paths[0]))
+    fs, path = get_filesystem(href)
+    return bool(path and fs.exists(path))
+
+
+IDENTITY_INFO_KEYS = [
+    "ETag",
+    "etag",
+    "md5Hash",
+    "size",
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "updated",
+]
+"""Keys of fsspec's ``info`` that are used by :py:func:`file_identity`."""
+
+
+def file_identity(href: str, checksum: bool = False) -> str:
+    """Returns a string identifying the current content of the file at the given
+    href, for detecting changes without reading the file.
+
+    Uses the ETag, size, and modification time reported by fsspec's `info
+    <https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.info>`_
+    method, whichever are available for the filesystem.
+
+    Args:
+        href (str): The href of the file.
+        checksum (bool): If True, also include a SHA-256 checksum of the file
+            content, which requires reading the whole file. Defaults to False.
+
+    Returns:
+        str: The identity of the file content.
+    """
+    fs, path = get_filesystem(href)
+    info = fs.info(path)
+    identity = {key: str(info[key]) for key in IDENTITY_INFO_KEYS if key in info}
+    if checksum:
+        identity["sha256"] = file_checksum(href)
+    return json.dumps(identity, sort_keys=True)
+
+
+def file_checksum(href: str) -> str:
+    """Returns the SHA-256 checksum of the content of the file at the given
+    href.
+
+    Args:
+        href (str): The href of the file.
+
+    Returns:
+        str: The hex digest of the file content.
+    """
+    fs, path = get_filesystem(href)
+    digest = hashlib.sha256()
+    with fs.open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def gdal_driver_is_enabled(name: str) -> bool:
@@ -0,0 +1,103 @@
+"""A shared registry of fsspec filesystems."""
+
+import os
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import fsspec.core
+from fsspec.core import split_protocol
+from fsspec.registry import get_filesystem_class
+from fsspec.spec import AbstractFileSystem
+from fsspec.utils import tokenize
+
+
+class FilesystemRegistry:
+    """A thread-safe registry of fsspec filesystem instances, keyed by protocol
+    and storage options.
+
+    fsspec caches filesystem instances per thread, so every worker thread of a
+    pool would otherwise create its own instance, with its own HTTP session,
+    credential resolution, and connections. Sharing one instance per protocol
+    and storage options pays that cost once per process. Instances are
+    discarded after a fork, since their sessions can't be used by the child
+    process.
+    """
+
+    def __init__(self) -> None:
+        self._filesystems: Dict[Hashable, AbstractFileSystem] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(
+        self, protocol: Optional[str] = None, **storage_options: Any
+    ) -> AbstractFileSystem:
+        """Returns the filesystem for a protocol and storage options, creating
+        and registering it if needed.
+
+        Args:
+            protocol (Optional[str]): The fsspec protocol, e.g. ``"s3"``.
+                Defaults to the local filesystem.
+            **storage_options: Keyword arguments for the filesystem.
+
+        Returns:
+            AbstractFileSystem: The filesystem.
+        """
+        protocol = protocol or "file"
+        key = tokenize(protocol, **storage_options)
+        with self._lock:
+            if self._pid != os.getpid():
+                self._filesystems.clear()
+                self._pid = os.getpid()
+            filesystem = self._filesystems.get(key)
+            if filesystem is None:
+                filesystem = get_filesystem_class(protocol)(**storage_options)
+                self._filesystems[key] = filesystem
+            return filesystem
+
+    def resolve(
+        self, href: str, **storage_options: Any
+    ) -> Tuple[AbstractFileSystem, str]:
+        """Returns the filesystem of an href and the path of the href within it.
+
+        Storage options encoded in the href, e.g. a GCS project, are added to
+        the given storage options, like :func:`fsspec.open` does. Chained
+        hrefs, like ``zip://file.txt::s3://bucket/archive.zip``, are opened
+        without the registry.
+
+        Args:
+            href (str): The href.
+            **storage_options: Keyword arguments for the filesystem.
+
+        Returns:
+            Tuple[AbstractFileSystem, str]: The filesystem and path.
+        """
+        if "::" in href:
+            filesystem, path = fsspec.core.url_to_fs(href, **storage_options)
+            return filesystem, path
+        protocol = split_protocol(href)[0] or "file"
+        cls = get_filesystem_class(protocol)
+        options = {**cls._get_kwargs_from_urls(href), **storage_options}
+        return self.get(protocol, **options), cls._strip_protocol(href)
+
+    def clear(self) -> None:
+        """Removes all filesystems from the registry."""
+        with self._lock:
+            self._filesystems.clear()
+
+
+filesystem_registry = FilesystemRegistry()
+"""The filesystem registry used for reading, writing, and copying files."""
+
+
+def get_filesystem(href: str, **storage_options: Any) -> Tuple[AbstractFileSystem, str]:
+    """Returns the shared filesystem of an href and the path of the href within
+    it, from :data:`filesystem_registry`.
+
+    Args:
+        href (str): The href.
+        **storage_options: Keyword arguments for the filesystem.
+
+    Returns:
+        Tuple[AbstractFileSystem, str]: The filesystem and path.
+    """
+    return filesystem_registry.resolve(href, **storage_options)
@@ -0,0 +1,204 @@
+"""Caches of raster footprint results, keyed by the identity of the raster
+content and the footprint parameters."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from stactools.core import utils
+
+
+def footprint_cache_key(
+    href: str, parameters: Dict[str, Any], checksum: bool = False
+) -> str:
+    """Returns the cache key for the footprint of the raster at an href.
+
+    The key combines the href, the identity of the file content (see
+    :py:func:`stactools.core.utils.file_identity`), and the parameters of the
+    footprint calculation, so a changed file or changed parameters never hit
+    a stale entry.
+
+    Args:
+        href (str): The href of the raster.
+        parameters (Dict[str, Any]): The parameters of the footprint
+            calculation, e.g. bands, no_data, densification, precision,
+            simplify_tolerance, and dst_crs.
+        checksum (bool): If True, identify the file content by a checksum of
+            the file instead of its metadata. Defaults to False.
+
+    Returns:
+        str: The cache key.
+    """
+    data = {
+        "href": href,
+        "identity": utils.file_identity(href, checksum=checksum),
+        "parameters": parameters,
+    }
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class FootprintCache(ABC):
+    """Base class for footprint caches.
+
+    Subclasses store GeoJSON footprint dictionaries by cache key; see
+    :py:func:`footprint_cache_key`.
+    """
+
+    checksum: bool = False
+    """Whether cache keys identify file content by checksum instead of
+    metadata."""
+
+    def key(self, href: str, parameters: Dict[str, Any]) -> str:
+        """Returns the cache key for the footprint of the raster at an href.
+
+        Args:
+            href (str): The href of the raster.
+            parameters (Dict[str, Any]): The parameters of the footprint
+                calculation.
+
+        Returns:
+            str: The cache key.
+        """
+        return footprint_cache_key(href, parameters, checksum=self.checksum)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached footprint for a key, or None if it is not cached.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached GeoJSON footprint.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, footprint: Dict[str, Any]) -> None:
+        """Stores a footprint in the cache.
+
+        Args:
+            key (str): The cache key.
+            footprint (Dict[str, Any]): The GeoJSON footprint.
+        """
+        raise NotImplementedError
+
+
+class DirectoryFootprintCache(FootprintCache):
+    """A footprint cache stored in a SQLite database in a local directory.
+
+    The least recently used entries are evicted when the cache grows beyond
+    ``max_entries`` entries or ``max_bytes`` bytes of footprint data. The cache
+    can be shared by threads and processes on a single node.
+
+    Args:
+        directory (str): The directory containing the cache database. It is
+            created if it does not exist.
+        max_entries (Optional[int]): The maximum number of cached footprints.
+        max_bytes (Optional[int]): The maximum total size, in bytes, of the
+            cached footprints.
+        checksum (bool): If True, identify file content by a checksum of the
+            file instead of its metadata. This requires reading the whole file,
+            so it is only worthwhile for filesystems without reliable
+            modification times or ETags. Defaults to False.
+    """
+
+    FILE_NAME = "footprints.sqlite"
+    """Name of the database file in the cache directory."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        checksum: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.checksum = checksum
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_connection"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._connection = sqlite3.connect(
+                os.path.join(self.directory, self.FILE_NAME),
+                timeout=60,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS footprints ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+        return self._connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value FROM footprints WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE footprints SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        footprint: Dict[str, Any] = json.loads(row[0])
+        return footprint
+
+    def set(self, key: str, footprint: Dict[str, Any]) -> None:
+        value = json.dumps(footprint)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO footprints (key, value, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self._evict(connection)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connect().execute("SELECT COUNT(*) FROM footprints").fetchone()
+        return int(row[0])
+
+    def clear(self) -> None:
+        """Removes all footprints from the cache."""
+        with self._lock:
+            self._connect().execute("DELETE FROM footprints")
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self.max_entries is not None:
+            connection.execute(
+                "DELETE FROM footprints WHERE key IN (SELECT key FROM footprints "
+                "ORDER BY accessed DESC, key LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            connection.execute(
+                "DELETE FROM footprints WHERE key IN (SELECT key FROM ("
+                "SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total "
+                "FROM footprints) WHERE total > ?)",
+                (self.max_bytes,),
+            )
@@ -1,32 +1,62 @@
 """Generate convex hulls of valid raster data for use in STAC Item
 geometries."""
 
+import functools
 import logging
+import math
 import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum, auto
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
 import numpy.typing as npt
 import rasterio
 import rasterio.features
+import rasterio.warp
+import shapely
 from pystac import Item
 from rasterio import Affine, DatasetReader
 from rasterio.crs import CRS
+from rasterio.enums import ColorInterp, MaskFlags
+from rasterio.windows import Window
 from shapely.geometry import mapping, shape
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon, orient
 from shapely.ops import unary_union
 
 from stactools.core.geometry import mutual_intersection
+from stactools.core.utils.footprint_cache import FootprintCache
 
-from ..projection import reproject_shape
+from ..projection import get_transformer, reproject_shape
 
 logger = logging.getLogger(__name__)
 
 # Roughly 1 centimeter in geodetic coordinates
 DEFAULT_PRECISION = 7
 
+# Binary search steps when simplifying a footprint to ``max_vertices``
+MAX_SIMPLIFY_ITERATIONS = 20
+
+# Maximum number of bisections of a footprint edge for
+# ``densification_tolerance``
+MAX_DENSIFICATION_DEPTH = 12
+
 T = TypeVar("T", bound="RasterFootprint")
 
 
@@ -43,6 +73,49 @@ class FootprintMergeStrategy(Enum):
     """Use the mutual intersection of all matching asset footprints."""
 
 
+class FootprintMode(Enum):
+    """How the footprint is derived from the valid data mask."""
+
+    POLYGONIZE = auto()
+    """Polygonize the data mask. A single data region is used as-is; multiple
+    data regions are merged into their convex hull."""
+
+    CONVEX_HULL = auto()
+    """Use the convex hull of all data pixels, computed directly from the
+    first and last data pixel of each row of the mask without polygonizing
+    it. This is much faster on rasters with many small data regions."""
+
+    OUTLINE = auto()
+    """Use the outline of the data regions, with holes, as a Polygon or
+    MultiPolygon. Small holes and islands can be dropped with
+    ``min_hole_area`` and ``min_island_area``."""
+
+    CONCAVE_HULL = auto()
+    """Use a concave hull of the data regions, tuned with
+    ``concave_hull_ratio``. The hull always covers the data outline."""
+
+
+class MaskSource(Enum):
+    """Source of the valid data mask of a raster."""
+
+    AUTO = auto()
+    """Use the GDAL mask when the dataset has an internal mask, alpha band, or
+    nodata value and no different ``no_data`` value is given explicitly;
+    otherwise, compare pixel values against ``no_data``."""
+
+    NODATA = auto()
+    """Compare the pixel values of each band against the ``no_data`` value."""
+
+    GDAL_MASK = auto()
+    """Use GDAL's mask bands (internal or external mask, alpha band, or
+    nodata-derived mask), as returned by
+    :meth:`rasterio.io.DatasetReader.read_masks`."""
+
+    ALPHA = auto()
+    """Use the dataset's alpha band; pixels with a nonzero alpha value are
+    data."""
+
+
 def densify_by_factor(
     point_list: List[Tuple[float, float]], factor: int
 ) -> List[Tuple[float, float]]:
@@ -63,13 +136,8 @@ def densify_by_factor(
     Returns:
         List[Tuple[float, float]]: A list of the densified points.
     """  # noqa: E501
-    points: Any = np.asarray(point_list)
-    densified_number = len(points) * factor
-    existing_indices = np.arange(0, densified_number, factor)
-    interp_indices = np.arange(existing_indices[-1] + 1)
-    interp_x = np.interp(interp_indices, existing_indices, points[:, 0])
-    interp_y = np.interp(interp_indices, existing_indices, points[:, 1])
-    return [(x, y) for x, y in zip(interp_x, interp_y)]
+    densified = densify_array_by_factor(np.asarray(point_list), factor)
+    return [(x, y) for x, y in densified.tolist()]
 
 
 def densify_by_distance(
@@ -94,20 +162,381 @@ def densify_by_distance(
     Returns:
         List[Tuple[float, float]]: A list of the densified points.
     """
-    points: Any = np.asarray(point_list)
-    dxdy = points[1:, :] - points[:-1, :]
-    segment_lengths = np.sqrt(np.sum(np.square(dxdy), axis=1))
-    steps = segment_lengths / distance
-    coordinate_steps = dxdy / steps.reshape(-1, 1)
-    densified_points = np.empty((len(point_list) - 1,), dtype="O")
-    for index in range(len(point_list) - 1):
-        step = np.arange(steps[index])
-        densified_points[index] = (
-            np.array((step, step)).T * coordinate_steps[index] + points[index]
+    densified = densify_array_by_distance(np.asarray(point_list), distance)
+    return [(x, y) for x, y in densified.tolist()]
+
+
+def densify_array_by_factor(
+    points: npt.NDArray[np.float64], factor: int
+) -> npt.NDArray[np.float64]:
+    """Array version of :func:`densify_by_factor`.
+
+    Args:
+        points (numpy.NDArray[numpy.float64]): An (N, 2) array of the points to
+            be densified.
+        factor (int): The factor by which to densify the points.
+
+    Returns:
+        numpy.NDArray[numpy.float64]: An (M, 2) array of the densified points.
+    """
+    densified_number = len(points) * factor
+    existing_indices = np.arange(0, densified_number, factor)
+    interp_indices = np.arange(existing_indices[-1] + 1)
+    return np.column_stack(
+        (
+            np.interp(interp_indices, existing_indices, points[:, 0]),
+            np.interp(interp_indices, existing_indices, points[:, 1]),
+        )
+    )
+
+
+def densify_array_by_distance(
+    points: npt.NDArray[np.float64], distance: float
+) -> npt.NDArray[np.float64]:
+    """Array version of :func:`densify_by_distance`.
+
+    The densified points of all segments are computed at once: each output
+    point is indexed by its segment and its step along the segment, so there
+    is no Python loop over the segments.
+
+    Args:
+        points (numpy.NDArray[numpy.float64]): An (N, 2) array of the points to
+            be densified.
+        distance (float): The interval at which to insert additional points.
+
+    Returns:
+        numpy.NDArray[numpy.float64]: An (M, 2) array of the densified points.
+    """
+    dxdy = np.diff(points, axis=0)
+    segment_lengths = np.hypot(dxdy[:, 0], dxdy[:, 1])
+    counts = np.ceil(segment_lengths / distance).astype(np.intp)
+    segments = np.repeat(np.arange(len(counts)), counts)
+    steps = np.arange(len(segments)) - np.repeat(np.cumsum(counts) - counts, counts)
+    fractions = steps * distance / segment_lengths[segments]
+    densified = np.empty((len(segments) + 1, 2), dtype=np.float64)
+    np.multiply(dxdy[segments], fractions[:, np.newaxis], out=densified[:-1])
+    densified[:-1] += points[segments]
+    densified[-1] = points[-1]
+    return densified
+
+
+def densify_array_by_reprojection_error(
+    points: npt.NDArray[np.float64],
+    src_crs: CRS,
+    dst_crs: CRS,
+    tolerance: float,
+    max_depth: int = MAX_DENSIFICATION_DEPTH,
+) -> npt.NDArray[np.float64]:
+    """Densifies points so that, once reprojected, the straight line between
+    successive points is within ``tolerance`` of the reprojected path.
+
+    Each segment is bisected recursively, but only where the reprojected
+    midpoint deviates from the midpoint of the reprojected segment by more than
+    ``tolerance``. The segments are processed one bisection level at a time,
+    with a single call to the cached transformer of
+    :func:`stactools.core.projection.get_transformer` per level.
+
+    Args:
+        points (numpy.NDArray[numpy.float64]): An (N, 2) array of points in
+            ``src_crs``.
+        src_crs (CRS): The CRS of the points.
+        dst_crs (CRS): The CRS in which the error is measured.
+        tolerance (float): The maximum error, in ``dst_crs`` units.
+        max_depth (int): The maximum number of times a segment is bisected.
+
+    Returns:
+        numpy.NDArray[numpy.float64]: An (M, 2) array of the densified points in
+        ``src_crs``.
+    """
+    transformer = get_transformer(src_crs, dst_crs)
+    src = np.asarray(points, dtype=np.float64)
+    dst = np.column_stack(transformer.transform(src[:, 0], src[:, 1]))
+    active = np.arange(len(src) - 1)
+    for _ in range(max_depth):
+        if not len(active):
+            break
+        midpoints = (src[active] + src[active + 1]) / 2
+        projected = np.column_stack(
+            transformer.transform(midpoints[:, 0], midpoints[:, 1])
         )
-    final_point = points[-1].reshape(1, -1)
-    densified_array = np.concatenate((*densified_points, final_point), axis=0)
-    return [(float(row[0]), float(row[1])) for row in densified_array]
+        chord = (dst[active] + dst[active + 1]) / 2
+        split = np.hypot(*(projected - chord).T) > tolerance
+        active = active[split]
+        src = np.insert(src, active + 1, midpoints[split], axis=0)
+        dst = np.insert(dst, active + 1, projected[split], axis=0)
+        # both halves of each split segment, shifted by earlier insertions
+        first = active + np.arange(len(active))
+        active = np.column_stack((first, first + 1)).ravel()
+    return src
+
+
+def _valid_data_mask(
+    data_array: npt.NDArray[Any], no_data: Union[int, float]
+) -> npt.NDArray[np.bool_]:
+    """Returns a 2D boolean mask that is True wherever any band of a 3D array
+    is not ``no_data``.
+
+    The per-band comparisons are ORd into a single preallocated 2D buffer, so
+    no 3D temporary arrays are created.
+    """
+    valid: npt.NDArray[np.bool_] = np.empty(data_array.shape[1:], dtype=np.bool_)
+    scratch = np.empty_like(valid) if len(data_array) > 1 else valid
+    is_nan = np.isnan(no_data)
+    for index, band in enumerate(data_array):
+        out = valid if index == 0 else scratch
+        if is_nan:
+            np.isnan(band, out=out)
+            np.logical_not(out, out=out)
+        else:
+            np.not_equal(band, no_data, out=out)
+        if index > 0:
+            np.logical_or(valid, scratch, out=valid)
+    return valid
+
+
+def _resolve_mask_source(
+    reader: DatasetReader,
+    bands: List[int],
+    no_data: Optional[Union[int, float]],
+    mask_source: MaskSource,
+) -> MaskSource:
+    """Resolves :attr:`MaskSource.AUTO` to a concrete mask source for the
+    dataset. ``no_data`` is the value given by the caller, before falling back
+    to the dataset's nodata value."""
+    if mask_source is not MaskSource.AUTO:
+        return mask_source
+    if no_data is not None and not (
+        reader.nodata is not None
+        and (
+            no_data == reader.nodata or (np.isnan(no_data) and np.isnan(reader.nodata))
+        )
+    ):
+        return MaskSource.NODATA
+    if all(
+        flags == [MaskFlags.all_valid]
+        for flags in (reader.mask_flag_enums[index - 1] for index in bands)
+    ):
+        return MaskSource.NODATA
+    return MaskSource.GDAL_MASK
+
+
+def _read_valid_data_mask(
+    reader: DatasetReader,
+    bands: List[int],
+    no_data: Optional[Union[int, float]],
+    mask_source: MaskSource,
+    window: Optional[Window] = None,
+    out_shape: Optional[Tuple[int, int]] = None,
+) -> npt.NDArray[np.bool_]:
+    """Reads the 2D valid data mask of ``bands`` for a window and/or output
+    shape from the given mask source."""
+    if mask_source is MaskSource.ALPHA:
+        indexes = [
+            index
+            for index, interp in zip(reader.indexes, reader.colorinterp)
+            if interp == ColorInterp.alpha
+        ]
+        if not indexes:
+            raise ValueError("Dataset does not have an alpha band.")
+    elif mask_source is MaskSource.GDAL_MASK:
+        if MaskFlags.per_dataset in reader.mask_flag_enums[bands[0] - 1]:
+            indexes = bands[:1]
+        else:
+            indexes = bands
+    else:
+        indexes = bands
+    if out_shape is not None:
+        shape = (len(indexes), *out_shape)
+    else:
+        shape = None
+
+    if mask_source is MaskSource.GDAL_MASK:
+        masks = reader.read_masks(indexes, window=window, out_shape=shape)
+        return np.any(masks, axis=0)  # type: ignore
+    data = reader.read(indexes, window=window, out_shape=shape)
+    if mask_source is MaskSource.ALPHA:
+        return np.any(data, axis=0)  # type: ignore
+    assert no_data is not None
+    return _valid_data_mask(data, no_data)
+
+
+def _read_data_mask(
+    reader: DatasetReader,
+    bands: List[int],
+    no_data: Optional[Union[int, float]],
+    mask_source: MaskSource,
+    windowed: bool = False,
+    out_shape: Optional[Tuple[int, int]] = None,
+) -> npt.NDArray[np.uint8]:
+    """Builds the uint8 data mask of ``bands`` from the given mask source.
+
+    If ``windowed``, the mask is built one internal block window at a time, so
+    that only a single window of pixel data is held in memory. If
+    ``out_shape`` is given, the mask is built from a decimated read.
+    """
+    shape = out_shape or reader.shape
+    if mask_source is MaskSource.NODATA and no_data is None:
+        return np.ones(shape, dtype=np.uint8)
+    if out_shape is not None or not windowed:
+        valid = _read_valid_data_mask(
+            reader, bands, no_data, mask_source, out_shape=out_shape
+        )
+        return cast(npt.NDArray[np.uint8], valid.view(np.uint8))
+    mask: npt.NDArray[np.uint8] = np.empty(shape, dtype=np.uint8)
+    for _, window in reader.block_windows(bands[0]):
+        mask[window.toslices()] = _read_valid_data_mask(
+            reader, bands, no_data, mask_source, window=window
+        )
+    return mask
+
+
+def _decimation_factor(
+    reader: DatasetReader,
+    band: int,
+    max_pixels: Optional[int],
+    max_error: Optional[float],
+    scale: float,
+) -> int:
+    """Chooses the decimation factor for reading the data mask, preferring the
+    dataset's overview levels so that GDAL can serve the read from an
+    overview."""
+    overviews: List[int] = sorted(reader.overviews(band))
+    factor = 1
+    if max_pixels is not None:
+        minimum = math.sqrt(reader.width * reader.height / max_pixels)
+        factor = next(
+            (level for level in overviews if level >= minimum),
+            max(math.ceil(minimum), 1),
+        )
+    if max_error is not None:
+        pixel_error = math.hypot(reader.res[0], reader.res[1]) * scale
+        maximum = max_error / pixel_error
+        error_factor = max(
+            (level for level in overviews if level <= maximum),
+            default=max(math.floor(maximum), 1),
+        )
+        factor = min(factor, error_factor) if max_pixels is not None else error_factor
+    return max(factor, 1)
+
+
+def _dst_units_per_src_unit(reader: DatasetReader, dst_crs: CRS) -> float:
+    """Approximates the scale between the raster CRS and ``dst_crs`` from the
+    reprojected bounds of the raster."""
+    if CRS.from_user_input(dst_crs) == reader.crs:
+        return 1.0
+    left, bottom, right, top = reader.bounds
+    dst_left, dst_bottom, dst_right, dst_top = rasterio.warp.transform_bounds(
+        reader.crs, dst_crs, left, bottom, right, top
+    )
+    return float(
+        max(
+            abs(dst_right - dst_left) / abs(right - left),
+            abs(dst_top - dst_bottom) / abs(top - bottom),
+        )
+    )
+
+
+def _binary_closing(mask: npt.NDArray[np.uint8], size: int) -> npt.NDArray[np.uint8]:
+    """Morphological closing of a 0/1 mask with a 3x3 structuring element
+    applied ``size`` times. Pixels outside of the mask are treated as nodata
+    when dilating and as data when eroding, so that the closing never removes
+    data pixels."""
+
+    def dilate(array: npt.NDArray[np.bool_]) -> npt.NDArray[np.bool_]:
+        rows = array.copy()
+        rows[1:] |= array[:-1]
+        rows[:-1] |= array[1:]
+        out = rows.copy()
+        out[:, 1:] |= rows[:, :-1]
+        out[:, :-1] |= rows[:, 1:]
+        return out
+
+    closed = mask != 0
+    for _ in range(size):
+        closed = dilate(closed)
+    for _ in range(size):
+        closed = ~dilate(~closed)
+    return cast(npt.NDArray[np.uint8], closed.view(np.uint8))
+
+
+def _map_polygons(
+    geometry: Union[Polygon, MultiPolygon], fn: Callable[[Polygon], Polygon]
+) -> Union[Polygon, MultiPolygon]:
+    """Applies a function to a Polygon or to each Polygon of a MultiPolygon."""
+    if isinstance(geometry, MultiPolygon):
+        return MultiPolygon([fn(polygon) for polygon in geometry.geoms])
+    return fn(geometry)
+
+
+def _orient(geometry: Union[Polygon, MultiPolygon]) -> Union[Polygon, MultiPolygon]:
+    """Orients the exterior rings of a Polygon or MultiPolygon
+    counter-clockwise."""
+    return _map_polygons(geometry, orient)
+
+
+def _simplify_to_max_vertices(
+    polygon: Union[Polygon, MultiPolygon],
+    max_vertices: int,
+    min_tolerance: float,
+    precision: int,
+) -> Union[Polygon, MultiPolygon]:
+    """Simplifies a polygon to at most ``max_vertices`` coordinates such that
+    the result covers the original polygon.
+
+    Binary searches the smallest tolerance, no smaller than ``min_tolerance``,
+    for which the topology-preserving simplification, buffered outwards by the
+    tolerance and rounded to ``precision``, is within the budget. If no such
+    tolerance exists, e.g. because of many disjoint parts, the rounded-out
+    bounding box is returned.
+    """
+    if max_vertices < 5:
+        raise ValueError(f"max_vertices must be at least 5, got {max_vertices}")
+    if min_tolerance == 0 and shapely.get_num_coordinates(polygon) <= max_vertices:
+        return polygon
+
+    # rounding moves each vertex by less than one unit of precision
+    margin = 10.0**-precision
+
+    def covering(tolerance: float) -> Optional[Union[Polygon, MultiPolygon]]:
+        simplified = polygon.simplify(tolerance, preserve_topology=True).buffer(
+            tolerance + margin, join_style="mitre"
+        )
+        simplified = shapely.remove_repeated_points(
+            shapely.transform(simplified, lambda c: np.round(c, precision))
+        )
+        if (
+            shapely.get_num_coordinates(simplified) <= max_vertices
+            and simplified.is_valid
+            and simplified.covers(polygon)
+        ):
+            return cast(Union[Polygon, MultiPolygon], _orient(simplified))
+        return None
+
+    if min_tolerance > 0:
+        best = covering(min_tolerance)
+        if best is not None:
+            return best
+    minx, miny, maxx, maxy = polygon.bounds
+    low, high = min_tolerance, max(math.hypot(maxx - minx, maxy - miny), min_tolerance)
+    best = covering(high)
+    if best is None:
+        scale = 10.0**precision
+        return orient(
+            shapely.box(
+                math.floor(minx * scale) / scale,
+                math.floor(miny * scale) / scale,
+                math.ceil(maxx * scale) / scale,
+                math.ceil(maxy * scale) / scale,
+            )
+        )
+    for _ in range(MAX_SIMPLIFY_ITERATIONS):
+        tolerance = (low + high) / 2
+        candidate = covering(tolerance)
+        if candidate is None:
+            low = tolerance
+        else:
+            best, high = candidate, tolerance
+    return best
 
 
 def reproject_polygon(
@@ -192,12 +621,43 @@ class RasterFootprint:
             created along the segment. Higher densities produce higher
             fidelity footprints in areas of high projection distortion.
             Mutually exclusive with ``densification_factor``.
+        densification_tolerance (Optional[float]): The maximum distance, in
+            ``dst_crs`` units, between a reprojected footprint edge and the
+            straight line between its reprojected vertices. Edges are bisected
+            only where needed, which adds the fewest vertices for that
+            accuracy. Mutually exclusive with ``densification_factor`` and
+            ``densification_distance``.
         simplify_tolerance (Optional[float]): Distance, in degrees, within
             which all locations on the simplified polygon will be to the original
             polygon.
         no_data (Optional[Union[int, float]]): The nodata value in
             ``data_array``. If set to None, this will return a footprint
             including nodata values.
+        footprint_mode (FootprintMode): How the footprint is derived from the
+            data mask; see :class:`FootprintMode`. Defaults to
+            ``FootprintMode.POLYGONIZE``.
+        concave_hull_ratio (float): With ``FootprintMode.CONCAVE_HULL``, the
+            concave hull ratio between 0 (most concave) and 1 (convex hull).
+            Defaults to 0.5.
+        min_hole_area (Optional[float]): With ``FootprintMode.OUTLINE``, holes
+            in the data outline smaller than this area, in pixels, are filled.
+        min_island_area (Optional[float]): With ``FootprintMode.OUTLINE`` or
+            ``FootprintMode.CONCAVE_HULL``, data regions smaller than this
+            area, in pixels, are dropped.
+        closing_size (int): With ``FootprintMode.OUTLINE`` or
+            ``FootprintMode.CONCAVE_HULL``, the size, in pixels, of a
+            morphological closing applied to the data mask before it is
+            polygonized, to merge speckle and close narrow gaps. Defaults to 0,
+            no closing.
+        outline_tolerance (Optional[float]): With ``FootprintMode.OUTLINE`` or
+            ``FootprintMode.CONCAVE_HULL``, simplify the outline in the native
+            CRS with this tolerance, in pixels, to remove the staircase vertices
+            of pixel edges and bound the vertex count before densification and
+            reprojection.
+        max_vertices (Optional[int]): The maximum number of coordinates in the
+            final footprint. The footprint is simplified with the smallest
+            tolerance, no smaller than ``simplify_tolerance``, that meets the
+            budget, and is guaranteed to cover the unsimplified footprint.
     """
 
     crs: CRS
@@ -215,9 +675,37 @@ class RasterFootprint:
     densification_factor: Optional[int]
     """Optional factor for densifying polygon vertices before reprojection."""
 
+    densification_tolerance: Optional[float]
+    """Optional maximum reprojection error, in ``dst_crs`` units, for adaptively
+    densifying polygon vertices before reprojection."""
+
     no_data: Optional[Union[int, float]]
     """Optional value defining pixels to exclude from the footprint."""
 
+    footprint_mode: FootprintMode
+    """How the footprint is derived from the data mask."""
+
+    concave_hull_ratio: float
+    """Concave hull ratio for ``FootprintMode.CONCAVE_HULL``."""
+
+    min_hole_area: Optional[float]
+    """Optional minimum area, in pixels, of holes in the data outline."""
+
+    min_island_area: Optional[float]
+    """Optional minimum area, in pixels, of data regions in the data
+    outline."""
+
+    closing_size: int
+    """Size, in pixels, of the morphological closing of the data mask before
+    it is outlined."""
+
+    outline_tolerance: Optional[float]
+    """Optional tolerance, in pixels, for simplifying the data outline in the
+    native CRS."""
+
+    max_vertices: Optional[int]
+    """Optional maximum number of coordinates in the footprint."""
+
     precision: int
     """Number of decimal places in the final footprint coordinates."""
 
@@ -228,6 +716,15 @@ class RasterFootprint:
     transform: Affine
     """Transformation matrix from pixel to CRS coordinates."""
 
+    error_bound: float = 0.0
+    """Approximate worst-case distance, in ``dst_crs`` units, by which the
+    footprint may miss valid pixels because the data mask was computed from a
+    decimated read (see ``max_pixels`` and ``max_error`` in
+    :meth:`from_rasterio_dataset_reader`). Buffering the footprint by this
+    distance covers all valid pixels at the edges of data regions; regions
+    smaller than one decimated pixel may still be missed. Zero for
+    full-resolution masks."""
+
     def __init__(
         self,
         data_array: npt.NDArray[Any],
@@ -238,8 +735,16 @@ class RasterFootprint:
         precision: int = DEFAULT_PRECISION,
         densification_factor: Optional[int] = None,
         densification_distance: Optional[float] = None,
+        densification_tolerance: Optional[float] = None,
         simplify_tolerance: Optional[float] = None,
         no_data: Optional[Union[int, float]] = None,
+        footprint_mode: FootprintMode = FootprintMode.POLYGONIZE,
+        concave_hull_ratio: float = 0.5,
+        min_hole_area: Optional[float] = None,
+        min_island_area: Optional[float] = None,
+        closing_size: int = 0,
+        outline_tolerance: Optional[float] = None,
+        max_vertices: Optional[int] = None,
     ) -> None:
         if data_array.ndim == 2:
             data_array = data_array[np.newaxis, :]
@@ -248,15 +753,33 @@ class RasterFootprint:
         self.dst_crs = dst_crs
         self.transform = transform
         self.precision = precision
-        if densification_factor is not None and densification_distance is not None:
+        if (
+            sum(
+                option is not None
+                for option in (
+                    densification_factor,
+                    densification_distance,
+                    densification_tolerance,
+                )
+            )
+            > 1
+        ):
             raise ValueError(
-                "Only one of 'densification_factor' or 'densification_distance' "
-                "can be specified."
+                "Only one of 'densification_factor', 'densification_distance', or "
+                "'densification_tolerance' can be specified."
             )
         self.densification_factor = densification_factor
         self.densification_distance = densification_distance
+        self.densification_tolerance = densification_tolerance
         self.simplify_tolerance = simplify_tolerance
         self.no_data = no_data
+        self.footprint_mode = footprint_mode
+        self.concave_hull_ratio = concave_hull_ratio
+        self.min_hole_area = min_hole_area
+        self.min_island_area = min_island_area
+        self.closing_size = closing_size
+        self.outline_tolerance = outline_tolerance
+        self.max_vertices = max_vertices
 
     def footprint(self) -> Optional[Dict[str, Any]]:
         """Produces the footprint surrounding data (not nodata) pixels in the
@@ -285,20 +808,14 @@ class RasterFootprint:
             nodata/data pixels.
         """
         assert self.data_array.ndim == 3
-        shape = self.data_array.shape
-        if self.no_data is not None:
-            mask: npt.NDArray[np.uint8] = np.full(shape, 0, dtype=np.uint8)
-            if np.isnan(self.no_data):
-                mask[~np.isnan(self.data_array)] = 1
-            else:
-                mask[self.data_array != self.no_data] = 1
-            mask = np.sum(mask, axis=0, dtype=np.uint8)  # type: ignore
-            mask[mask > 0] = 1
-        else:
-            mask = np.full(shape, 1, dtype=np.uint8)
-        return mask
-
-    def data_extent(self, mask: npt.NDArray[np.uint8]) -> Optional[Polygon]:
+        if self.no_data is None:
+            return np.ones(self.data_array.shape[1:], dtype=np.uint8)
+        valid = _valid_data_mask(self.data_array, self.no_data)
+        return cast(npt.NDArray[np.uint8], valid.view(np.uint8))
+
+    def data_extent(
+        self, mask: npt.NDArray[np.uint8]
+    ) -> Optional[Union[Polygon, MultiPolygon]]:
         """Produces the data footprint in the native CRS.
 
         Args:
@@ -306,9 +823,18 @@ class RasterFootprint:
                 nodata/data pixels.
 
         Returns:
-            Optional[Polygon]: A native CRS polygon of the convex hull of data
-            pixels.
+            Optional[Union[Polygon, MultiPolygon]]: A native CRS polygon of the
+            data pixels, as described by :attr:`footprint_mode`. Only
+            ``FootprintMode.OUTLINE`` can produce a MultiPolygon.
         """
+        if self.footprint_mode is FootprintMode.CONVEX_HULL:
+            return self._data_convex_hull(mask)
+        elif self.footprint_mode in (
+            FootprintMode.OUTLINE,
+            FootprintMode.CONCAVE_HULL,
+        ):
+            return self._data_outline(mask)
+
         data_polygons = [
             shape(polygon_dict)
             for polygon_dict, region_value in rasterio.features.shapes(
@@ -326,42 +852,143 @@ class RasterFootprint:
 
         return orient(polygon)
 
-    def densify_polygon(self, polygon: Polygon) -> Polygon:
+    def _data_convex_hull(self, mask: npt.NDArray[np.uint8]) -> Optional[Polygon]:
+        """Computes the convex hull of the data pixels from the outer corners of
+        the first and last data pixel of each row, transformed to the native
+        CRS in one batch."""
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size == 0:
+            return None
+        first = mask.argmax(axis=1)[rows]
+        last = mask.shape[1] - mask[:, ::-1].argmax(axis=1)[rows]
+        cols = np.concatenate((first, first, last, last))
+        rows = np.concatenate((rows, rows + 1, rows, rows + 1))
+        t = self.transform
+        points = np.column_stack(
+            (t.a * cols + t.b * rows + t.c, t.d * cols + t.e * rows + t.f)
+        )
+        return orient(shapely.convex_hull(shapely.multipoints(points)))
+
+    def _data_outline(
+        self, mask: npt.NDArray[np.uint8]
+    ) -> Optional[Union[Polygon, MultiPolygon]]:
+        """Computes the outline or concave hull of the data regions, after
+        closing the mask and dropping small holes and islands."""
+        if self.closing_size > 0:
+            mask = _binary_closing(mask, self.closing_size)
+        pixel_area = abs(self.transform.determinant)
+        min_island_area = (self.min_island_area or 0) * pixel_area
+        min_hole_area = (self.min_hole_area or 0) * pixel_area
+
+        polygons = []
+        for polygon_dict, region_value in rasterio.features.shapes(
+            mask, mask=mask, transform=self.transform
+        ):
+            polygon = shape(polygon_dict)
+            if region_value != 1 or polygon.area < min_island_area:
+                continue
+            if self.min_hole_area:
+                polygon = Polygon(
+                    polygon.exterior,
+                    [
+                        interior
+                        for interior in polygon.interiors
+                        if Polygon(interior).area >= min_hole_area
+                    ],
+                )
+            polygons.append(polygon)
+        if not polygons:
+            return None
+
+        outline = unary_union(polygons)
+        if self.footprint_mode is FootprintMode.CONCAVE_HULL:
+            hull = shapely.concave_hull(outline, ratio=self.concave_hull_ratio)
+            outline = _map_polygons(
+                unary_union([hull, outline]), lambda p: Polygon(p.exterior)
+            )
+        if self.outline_tolerance:
+            outline = outline.simplify(
+                self.outline_tolerance * math.sqrt(pixel_area), preserve_topology=True
+            )
+        return _orient(outline)
+
+    def densify_polygon(
+        self, polygon: Union[Polygon, MultiPolygon]
+    ) -> Union[Polygon, MultiPolygon]:
         """Adds vertices to the footprint polygon in the native CRS using
-        either ``self.densification_factor`` or
-        ``self.densification_distance``.
+        either ``self.densification_factor``,
+        ``self.densification_distance``, or
+        ``self.densification_tolerance``.
+
+        Holes are only kept with ``FootprintMode.OUTLINE``.
 
         Args:
-            polygon (Polygon): Footprint polygon in the native CRS.
+            polygon (Union[Polygon, MultiPolygon]): Footprint polygon in the
+                native CRS.
 
         Returns:
-            Polygon: Densified footprint polygon in the native CRS.
+            Union[Polygon, MultiPolygon]: Densified footprint polygon in the
+            native CRS.
         """
-        assert not (self.densification_factor and self.densification_distance)
         if self.densification_factor is not None:
-            return Polygon(
-                densify_by_factor(polygon.exterior.coords, self.densification_factor)
-            )
+            factor = self.densification_factor
+
+            def densify(ring: Any) -> Any:
+                return shapely.linearrings(
+                    densify_array_by_factor(shapely.get_coordinates(ring), factor)
+                )
+
         elif self.densification_distance is not None:
-            return Polygon(
-                densify_by_distance(
-                    polygon.exterior.coords, self.densification_distance
+            distance = self.densification_distance
+
+            def densify(ring: Any) -> Any:
+                return shapely.linearrings(
+                    densify_array_by_distance(shapely.get_coordinates(ring), distance)
                 )
-            )
+
+        elif self.densification_tolerance is not None:
+            tolerance = self.densification_tolerance
+
+            def densify(ring: Any) -> Any:
+                return shapely.linearrings(
+                    densify_array_by_reprojection_error(
+                        shapely.get_coordinates(ring),
+                        self.crs,
+                        self.dst_crs,
+                        tolerance,
+                    )
+                )
+
         else:
             return polygon
 
-    def reproject_polygon(self, polygon: Polygon) -> Polygon:
+        keep_holes = self.footprint_mode is FootprintMode.OUTLINE
+        return _map_polygons(
+            polygon,
+            lambda p: shapely.polygons(
+                densify(p.exterior),
+                (
+                    [densify(interior) for interior in p.interiors]
+                    if keep_holes and p.interiors
+                    else None
+                ),
+            ),
+        )
+
+    def reproject_polygon(
+        self, polygon: Union[Polygon, MultiPolygon]
+    ) -> Union[Polygon, MultiPolygon]:
         """Projects a polygon and rounds the projected vertex coordinates to
         ``self.precision``.
 
         Duplicate points caused by rounding are removed.
 
         Args:
-            polygon (Polygon): Footprint polygon in the native CRS.
+            polygon (Union[Polygon, MultiPolygon]): Footprint polygon in the
+                native CRS.
 
         Returns:
-            Polygon: Footprint polygon in 'dst_crs'.
+            Union[Polygon, MultiPolygon]: Footprint polygon in 'dst_crs'.
         """
         return reproject_shape(
             src_crs=self.crs,
@@ -370,19 +997,32 @@ class RasterFootprint:
             precision=self.precision,
         )
 
-    def simplify_polygon(self, polygon: Polygon) -> Polygon:
+    def simplify_polygon(
+        self, polygon: Union[Polygon, MultiPolygon]
+    ) -> Union[Polygon, MultiPolygon]:
         """Reduces the number of polygon vertices such that the simplified
         polygon shape is no further away than the original polygon vertices
         than ``self.simplify_tolerance``.
 
+        If ``self.max_vertices`` is set, the tolerance is instead searched for
+        the simplest polygon within the vertex budget that covers the original
+        polygon.
+
         Args:
-            polygon (Polygon): Polygon to be simplified.
+            polygon (Union[Polygon, MultiPolygon]): Polygon to be simplified.
 
         Returns:
-            Polygon: Reduced vertex polygon.
+            Union[Polygon, MultiPolygon]: Reduced vertex polygon.
         """
+        if self.max_vertices is not None:
+            return _simplify_to_max_vertices(
+                polygon,
+                self.max_vertices,
+                self.simplify_tolerance or 0.0,
+                self.precision,
+            )
         if self.simplify_tolerance is not None:
-            return orient(
+            return _orient(
                 polygon.simplify(
                     tolerance=self.simplify_tolerance, preserve_topology=False
                 )
@@ -398,9 +1038,21 @@ class RasterFootprint:
         precision: int = DEFAULT_PRECISION,
         densification_factor: Optional[int] = None,
         densification_distance: Optional[float] = None,
+        densification_tolerance: Optional[float] = None,
         simplify_tolerance: Optional[float] = None,
         no_data: Optional[Union[int, float]] = None,
         bands: List[int] = [1],
+        windowed: bool = False,
+        max_pixels: Optional[int] = None,
+        max_error: Optional[float] = None,
+        mask_source: MaskSource = MaskSource.NODATA,
+        footprint_mode: FootprintMode = FootprintMode.POLYGONIZE,
+        concave_hull_ratio: float = 0.5,
+        min_hole_area: Optional[float] = None,
+        min_island_area: Optional[float] = None,
+        closing_size: int = 0,
+        outline_tolerance: Optional[float] = None,
+        max_vertices: Optional[int] = None,
     ) -> T:
         """Produces a :class:`RasterFootprint` instance from an image href.
 
@@ -427,6 +1079,12 @@ class RasterFootprint:
                 vertices would be created along the segment. Higher densities
                 produce higher fidelity footprints in areas of high projection
                 distortion.  Mutually exclusive with ``densification_factor``.
+            densification_tolerance (Optional[float]): The maximum distance, in
+                ``dst_crs`` units, between a reprojected footprint edge and the
+                straight line between its reprojected vertices. Edges are
+                bisected only where needed, which adds the fewest vertices for
+                that accuracy. Mutually exclusive with ``densification_factor``
+                and ``densification_distance``.
             simplify_tolerance (Optional[float]): Distance, in degrees, within
                 which all locations on the simplified polygon will be to the
                 original polygon.
@@ -437,6 +1095,43 @@ class RasterFootprint:
                 Defaults to [1]. If an empty list is provided, the bands will be
                 ORd together; e.g., for a pixel to be outside of the footprint,
                 all bands must have nodata in that pixel.
+            windowed (bool): If True, build the data mask one internal block
+                window at a time instead of reading the full bands, so peak
+                memory is bounded by the block size rather than the image
+                size. Defaults to False.
+            max_pixels (Optional[int]): If set, compute the data mask from a
+                decimated read of the raster (an overview level, when the dataset
+                has overviews) with at most this many pixels. The approximate
+                error introduced is available as
+                :attr:`RasterFootprint.error_bound`.
+            max_error (Optional[float]): If set, compute the data mask from the
+                coarsest decimated read whose pixel diagonal, converted to
+                ``dst_crs`` units, does not exceed this value. Takes precedence
+                over ``max_pixels`` if both are set.
+            mask_source (MaskSource): Where to get the valid data mask from; see
+                :class:`MaskSource`. Defaults to comparing pixel values against
+                ``no_data``.
+            footprint_mode (FootprintMode): How the footprint is derived from the
+                data mask; see :class:`FootprintMode`. Defaults to
+                ``FootprintMode.POLYGONIZE``.
+            concave_hull_ratio (float): With ``FootprintMode.CONCAVE_HULL``, the
+                concave hull ratio between 0 (most concave) and 1 (convex hull).
+                Defaults to 0.5.
+            min_hole_area (Optional[float]): With ``FootprintMode.OUTLINE``, holes
+                in the data outline smaller than this area, in pixels, are filled.
+            min_island_area (Optional[float]): With ``FootprintMode.OUTLINE`` or
+                ``FootprintMode.CONCAVE_HULL``, data regions smaller than this
+                area, in pixels, are dropped.
+            closing_size (int): The size, in pixels, of a morphological closing
+                applied to the data mask before it is outlined, to merge speckle
+                and close narrow gaps. Defaults to 0, no closing.
+            outline_tolerance (Optional[float]): Tolerance, in pixels, for
+                simplifying the data outline in the native CRS before
+                densification and reprojection.
+            max_vertices (Optional[int]): The maximum number of coordinates in the
+                final footprint. The footprint is simplified with the smallest
+                tolerance, no smaller than ``simplify_tolerance``, that meets the
+                budget, and is guaranteed to cover the unsimplified footprint.
 
         Returns:
             RasterFootprint: A :class:`RasterFootprint` instance.
@@ -450,7 +1145,19 @@ class RasterFootprint:
                 precision=precision,
                 densification_factor=densification_factor,
                 densification_distance=densification_distance,
+                densification_tolerance=densification_tolerance,
                 simplify_tolerance=simplify_tolerance,
+                windowed=windowed,
+                max_pixels=max_pixels,
+                max_error=max_error,
+                mask_source=mask_source,
+                footprint_mode=footprint_mode,
+                concave_hull_ratio=concave_hull_ratio,
+                min_hole_area=min_hole_area,
+                min_island_area=min_island_area,
+                closing_size=closing_size,
+                outline_tolerance=outline_tolerance,
+                max_vertices=max_vertices,
             )
 
     @classmethod
@@ -462,9 +1169,21 @@ class RasterFootprint:
         precision: int = DEFAULT_PRECISION,
         densification_factor: Optional[int] = None,
         densification_distance: Optional[float] = None,
+        densification_tolerance: Optional[float] = None,
         simplify_tolerance: Optional[float] = None,
         no_data: Optional[Union[int, float]] = None,
         bands: List[int] = [1],
+        windowed: bool = False,
+        max_pixels: Optional[int] = None,
+        max_error: Optional[float] = None,
+        mask_source: MaskSource = MaskSource.NODATA,
+        footprint_mode: FootprintMode = FootprintMode.POLYGONIZE,
+        concave_hull_ratio: float = 0.5,
+        min_hole_area: Optional[float] = None,
+        min_island_area: Optional[float] = None,
+        closing_size: int = 0,
+        outline_tolerance: Optional[float] = None,
+        max_vertices: Optional[int] = None,
     ) -> T:
         """Produces a :class:`RasterFootprint` instance from a
         :class:`rasterio.io.DatasetReader`  object, i.e., an opened dataset
@@ -492,6 +1211,12 @@ class RasterFootprint:
                 vertices would be created along the segment. Higher densities
                 produce higher fidelity footprints in areas of high projection
                 distortion.  Mutually exclusive with ``densification_factor``.
+            densification_tolerance (Optional[float]): The maximum distance, in
+                ``dst_crs`` units, between a reprojected footprint edge and the
+                straight line between its reprojected vertices. Edges are
+                bisected only where needed, which adds the fewest vertices for
+                that accuracy. Mutually exclusive with ``densification_factor``
+                and ``densification_distance``.
             simplify_tolerance (Optional[float]): Distance, in degrees, within
                 which all locations on the simplified polygon will be to the
                 original polygon.
@@ -502,6 +1227,43 @@ class RasterFootprint:
                 Defaults to [1]. If an empty list is provided, the bands will be
                 ORd together; e.g., for a pixel to be outside of the footprint,
                 all bands must have nodata in that pixel.
+            windowed (bool): If True, build the data mask one internal block
+                window at a time instead of reading the full bands, so peak
+                memory is bounded by the block size rather than the image
+                size. Defaults to False.
+            max_pixels (Optional[int]): If set, compute the data mask from a
+                decimated read of the raster (an overview level, when the dataset
+                has overviews) with at most this many pixels. The approximate
+                error introduced is available as
+                :attr:`RasterFootprint.error_bound`.
+            max_error (Optional[float]): If set, compute the data mask from the
+                coarsest decimated read whose pixel diagonal, converted to
+                ``dst_crs`` units, does not exceed this value. Takes precedence
+                over ``max_pixels`` if both are set.
+            mask_source (MaskSource): Where to get the valid data mask from; see
+                :class:`MaskSource`. Defaults to comparing pixel values against
+                ``no_data``.
+            footprint_mode (FootprintMode): How the footprint is derived from the
+                data mask; see :class:`FootprintMode`. Defaults to
+                ``FootprintMode.POLYGONIZE``.
+            concave_hull_ratio (float): With ``FootprintMode.CONCAVE_HULL``, the
+                concave hull ratio between 0 (most concave) and 1 (convex hull).
+                Defaults to 0.5.
+            min_hole_area (Optional[float]): With ``FootprintMode.OUTLINE``, holes
+                in the data outline smaller than this area, in pixels, are filled.
+            min_island_area (Optional[float]): With ``FootprintMode.OUTLINE`` or
+                ``FootprintMode.CONCAVE_HULL``, data regions smaller than this
+                area, in pixels, are dropped.
+            closing_size (int): The size, in pixels, of a morphological closing
+                applied to the data mask before it is outlined, to merge speckle
+                and close narrow gaps. Defaults to 0, no closing.
+            outline_tolerance (Optional[float]): Tolerance, in pixels, for
+                simplifying the data outline in the native CRS before
+                densification and reprojection.
+            max_vertices (Optional[int]): The maximum number of coordinates in the
+                final footprint. The footprint is simplified with the smallest
+                tolerance, no smaller than ``simplify_tolerance``, that meets the
+                budget, and is guaranteed to cover the unsimplified footprint.
 
         Returns:
             RasterFootprint: A :class:`RasterFootprint` instance.
@@ -515,24 +1277,71 @@ class RasterFootprint:
 
         if not bands:
             bands = reader.indexes
+
+        decimation = 1
+        if max_pixels is not None or max_error is not None:
+            scale = _dst_units_per_src_unit(reader, dst_crs)
+            decimation = _decimation_factor(
+                reader, bands[0], max_pixels, max_error, scale
+            )
+
+        transform = reader.transform
+        out_shape = None
+        if decimation > 1:
+            out_shape = (
+                math.ceil(reader.height / decimation),
+                math.ceil(reader.width / decimation),
+            )
+            x_scale = reader.width / out_shape[1]
+            y_scale = reader.height / out_shape[0]
+            transform = Affine(
+                transform.a * x_scale,
+                transform.b * y_scale,
+                transform.c,
+                transform.d * x_scale,
+                transform.e * y_scale,
+                transform.f,
+            )
+
+        mask_source = _resolve_mask_source(reader, bands, no_data, mask_source)
         if no_data is None:
             no_data = reader.nodata
+        if mask_source is MaskSource.NODATA and out_shape is None and not windowed:
+            band_data = []
+            for index in bands:
+                band_data.append(reader.read(index))
+            data_array = np.asarray(band_data)
+        else:
+            data_array = _read_data_mask(
+                reader, bands, no_data, mask_source, windowed, out_shape
+            )
+            no_data = 0
 
-        band_data = []
-        for index in bands:
-            band_data.append(reader.read(index))
-
-        return cls(
-            data_array=np.asarray(band_data),
+        footprint = cls(
+            data_array=data_array,
             crs=reader.crs,
             dst_crs=dst_crs,
-            transform=reader.transform,
+            transform=transform,
             no_data=no_data,
             precision=precision,
             densification_factor=densification_factor,
             densification_distance=densification_distance,
+            densification_tolerance=densification_tolerance,
             simplify_tolerance=simplify_tolerance,
+            footprint_mode=footprint_mode,
+            concave_hull_ratio=concave_hull_ratio,
+            min_hole_area=min_hole_area,
+            min_island_area=min_island_area,
+            closing_size=closing_size,
+            outline_tolerance=outline_tolerance,
+            max_vertices=max_vertices,
         )
+        if decimation > 1:
+            footprint.error_bound = scale * max(
+                math.hypot(transform.a + transform.b, transform.d + transform.e),
+                math.hypot(transform.a - transform.b, transform.d - transform.e),
+            )
+        return footprint
 
     @classmethod
     def update_geometry_from_asset_footprint(
@@ -544,11 +1353,25 @@ class RasterFootprint:
         precision: int = DEFAULT_PRECISION,
         densification_factor: Optional[int] = None,
         densification_distance: Optional[float] = None,
+        densification_tolerance: Optional[float] = None,
         simplify_tolerance: Optional[float] = None,
         no_data: Optional[Union[int, float]] = None,
         bands: List[int] = [1],
+        windowed: bool = False,
+        max_pixels: Optional[int] = None,
+        max_error: Optional[float] = None,
+        mask_source: MaskSource = MaskSource.NODATA,
+        footprint_mode: FootprintMode = FootprintMode.POLYGONIZE,
+        concave_hull_ratio: float = 0.5,
+        min_hole_area: Optional[float] = None,
+        min_island_area: Optional[float] = None,
+        closing_size: int = 0,
+        outline_tolerance: Optional[float] = None,
+        max_vertices: Optional[int] = None,
         skip_errors: bool = True,
         footprint_merge_strategy: FootprintMergeStrategy = FootprintMergeStrategy.FIRST,
+        max_asset_workers: Optional[int] = None,
+        cache: Optional[FootprintCache] = None,
     ) -> bool:
         """Accepts an Item and an optional list of asset names within that
         Item, and updates the geometry of that Item in-place with the data
@@ -583,6 +1406,12 @@ class RasterFootprint:
                 vertices would be created along the segment. Higher densities
                 produce higher fidelity footprints in areas of high projection
                 distortion.  Mutually exclusive with ``densification_factor``.
+            densification_tolerance (Optional[float]): The maximum distance, in
+                ``dst_crs`` units, between a reprojected footprint edge and the
+                straight line between its reprojected vertices. Edges are
+                bisected only where needed, which adds the fewest vertices for
+                that accuracy. Mutually exclusive with ``densification_factor``
+                and ``densification_distance``.
             simplify_tolerance (Optional[float]): Distance, in degrees, within which
                 all locations on the simplified polygon will be to the original
                 polygon.
@@ -593,12 +1422,58 @@ class RasterFootprint:
                 Defaults to [1]. If an empty list is provided, the bands will be ORd
                 together; e.g., for a pixel to be outside of the footprint, all
                 bands must have nodata in that pixel.
+            windowed (bool): If True, build the data mask one internal block
+                window at a time instead of reading the full bands, so peak
+                memory is bounded by the block size rather than the image
+                size. Defaults to False.
+            max_pixels (Optional[int]): If set, compute the data mask from a
+                decimated read of the raster (an overview level, when the dataset
+                has overviews) with at most this many pixels. The approximate
+                error introduced is available as
+                :attr:`RasterFootprint.error_bound`.
+            max_error (Optional[float]): If set, compute the data mask from the
+                coarsest decimated read whose pixel diagonal, converted to
+                ``dst_crs`` units, does not exceed this value. Takes precedence
+                over ``max_pixels`` if both are set.
+            mask_source (MaskSource): Where to get the valid data mask from; see
+                :class:`MaskSource`. Defaults to comparing pixel values against
+                ``no_data``.
+            footprint_mode (FootprintMode): How the footprint is derived from the
+                data mask; see :class:`FootprintMode`. Defaults to
+                ``FootprintMode.POLYGONIZE``.
+            concave_hull_ratio (float): With ``FootprintMode.CONCAVE_HULL``, the
+                concave hull ratio between 0 (most concave) and 1 (convex hull).
+                Defaults to 0.5.
+            min_hole_area (Optional[float]): With ``FootprintMode.OUTLINE``, holes
+                in the data outline smaller than this area, in pixels, are filled.
+            min_island_area (Optional[float]): With ``FootprintMode.OUTLINE`` or
+                ``FootprintMode.CONCAVE_HULL``, data regions smaller than this
+                area, in pixels, are dropped.
+            closing_size (int): The size, in pixels, of a morphological closing
+                applied to the data mask before it is outlined, to merge speckle
+                and close narrow gaps. Defaults to 0, no closing.
+            outline_tolerance (Optional[float]): Tolerance, in pixels, for
+                simplifying the data outline in the native CRS before
+                densification and reprojection.
+            max_vertices (Optional[int]): The maximum number of coordinates in the
+                final footprint. The footprint is simplified with the smallest
+                tolerance, no smaller than ``simplify_tolerance``, that meets the
+                budget, and is guaranteed to cover the unsimplified footprint.
             skip_errors (bool): If False, raise an error for a missing href or
                 footprint calculation failure.
             footprint_aggregator (FootprintMergeStrategy): Provides a
                 means to control how the footprints of assets are aggregated;
                 see :class:`FootprintMergeStrategy` for details; defaults to using
                 the `FIRST` strategy
+            max_asset_workers (Optional[int]): If set, open and mask the assets
+                concurrently in a thread pool with this many workers. With the
+                `FIRST` strategy, outstanding work is cancelled once the first
+                footprint is available. Defaults to None, processing the assets
+                sequentially.
+            cache (Optional[FootprintCache]): If set, look up asset footprints
+                in this cache before reading the assets, and store newly
+                computed footprints in it; see
+                :mod:`~stactools.core.utils.footprint_cache`.
 
         Returns:
             bool: True if the Item geometry was successfully updated, False if not.
@@ -610,14 +1485,29 @@ class RasterFootprint:
             precision=precision,
             densification_factor=densification_factor,
             densification_distance=densification_distance,
+            densification_tolerance=densification_tolerance,
             simplify_tolerance=simplify_tolerance,
             no_data=no_data,
             bands=bands,
+            windowed=windowed,
+            max_pixels=max_pixels,
+            max_error=max_error,
+            mask_source=mask_source,
+            footprint_mode=footprint_mode,
+            concave_hull_ratio=concave_hull_ratio,
+            min_hole_area=min_hole_area,
+            min_island_area=min_island_area,
+            closing_size=closing_size,
+            outline_tolerance=outline_tolerance,
+            max_vertices=max_vertices,
             skip_errors=skip_errors,
+            max_asset_workers=max_asset_workers,
+            cache=cache,
         )
 
         if footprint_merge_strategy == FootprintMergeStrategy.FIRST:
             asset_name_extent = next(asset_extent_iterator, None)
+            asset_extent_iterator.close()
             if asset_name_extent is None:
                 return False
             _, extent = asset_name_extent
@@ -637,6 +1527,66 @@ class RasterFootprint:
         item.bbox = list(shape(extent).bounds)
         return True
 
+    @classmethod
+    def update_geometries(
+        cls,
+        items: Iterable[Item],
+        *,
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        **kwargs: Any,
+    ) -> List[bool]:
+        """Updates the geometries and bboxes of many Items in-place with the
+        data footprints of their assets, processing the Items concurrently.
+
+        See :meth:`update_geometry_from_asset_footprint` for details on how the
+        geometry of each Item is updated.
+
+        Args:
+            items (Iterable[Item]): The PySTAC Items to update.
+            max_workers (Optional[int]): The maximum number of concurrent
+                workers. Defaults to the executor's default.
+            executor (str): Either ``"thread"`` (the default) or
+                ``"process"``. GDAL releases the GIL while reading, so threads
+                are usually enough for I/O bound reads; processes also
+                parallelize the CPU bound parts of the footprint calculation.
+            **kwargs: Keyword arguments passed to
+                :meth:`update_geometry_from_asset_footprint`.
+
+        Returns:
+            List[bool]: For each Item, in order, True if its geometry was
+            successfully updated, False if not.
+        """
+        items = list(items)
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(
+                    pool.map(
+                        functools.partial(
+                            cls.update_geometry_from_asset_footprint, **kwargs
+                        ),
+                        items,
+                    )
+                )
+        elif executor == "process":
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = list(
+                    pool.map(
+                        functools.partial(_update_geometry_in_process, cls, kwargs),
+                        [item.to_dict(transform_hrefs=False) for item in items],
+                        [item.get_self_href() for item in items],
+                    )
+                )
+            for item, (success, geometry, bbox) in zip(items, results):
+                if success:
+                    item.geometry = geometry
+                    item.bbox = bbox
+            return [success for success, _, _ in results]
+        else:
+            raise ValueError(
+                f"Unrecognized executor: {executor!r}, expected 'thread' or 'process'"
+            )
+
     @classmethod
     def data_footprints_for_data_assets(
         cls,
@@ -647,11 +1597,25 @@ class RasterFootprint:
         precision: int = DEFAULT_PRECISION,
         densification_factor: Optional[int] = None,
         densification_distance: Optional[float] = None,
+        densification_tolerance: Optional[float] = None,
         simplify_tolerance: Optional[float] = None,
         no_data: Optional[Union[int, float]] = None,
         bands: List[int] = [1],
+        windowed: bool = False,
+        max_pixels: Optional[int] = None,
+        max_error: Optional[float] = None,
+        mask_source: MaskSource = MaskSource.NODATA,
+        footprint_mode: FootprintMode = FootprintMode.POLYGONIZE,
+        concave_hull_ratio: float = 0.5,
+        min_hole_area: Optional[float] = None,
+        min_island_area: Optional[float] = None,
+        closing_size: int = 0,
+        outline_tolerance: Optional[float] = None,
+        max_vertices: Optional[int] = None,
         skip_errors: bool = True,
-    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        max_asset_workers: Optional[int] = None,
+        cache: Optional[FootprintCache] = None,
+    ) -> Generator[Tuple[str, Dict[str, Any]], None, None]:
         """Accepts an Item and an optional list of asset names within that
         Item, and produces an iterator over the same asset names (if they
         exist) and dictionaries representing GeoJSON Polygons of the data
@@ -684,6 +1648,12 @@ class RasterFootprint:
                 vertices would be created along the segment. Higher densities
                 produce higher fidelity footprints in areas of high projection
                 distortion.  Mutually exclusive with ``densification_factor``.
+            densification_tolerance (Optional[float]): The maximum distance, in
+                ``dst_crs`` units, between a reprojected footprint edge and the
+                straight line between its reprojected vertices. Edges are
+                bisected only where needed, which adds the fewest vertices for
+                that accuracy. Mutually exclusive with ``densification_factor``
+                and ``densification_distance``.
             simplify_tolerance (Optional[float]): Distance, in degrees, within which
                 all locations on the simplified polygon will be to the original
                 polygon.
@@ -694,8 +1664,55 @@ class RasterFootprint:
                 Defaults to [1]. If an empty list is provided, the bands will be ORd
                 together; e.g., for a pixel to be outside of the footprint, all
                 bands must have nodata in that pixel.
+            windowed (bool): If True, build the data mask one internal block
+                window at a time instead of reading the full bands, so peak
+                memory is bounded by the block size rather than the image
+                size. Defaults to False.
+            max_pixels (Optional[int]): If set, compute the data mask from a
+                decimated read of the raster (an overview level, when the dataset
+                has overviews) with at most this many pixels. The approximate
+                error introduced is available as
+                :attr:`RasterFootprint.error_bound`.
+            max_error (Optional[float]): If set, compute the data mask from the
+                coarsest decimated read whose pixel diagonal, converted to
+                ``dst_crs`` units, does not exceed this value. Takes precedence
+                over ``max_pixels`` if both are set.
+            mask_source (MaskSource): Where to get the valid data mask from; see
+                :class:`MaskSource`. Defaults to comparing pixel values against
+                ``no_data``.
+            footprint_mode (FootprintMode): How the footprint is derived from the
+                data mask; see :class:`FootprintMode`. Defaults to
+                ``FootprintMode.POLYGONIZE``.
+            concave_hull_ratio (float): With ``FootprintMode.CONCAVE_HULL``, the
+                concave hull ratio between 0 (most concave) and 1 (convex hull).
+                Defaults to 0.5.
+            min_hole_area (Optional[float]): With ``FootprintMode.OUTLINE``, holes
+                in the data outline smaller than this area, in pixels, are filled.
+            min_island_area (Optional[float]): With ``FootprintMode.OUTLINE`` or
+                ``FootprintMode.CONCAVE_HULL``, data regions smaller than this
+                area, in pixels, are dropped.
+            closing_size (int): The size, in pixels, of a morphological closing
+                applied to the data mask before it is outlined, to merge speckle
+                and close narrow gaps. Defaults to 0, no closing.
+            outline_tolerance (Optional[float]): Tolerance, in pixels, for
+                simplifying the data outline in the native CRS before
+                densification and reprojection.
+            max_vertices (Optional[int]): The maximum number of coordinates in the
+                final footprint. The footprint is simplified with the smallest
+                tolerance, no smaller than ``simplify_tolerance``, that meets the
+                budget, and is guaranteed to cover the unsimplified footprint.
             skip_errors (bool): If False, raise an error for a missing href or
                 footprint calculation failure.
+            max_asset_workers (Optional[int]): If set, open and mask the assets
+                concurrently in a thread pool with this many workers, at most
+                this many assets ahead of the one being yielded. Footprints
+                are still yielded in asset order. When the iterator is closed,
+                queued assets are cancelled and assets being read are waited
+                for. Defaults to None, processing the assets sequentially.
+            cache (Optional[FootprintCache]): If set, look up asset footprints
+                in this cache before reading the assets, and store newly
+                computed footprints in it; see
+                :mod:`~stactools.core.utils.footprint_cache`.
 
         Returns:
             Iterator[Tuple[str, Dict[str, Any]]]: Iterator of the asset name and
@@ -709,28 +1726,96 @@ class RasterFootprint:
             else:
                 raise Exception(message)
 
-        for name, asset in item.assets.items():
-            if not asset_names or name in asset_names:
-                href = asset.get_absolute_href()
+        parameters: Dict[str, Any] = dict(
+            dst_crs=dst_crs,
+            no_data=no_data,
+            bands=bands,
+            precision=precision,
+            densification_factor=densification_factor,
+            densification_distance=densification_distance,
+            densification_tolerance=densification_tolerance,
+            simplify_tolerance=simplify_tolerance,
+            windowed=windowed,
+            max_pixels=max_pixels,
+            max_error=max_error,
+            mask_source=mask_source,
+            footprint_mode=footprint_mode,
+            concave_hull_ratio=concave_hull_ratio,
+            min_hole_area=min_hole_area,
+            min_island_area=min_island_area,
+            closing_size=closing_size,
+            outline_tolerance=outline_tolerance,
+            max_vertices=max_vertices,
+        )
+
+        def footprint(href: str) -> Optional[Dict[str, Any]]:
+            if cache is None:
+                return cls.from_href(href=href, **parameters).footprint()
+            key = cache.key(href, parameters)
+            extent = cache.get(key)
+            if extent is None:
+                extent = cls.from_href(href=href, **parameters).footprint()
+                if extent is not None:
+                    cache.set(key, extent)
+            return extent
+
+        hrefs = [
+            (name, asset.get_absolute_href())
+            for name, asset in item.assets.items()
+            if not asset_names or name in asset_names
+        ]
+        pool = None
+        pending = deque((name, href) for name, href in hrefs if href is not None)
+        futures: Dict[str, Future[Optional[Dict[str, Any]]]] = {}
+
+        def submit_ahead() -> None:
+            assert pool is not None and max_asset_workers is not None
+            while pending and len(futures) < max_asset_workers:
+                name, href = pending.popleft()
+                futures[name] = pool.submit(footprint, href)
+
+        if max_asset_workers is not None:
+            pool = ThreadPoolExecutor(max_workers=max_asset_workers)
+            submit_ahead()
+
+        try:
+            for name, href in hrefs:
                 if href is None:
                     handle_error(
                         f"Could not determine extent for asset '{name}', missing href"
                     )
                 else:
-                    extent = cls.from_href(
-                        href=href,
-                        dst_crs=dst_crs,
-                        no_data=no_data,
-                        bands=bands,
-                        precision=precision,
-                        densification_factor=densification_factor,
-                        densification_distance=densification_distance,
-                        simplify_tolerance=simplify_tolerance,
-                    ).footprint()
+                    if pool is not None:
+                        future = futures.pop(name)
+                        submit_ahead()
+                        extent = future.result()
+                    else:
+                        extent = footprint(href)
                     if extent:
                         yield name, extent
                     else:
                         handle_error(f"Could not determine extent for asset '{name}'")
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _update_geometry_in_process(
+    cls: Type[RasterFootprint],
+    kwargs: Dict[str, Any],
+    item_dict: Dict[str, Any],
+    self_href: Optional[str],
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[List[float]]]:
+    """Worker for :meth:`RasterFootprint.update_geometries` in a process pool.
+
+    Items are sent as dictionaries, rather than pickled with their parent
+    catalogs, and only the updated geometry and bbox are sent back.
+    """
+    item = Item.from_dict(item_dict)
+    if self_href is not None:
+        item.set_self_href(self_href)
+    success = cls.update_geometry_from_asset_footprint(item, **kwargs)
+    return success, item.geometry, item.bbox
 
 
 def update_geometry_from_asset_footprint(
@@ -1,5 +1,7 @@
-from typing import Any, List, TypeVar
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple, TypeVar
 
+import numpy as np
 from pystac import Collection, Item
 
 # Roughly 1 centimeter in geodetic coordinates
@@ -36,11 +38,60 @@ def round_coordinates(stac_object: S, precision: int = DEFAULT_PRECISION) -> S:
     return stac_object
 
 
+def round_coordinates_many(
+    stac_objects: Iterable[S], precision: int = DEFAULT_PRECISION
+) -> List[S]:
+    """Rounds the coordinates of many Items and Collections, as
+    :func:`round_coordinates` does for one.
+
+    The bboxes of all objects are rounded together, in one array operation per
+    bbox dimension.
+
+    Args:
+        stac_objects (Iterable[S]): PySTAC Items or Collections, e.g. from
+            ``catalog.get_items(recursive=True)``.
+        precision (int): Number of decimal places for rounding.
+
+    Returns:
+        List[S]: The original PySTAC Items and Collections, with rounded
+        coordinates.
+    """
+    stac_objects = list(stac_objects)
+    bboxes: Dict[int, List[Tuple[Any, int]]] = defaultdict(list)
+    for stac_object in stac_objects:
+        if isinstance(stac_object, Item):
+            if stac_object.geometry is not None:
+                stac_object.geometry["coordinates"] = recursive_round(
+                    list(stac_object.geometry["coordinates"]), precision
+                )
+            if stac_object.bbox is not None:
+                bboxes[len(stac_object.bbox)].append((stac_object, -1))
+        elif isinstance(stac_object, Collection):
+            for index, bbox in enumerate(stac_object.extent.spatial.bboxes):
+                bboxes[len(bbox)].append((stac_object, index))
+
+    for length, owners in bboxes.items():
+        originals = [
+            owner.bbox if index < 0 else owner.extent.spatial.bboxes[index]
+            for owner, index in owners
+        ]
+        values = np.array(originals)
+        rounded = _round_array(values, precision, originals)
+        for (owner, index), bbox in zip(owners, rounded):
+            if index < 0:
+                owner.bbox = bbox
+            else:
+                owner.extent.spatial.bboxes[index] = bbox
+    return stac_objects
+
+
 def recursive_round(coordinates: List[Any], precision: int) -> List[Any]:
     """Rounds a list of numbers. The list can contain additional nested lists
     or tuples of numbers.
 
-    Any tuples encountered will be converted to lists.
+    Any tuples encountered will be converted to lists. Each regularly shaped
+    (sub)list, e.g. a ring of coordinates, is rounded in a single array
+    operation.
 
     Args:
         coordinates (List[Any]): A list of numbers, possibly containing nested
@@ -51,10 +102,62 @@ def recursive_round(coordinates: List[Any], precision: int) -> List[Any]:
         List[Any]: a list (possibly nested) of numbers rounded to the given
             precision.
     """
-    for idx, value in enumerate(coordinates):
-        if isinstance(value, (int, float)):
-            coordinates[idx] = round(value, precision)
-        else:
-            coordinates[idx] = list(value)  # handle any tuples
-            coordinates[idx] = recursive_round(coordinates[idx], precision)
+    coordinates[:] = _round_nested(coordinates, precision)
     return coordinates
+
+
+def _round_nested(coordinates: Any, precision: int) -> Any:
+    if isinstance(coordinates, (int, float)):
+        return round(coordinates, precision)
+    try:
+        values = np.asarray(coordinates)
+    except ValueError:  # ragged, e.g. rings of different lengths
+        values = None
+    if values is not None and values.dtype.kind in "iuf":
+        return _round_array(values, precision, coordinates)
+    return [_round_nested(value, precision) for value in coordinates]
+
+
+def _round_array(values: Any, precision: int, coordinates: Any = None) -> List[Any]:
+    """Rounds an array of values converted from ``coordinates``, with the
+    results of Python's ``round``.
+
+    Values are scaled, rounded to integers, and scaled back in array
+    operations. The rounding error of the scaling can only change the result
+    for values within an ulp of a tie, e.g. 2.675 to 2 decimal places, so
+    those, and values too large for the scaling to be exact, are rounded with
+    ``round`` instead. So are integral values, because ``np.asarray`` converts
+    the ints of a list that mixes ints and floats to floats, and ``round``
+    keeps them ints.
+    """
+    if values.dtype.kind in "iu" and precision >= 0:
+        ints: List[Any] = values.tolist()
+        return ints
+    if coordinates is None:
+        coordinates = values.tolist()
+    if values.dtype.kind == "f" and abs(precision) <= 22:
+        scale = 10.0 ** abs(precision)
+        with np.errstate(over="ignore", invalid="ignore"):
+            scaled = values * scale if precision >= 0 else values / scale
+            integers = np.rint(scaled)
+            rounded: List[Any] = (
+                integers / scale if precision >= 0 else integers * scale
+            ).tolist()
+            inexact = (
+                (np.abs(scaled) >= 2.0**52)
+                | (
+                    np.abs(scaled - np.floor(scaled) - 0.5)
+                    <= np.abs(np.spacing(scaled))
+                )
+                | (values == np.floor(values))
+            )
+        indexes: Iterable[Tuple[int, ...]] = zip(*np.nonzero(inexact))
+    else:
+        rounded = values.tolist()
+        indexes = np.ndindex(values.shape)
+    for index in indexes:
+        original, target = coordinates, rounded
+        for i in index[:-1]:
+            original, target = original[i], target[i]
+        target[index[-1]] = round(original[index[-1]], precision)
+    return rounded
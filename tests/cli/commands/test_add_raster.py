@@ -25,3 +25,53 @@ def test_add_raster_to_items(tmp_planet_disaster: pystac.Collection):
     expected = expected_json("rasterbands.json")
     for a, b in zip(expected, asset.to_dict().get("raster:bands")):
         assert a == b
+
+
+def test_add_raster_to_catalog(tmp_planet_disaster: pystac.Collection, tmp_path):
+    collection_path = tmp_planet_disaster.get_self_href()
+    state_file = str(tmp_path / "state.jsonl")
+
+    runner = CliRunner()
+    args = ["add-raster", collection_path, "--state-file", state_file, "-w", "2"]
+    result = runner.invoke(cli, args + ["--batch-size", "1"])
+    assert result.exit_code == 0, result.output
+    assert "Added raster bands to 5 items, skipped 0" in result.output
+
+    updated = pystac.read_file(collection_path)
+    expected = expected_json("rasterbands.json")
+    for item in updated.get_items(recursive=True):
+        assert item.get_self_href() is not None
+        for asset in item.assets.values():
+            if asset.roles and "data" in asset.roles:
+                assert "raster:bands" in asset.extra_fields
+    with open(state_file) as f:
+        assert len(f.readlines()) == 5
+
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "Added raster bands to 0 items, skipped 5" in result.output
+
+    item = next(
+        item for item in updated.get_items(recursive=True) if "analytic" in item.assets
+    )
+    asset = item.assets["analytic"]
+    assert asset.to_dict()["raster:bands"] == expected
+    del asset.extra_fields["raster:bands"]
+    item.save_object(include_self_link=False)
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "Added raster bands to 1 items, skipped 4" in result.output
+
+
+def test_add_raster_to_catalog_resume(tmp_planet_disaster: pystac.Collection, tmp_path):
+    collection_path = tmp_planet_disaster.get_self_href()
+    state_file = str(tmp_path / "state.jsonl")
+    item = next(tmp_planet_disaster.get_items(recursive=True))
+    with open(state_file, "w") as f:
+        f.write('{"href": "%s", "fingerprint": "stale"}\n' % item.get_self_href())
+
+    runner = CliRunner()
+    args = ["add-raster", collection_path, "--state-file", state_file]
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "Added raster bands to 5 items, skipped 0" in result.output
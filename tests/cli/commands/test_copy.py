@@ -151,3 +151,49 @@ def test_copy_collection_with_assets(tmp_path: Path) -> None:
     assert result.exit_code == 0
 
     assert (tmp_path / "sentinel-2" / "metadata.xml").exists()
+
+
+def test_move_assets_plan(tmp_path: Path, planet_disaster: pystac.Collection) -> None:
+    cat = planet_disaster
+    cat.normalize_hrefs(str(tmp_path / "catalog"))
+    cat.save(catalog_type=pystac.CatalogType.RELATIVE_PUBLISHED)
+    cat_href = cat.get_self_href()
+    manifest = str(tmp_path / "manifest.jsonl")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["move-assets", "-c", cat_href, "--plan", manifest])
+    assert result.exit_code == 0, result.output
+
+    cat2 = pystac.read_file(cat_href)
+    hrefs = [
+        asset.get_absolute_href()
+        for item in cat2.get_items(recursive=True)
+        for asset in item.assets.values()
+    ]
+    assert not any(os.path.exists(href) for href in hrefs)
+
+    result = runner.invoke(cli, ["execute-transfers", manifest, "-w", "2"])
+    assert result.exit_code == 0, result.output
+    assert all(os.path.exists(href) for href in hrefs)
+
+    result = runner.invoke(cli, ["execute-transfers", manifest])
+    assert result.exit_code == 0, result.output
+    assert "Transferred 0 asset files" in result.output
+
+
+def test_copy_assets_sync(tmp_path: Path, planet_disaster: pystac.Collection) -> None:
+    cat_href = planet_disaster.get_self_href()
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["copy", cat_href, str(tmp_path), "-a"])
+    assert result.exit_code == 0
+
+    result = runner.invoke(cli, ["copy", cat_href, str(tmp_path), "-a"])
+    assert isinstance(result.exception, FileExistsError)
+
+    result = runner.invoke(cli, ["copy", cat_href, str(tmp_path), "-a", "--sync"])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        cli, ["copy", cat_href, str(tmp_path), "-a", "--sync", "--checksum"]
+    )
+    assert result.exit_code == 0, result.output
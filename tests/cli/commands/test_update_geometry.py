@@ -1,9 +1,13 @@
+import json
+import os
 import shutil
 from pathlib import Path
 
 from click.testing import CliRunner
+from pystac import Catalog, CatalogType, Item
 
 from stactools.cli.cli import cli
+from stactools.core.utils.footprint_cache import DirectoryFootprintCache
 from tests import test_data
 
 
@@ -20,3 +24,116 @@ def test_update_geometry(tmp_path: Path) -> None:
     runner = CliRunner()
     result = runner.invoke(cli, ["update-geometry", item_path])
     assert result.exit_code == 0
+
+
+def test_update_geometry_mask_source(tmp_path: Path) -> None:
+    item_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.json"
+    )
+    asset_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+    )
+    item_path = shutil.copy(item_path, str(tmp_path))
+    asset_path = shutil.copy(asset_path, str(tmp_path))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["update-geometry", item_path, "--mask-source", "auto", "--windowed"]
+    )
+    assert result.exit_code == 0
+    assert "Item geometry updated" in result.output
+
+
+def test_update_geometry_many(tmp_path: Path) -> None:
+    asset_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+    )
+    shutil.copy(asset_path, str(tmp_path))
+    item = Item.from_file(
+        test_data.get_path(
+            "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.json"
+        )
+    )
+    item_paths = []
+    for i in range(3):
+        clone = item.clone()
+        clone.id = f"item-{i}"
+        item_path = str(tmp_path / f"item-{i}.json")
+        clone.set_self_href(item_path)
+        clone.save_object(include_self_link=False)
+        item_paths.append(item_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["update-geometry", *item_paths, "--max-workers", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Item geometry updated") == 3
+    geometries = [Item.from_file(path).geometry for path in item_paths]
+    assert geometries[0] != item.geometry
+    assert geometries[0] == geometries[1] == geometries[2]
+
+
+def test_update_geometry_cache_limits(tmp_path: Path) -> None:
+    item_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.json"
+    )
+    asset_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+    )
+    item_path = shutil.copy(item_path, str(tmp_path))
+    shutil.copy(asset_path, str(tmp_path))
+    cache_dir = str(tmp_path / "cache")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "update-geometry",
+            item_path,
+            "--cache-dir",
+            cache_dir,
+            "--cache-max-bytes",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(DirectoryFootprintCache(cache_dir)) == 0
+
+    result = runner.invoke(
+        cli,
+        [
+            "update-geometry",
+            item_path,
+            "--cache-dir",
+            cache_dir,
+            "--cache-max-entries",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(DirectoryFootprintCache(cache_dir)) == 1
+
+
+def test_update_geometry_self_contained_catalog(tmp_path: Path) -> None:
+    item = Item.from_file(
+        test_data.get_path(
+            "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.json"
+        )
+    )
+    catalog = Catalog("a-catalog", "A catalog")
+    catalog.add_item(item)
+    catalog.normalize_hrefs(str(tmp_path))
+    catalog.save(CatalogType.SELF_CONTAINED)
+    shutil.copy(
+        test_data.get_path(
+            "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+        ),
+        os.path.dirname(item.get_self_href()),
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["update-geometry", str(tmp_path / "catalog.json")])
+    assert result.exit_code == 0, result.output
+    assert "Item geometry updated" in result.output
+    with open(item.get_self_href()) as f:
+        links = json.load(f)["links"]
+    assert not any(link["rel"] == "self" for link in links)
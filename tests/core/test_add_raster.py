@@ -1,4 +1,5 @@
 import tempfile
+from pathlib import Path
 from typing import Callable, List, Optional
 
 import numpy as np
@@ -6,10 +7,12 @@ import pystac
 import pytest
 import rasterio
 from rasterio.crs import CRS
+from rasterio.enums import Resampling
 from rasterio.transform import Affine
 
+import stactools.core.add_raster
 from stactools.core import create
-from stactools.core.add_raster import add_raster_to_item
+from stactools.core.add_raster import add_raster_to_catalog, add_raster_to_item
 
 
 def random_data(count: int) -> np.ndarray:
@@ -90,9 +93,17 @@ def test_add_raster_with_nodata(
             data = src.read(masked=True)
             minimum = []
             maximum = []
+            mean = []
+            stddev = []
+            valid_percent = []
             for i, _ in enumerate(src.indexes):
                 minimum.append(float(np.nanmin(data[i])))
                 maximum.append(float(np.nanmax(data[i])))
+                valid = data[i].compressed()
+                valid = valid[~np.isnan(valid)]
+                mean.append(float(valid.mean()) if len(valid) else np.nan)
+                stddev.append(float(valid.std()) if len(valid) else np.nan)
+                valid_percent.append(100 * len(valid) / data[i].size)
 
         item = create.item(tmpfile.name)
 
@@ -108,9 +119,190 @@ def test_add_raster_with_nodata(
             expected_min=minimum,
             expected_max=maximum,
             expected_hist_count=hist_count,
+            expected_mean=mean,
+            expected_stddev=stddev,
+            expected_valid_percent=valid_percent,
         )
 
 
+@pytest.mark.parametrize(
+    "dtype,nodata",
+    [("uint8", 0), ("int16", -1), ("uint16", None), ("int32", 7), ("float32", np.nan)],
+)
+def test_add_raster_windowed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dtype: str, nodata: float
+) -> None:
+    monkeypatch.setattr(stactools.core.add_raster, "MAX_WINDOW_PIXELS", 100)
+    data = np.random.default_rng(0).integers(0, 200, (2, 37, 23)).astype(dtype)
+    if nodata is not None:
+        data[:, :5, :] = nodata
+    path = str(tmp_path / "windowed.tif")
+    with rasterio.open(
+        path,
+        mode="w",
+        driver="GTiff",
+        count=2,
+        nodata=nodata,
+        dtype=dtype,
+        transform=Affine(0.1, 0.0, 1.0, 0.0, -0.1, 1.0),
+        width=23,
+        height=37,
+        crs=CRS.from_epsg(4326),
+    ) as dst:
+        dst.write(data)
+
+    item = create.item(path)
+    add_raster_to_item(item)
+    bands = item.assets["data"].extra_fields["raster:bands"]
+    with rasterio.open(path) as src:
+        for band, values in zip(bands, src.read(masked=True)):
+            valid = values.compressed()
+            minimum, maximum = float(valid.min()), float(valid.max())
+            counts, _ = np.histogram(valid, bins=256, range=(minimum, maximum))
+            assert band["statistics"] == {
+                "minimum": minimum,
+                "maximum": maximum,
+                "mean": pytest.approx(valid.mean()),
+                "stddev": pytest.approx(valid.std()),
+                "valid_percent": 100 * len(valid) / values.size,
+            }
+            assert band["histogram"]["buckets"] == counts.tolist()
+
+
+def _write_overview_raster(path: str) -> np.ndarray:
+    data = np.random.default_rng(0).integers(1, 1000, (1, 256, 256)).astype("uint16")
+    data[:, :, :64] = 0
+    with rasterio.open(
+        path,
+        mode="w",
+        driver="GTiff",
+        count=1,
+        nodata=0,
+        dtype="uint16",
+        transform=Affine(0.1, 0.0, 1.0, 0.0, -0.1, 1.0),
+        width=256,
+        height=256,
+        crs=CRS.from_epsg(4326),
+        tiled=True,
+    ) as dst:
+        dst.write(data)
+        dst.build_overviews([2, 4, 8], Resampling.nearest)
+    return data
+
+
+def test_add_raster_approximate(tmp_path: Path) -> None:
+    path = str(tmp_path / "overviews.tif")
+    data = _write_overview_raster(path)
+    item = create.item(path)
+    add_raster_to_item(item, max_pixels=64 * 64)
+    band = item.assets["data"].extra_fields["raster:bands"][0]
+
+    overview = data[0, ::4, ::4]
+    valid = overview[overview != 0]
+    minimum, maximum = float(valid.min()), float(valid.max())
+    counts, _ = np.histogram(valid, bins=256, range=(minimum, maximum))
+    assert band["statistics"] == {
+        "minimum": minimum,
+        "maximum": maximum,
+        "mean": pytest.approx(valid.mean()),
+        "stddev": pytest.approx(valid.std()),
+        "valid_percent": 75.0,
+    }
+    assert band["histogram"]["buckets"] == counts.tolist()
+    assert sum(band["histogram"]["buckets"]) == 64 * 48
+
+
+def test_add_raster_approximate_statistics_metadata(tmp_path: Path) -> None:
+    path = str(tmp_path / "overviews.tif")
+    _write_overview_raster(path)
+    with rasterio.open(path, "r+") as dataset:
+        dataset.update_tags(1, STATISTICS_MINIMUM="10", STATISTICS_MAXIMUM="900")
+    item = create.item(path)
+    add_raster_to_item(item, histogram=False, approximate=True)
+    band = item.assets["data"].extra_fields["raster:bands"][0]
+    assert band["statistics"]["minimum"] == 10.0
+    assert band["statistics"]["maximum"] == 900.0
+    assert band["statistics"]["valid_percent"] == 75.0
+
+    with rasterio.open(path, "r+") as dataset:
+        dataset.update_tags(1, STATISTICS_MEAN="400", STATISTICS_STDDEV="200")
+    add_raster_to_item(item, histogram=False, approximate=True)
+    band = item.assets["data"].extra_fields["raster:bands"][0]
+    assert band["statistics"] == {
+        "minimum": 10.0,
+        "maximum": 900.0,
+        "mean": 400.0,
+        "stddev": 200.0,
+    }
+
+    add_raster_to_item(item, approximate=True)
+    band = item.assets["data"].extra_fields["raster:bands"][0]
+    assert band["histogram"]["min"] == 10.0
+    assert band["histogram"]["max"] == 900.0
+    assert band["histogram"]["count"] == 256
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_add_raster_concurrent(
+    tmp_planet_disaster: pystac.Collection, executor: str
+) -> None:
+    items = list(tmp_planet_disaster.get_items(recursive=True))
+    expected = [add_raster_to_item(item.clone()) for item in items]
+    item = items[0].clone()
+    add_raster_to_item(item, max_workers=4, executor=executor)
+    assert item.to_dict() == expected[0].to_dict()
+
+    updated = add_raster_to_catalog(
+        tmp_planet_disaster, max_workers=4, executor=executor
+    )
+    assert [item.to_dict() for item in updated] == [item.to_dict() for item in expected]
+
+
+def test_add_raster_concurrent_closes_datasets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = np.random.default_rng(0).random((3, 10, 10))
+    items = []
+    for i in range(8):
+        path = str(tmp_path / f"{i}.tif")
+        with rasterio.open(
+            path,
+            mode="w",
+            driver="GTiff",
+            count=3,
+            dtype="float64",
+            transform=Affine(0.1, 0.0, 1.0, 0.0, -0.1, 1.0),
+            width=10,
+            height=10,
+            crs=CRS.from_epsg(4326),
+        ) as dst:
+            dst.write(data)
+        items.append(create.item(path))
+
+    datasets = []
+    peak = 0
+    rasterio_open = rasterio.open
+
+    def tracking_open(href: str) -> rasterio.io.DatasetReader:
+        nonlocal peak
+        dataset = rasterio_open(href)
+        datasets.append(dataset)
+        peak = max(peak, sum(not dataset.closed for dataset in datasets))
+        return dataset
+
+    monkeypatch.setattr(rasterio, "open", tracking_open)
+    stactools.core.add_raster.add_raster_to_items(items, max_workers=2)
+    assert all(item.assets["data"].extra_fields["raster:bands"] for item in items)
+    assert all(dataset.closed for dataset in datasets)
+    # Two threads read the bands of at most two assets at a time
+    assert peak <= 4
+
+
+def test_add_raster_unknown_executor(tmp_asset_path) -> None:
+    with pytest.raises(ValueError):
+        add_raster_to_item(create.item(tmp_asset_path), max_workers=1, executor="fiber")
+
+
 def test_add_raster_without_stats(tmp_asset_path) -> None:
     item = create.item(tmp_asset_path)
     add_raster_to_item(item, statistics=False)
@@ -142,6 +334,9 @@ def _assert_asset(
     expected_min: List[float],
     expected_max: List[float],
     expected_hist_count=256,
+    expected_mean: Optional[List[float]] = None,
+    expected_stddev: Optional[List[float]] = None,
+    expected_valid_percent: Optional[List[float]] = None,
 ) -> None:
     bands = asset.extra_fields.get("raster:bands")
     assert bands
@@ -158,15 +353,23 @@ def _assert_asset(
         )
         assert dtype == expected_dtype.name
         assert spatial_resolution == expected_spatial_resolution
-        assert statistics == {
-            "minimum": expected_min[i],
-            "maximum": expected_max[i],
-        } or (
+        assert (
+            statistics["minimum"] == expected_min[i]
+            and statistics["maximum"] == expected_max[i]
+        ) or (
             np.isnan(statistics["maximum"])
             and np.isnan(expected_max[i])
             and np.isnan(statistics["minimum"])
             and np.isnan(expected_min[i])
         )
+        if expected_mean is not None:
+            if np.isnan(expected_mean[i]):
+                assert "mean" not in statistics
+                assert "stddev" not in statistics
+            else:
+                assert statistics["mean"] == pytest.approx(expected_mean[i])
+                assert statistics["stddev"] == pytest.approx(expected_stddev[i])
+            assert statistics["valid_percent"] == expected_valid_percent[i]
         assert histogram["count"] == expected_hist_count
         assert histogram["max"] == band["statistics"]["maximum"] or (
             np.isnan(histogram["max"]) and np.isnan(statistics["maximum"])
@@ -0,0 +1,324 @@
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import fsspec
+import pystac
+import pytest
+
+import stactools.core.copy
+from stactools.core.copy import (
+    AssetTransfer,
+    execute_transfers,
+    move_all_assets,
+    read_transfer_manifest,
+    write_transfer_manifest,
+)
+
+
+def _asset_paths(catalog: pystac.Catalog) -> List[str]:
+    return sorted(
+        asset.get_absolute_href() or ""
+        for item in catalog.get_items(recursive=True)
+        for asset in item.assets.values()
+    )
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_move_all_assets_copy(
+    tmp_planet_disaster: pystac.Collection, max_workers: int
+) -> None:
+    sources = _asset_paths(tmp_planet_disaster)
+    move_all_assets(
+        tmp_planet_disaster,
+        asset_subdirectory="assets",
+        copy=True,
+        max_workers=max_workers,
+    )
+    for item in tmp_planet_disaster.get_items(recursive=True):
+        item_dir = os.path.dirname(item.get_self_href())
+        for asset in item.assets.values():
+            assert asset.href.startswith("./assets/")
+            assert os.path.dirname(asset.get_absolute_href()) == os.path.join(
+                item_dir, "assets"
+            )
+    destinations = _asset_paths(tmp_planet_disaster)
+    assert all(os.path.exists(path) for path in sources + destinations)
+
+
+def test_move_all_assets_move(tmp_planet_disaster: pystac.Collection) -> None:
+    sources = _asset_paths(tmp_planet_disaster)
+    move_all_assets(tmp_planet_disaster, asset_subdirectory="assets", max_workers=4)
+    assert not any(os.path.exists(path) for path in sources)
+    assert all(os.path.exists(path) for path in _asset_paths(tmp_planet_disaster))
+
+
+def test_execute_transfers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sources = []
+    for i in range(5):
+        path = tmp_path / f"source-{i}.txt"
+        path.write_text(str(i) * 10)
+        sources.append(str(path))
+    transfers = [
+        AssetTransfer(source, str(tmp_path / "a" / "b" / os.path.basename(source)), op)
+        for source, op in zip(sources, ["copy", "copy", "copy", "move", "move"])
+    ]
+
+    directories = []
+    makedirs = stactools.core.copy._makedirs
+    monkeypatch.setattr(
+        stactools.core.copy,
+        "_makedirs",
+        lambda directory: directories.append(directory) or makedirs(directory),
+    )
+    report = execute_transfers(transfers + transfers[:1], max_workers=3)
+    assert directories == [str(tmp_path / "a" / "b")]
+    assert report.files == 5
+    assert report.skipped == 0
+    assert report.bytes == 30
+    for i, transfer in enumerate(transfers):
+        assert Path(transfer.destination).read_text() == str(i) * 10
+        assert os.path.exists(transfer.source) == (transfer.op == "copy")
+
+    with pytest.raises(FileExistsError):
+        execute_transfers(transfers[:3])
+    report = execute_transfers(transfers[:3], ignore_conflicts=True)
+    assert report.files == 0
+    assert report.skipped == 3
+
+
+def test_execute_transfers_conflicting_destinations(tmp_path: Path) -> None:
+    destination = str(tmp_path / "destination.txt")
+    transfers = [
+        AssetTransfer(str(tmp_path / "a.txt"), destination, "copy"),
+        AssetTransfer(str(tmp_path / "b.txt"), destination, "copy"),
+    ]
+    with pytest.raises(FileExistsError):
+        execute_transfers(transfers)
+    assert not os.path.exists(destination)
+
+
+def test_execute_transfers_retries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("data")
+    destination = str(tmp_path / "destination.txt")
+    monkeypatch.setattr(stactools.core.copy, "RETRY_BACKOFF", 0)
+    copy_file = stactools.core.copy._copy_file
+    attempts = []
+
+    def flaky_copy_file(source: str, destination: str, buffer_size: int) -> int:
+        attempts.append(source)
+        if len(attempts) < 3:
+            raise ConnectionError("transient")
+        return copy_file(source, destination, buffer_size)
+
+    monkeypatch.setattr(stactools.core.copy, "_copy_file", flaky_copy_file)
+    transfer = AssetTransfer(str(source), destination, "copy")
+    with pytest.raises(ConnectionError):
+        execute_transfers([transfer], retries=1)
+    attempts.clear()
+    report = execute_transfers([transfer], retries=2)
+    assert len(attempts) == 3
+    assert report.files == 1
+
+    with pytest.raises(FileNotFoundError):
+        execute_transfers(
+            [AssetTransfer(str(tmp_path / "missing.txt"), destination + "2", "copy")]
+        )
+
+
+@pytest.mark.parametrize("ignore_conflicts", [False, True])
+def test_execute_transfers_retries_partial_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, ignore_conflicts: bool
+) -> None:
+    data = os.urandom(1000)
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    destination = tmp_path / "out" / "destination.bin"
+    monkeypatch.setattr(stactools.core.copy, "RETRY_BACKOFF", 0)
+    copy_file = stactools.core.copy._copy_file
+    attempts = []
+
+    def interrupted_copy_file(source: str, destination: str, buffer_size: int) -> int:
+        attempts.append(source)
+        if len(attempts) == 1:
+            with open(destination, "wb") as f:
+                f.write(data[:10])
+            raise ConnectionError("connection reset")
+        return copy_file(source, destination, buffer_size)
+
+    monkeypatch.setattr(stactools.core.copy, "_copy_file", interrupted_copy_file)
+    transfer = AssetTransfer(str(source), str(destination), "copy")
+    report = execute_transfers([transfer], ignore_conflicts=ignore_conflicts)
+    assert len(attempts) == 2
+    assert report.files == 1
+    assert report.skipped == 0
+    assert destination.read_bytes() == data
+
+    # Without retries, the partial destination is removed
+    destination.unlink()
+    attempts.clear()
+    with pytest.raises(ConnectionError):
+        execute_transfers([transfer], retries=0)
+    assert not destination.exists()
+
+
+def test_execute_transfers_streaming(tmp_path: Path) -> None:
+    data = os.urandom(10_000)
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    memory = fsspec.filesystem("memory")
+    transfers = [
+        AssetTransfer(str(source), "memory://streaming/a/source.bin", "copy"),
+        AssetTransfer(
+            "memory://streaming/a/source.bin", "memory://streaming/b/source.bin", "copy"
+        ),
+        AssetTransfer(
+            "memory://streaming/b/source.bin", str(tmp_path / "copy.bin"), "move"
+        ),
+    ]
+    try:
+        for transfer in transfers:
+            report = execute_transfers([transfer], buffer_size=999)
+            assert report.bytes == len(data)
+        assert memory.cat("memory://streaming/a/source.bin") == data
+        assert not memory.exists("memory://streaming/b/source.bin")
+        assert (tmp_path / "copy.bin").read_bytes() == data
+    finally:
+        memory.rm("memory://streaming", recursive=True)
+
+
+def test_execute_transfers_local_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = os.urandom(10_000)
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    report = execute_transfers(
+        [AssetTransfer(str(source), str(tmp_path / "copy.bin"), "copy")]
+    )
+    assert report.bytes == len(data)
+    assert (tmp_path / "copy.bin").read_bytes() == data
+
+
+def test_execute_transfers_copy_file_range_stops_early(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = os.urandom(5000)
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    report = execute_transfers(
+        [AssetTransfer(str(source), str(tmp_path / "copy.bin"), "copy")]
+    )
+    assert report.files == 1
+    assert report.bytes == len(data)
+    assert (tmp_path / "copy.bin").read_bytes() == data
+
+
+def test_move_all_assets_plan_only(
+    tmp_planet_disaster: pystac.Collection, tmp_path: Path
+) -> None:
+    sources = _asset_paths(tmp_planet_disaster)
+    transfers = move_all_assets(
+        tmp_planet_disaster, asset_subdirectory="assets", copy=True, plan_only=True
+    )
+    assert sorted(transfer.source for transfer in transfers) == sources
+    assert sorted(transfer.destination for transfer in transfers) == _asset_paths(
+        tmp_planet_disaster
+    )
+    for transfer in transfers:
+        assert transfer.op == "copy"
+        assert transfer.size == os.path.getsize(transfer.source)
+        assert not os.path.exists(transfer.destination)
+
+    manifest = str(tmp_path / "manifest.jsonl")
+    write_transfer_manifest(transfers, manifest)
+    with open(manifest) as f:
+        lines = f.readlines()
+    assert len(lines) == len(transfers)
+    assert list(json.loads(lines[0])) == ["source", "destination", "size", "op"]
+    assert read_transfer_manifest(manifest) == transfers
+
+    # An interrupted transfer leaves a partial destination behind
+    first, second = transfers[0], transfers[1]
+    os.makedirs(os.path.dirname(first.destination), exist_ok=True)
+    shutil.copyfile(first.source, first.destination)
+    with open(second.destination, "wb") as f:
+        f.write(b"partial")
+    report = execute_transfers(read_transfer_manifest(manifest), resume=True)
+    assert report.files == len(transfers) - 1
+    assert report.skipped == 1
+    for transfer in transfers:
+        assert os.path.getsize(transfer.destination) == transfer.size
+
+
+def test_execute_transfers_resume_move(tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("original")
+    destination = tmp_path / "destination.txt"
+    destination.write_text("existing")
+    mtime = source.stat().st_mtime
+    os.utime(destination, (mtime - 10, mtime - 10))
+    transfer = AssetTransfer(str(source), str(destination), "move", size=8)
+
+    # An unrelated destination with the same size doesn't delete the source
+    report = execute_transfers([transfer], resume=True)
+    assert report.skipped == 1
+    assert source.read_text() == "original"
+    assert destination.read_text() == "existing"
+
+    # The destination of an interrupted move does
+    shutil.copyfile(source, destination)
+    report = execute_transfers([transfer], resume=True)
+    assert report.skipped == 1
+    assert not source.exists()
+    assert destination.read_text() == "original"
+
+
+def test_execute_transfers_sync(tmp_path: Path) -> None:
+    source = tmp_path / "source.txt"
+    source.write_text("original")
+    destination = tmp_path / "destination.txt"
+    transfer = AssetTransfer(str(source), str(destination), "copy")
+    assert execute_transfers([transfer], sync=True).files == 1
+    assert execute_transfers([transfer], sync=True).skipped == 1
+
+    # Same size, but modified after the destination
+    source.write_text("modified")
+    mtime = destination.stat().st_mtime
+    os.utime(source, (mtime + 10, mtime + 10))
+    assert execute_transfers([transfer], sync=True).files == 1
+    assert destination.read_text() == "modified"
+
+    # Same size, modified before the destination
+    source.write_text("changed!")
+    os.utime(source, (mtime - 10, mtime - 10))
+    assert execute_transfers([transfer], sync=True).skipped == 1
+    assert execute_transfers([transfer], sync=True, checksum=True).files == 1
+    assert destination.read_text() == "changed!"
+
+    source.write_text("longer content")
+    os.utime(source, (mtime - 10, mtime - 10))
+    assert execute_transfers([transfer], sync=True).files == 1
+    assert destination.read_text() == "longer content"
+
+
+@pytest.mark.parametrize(
+    "info,expected",
+    [
+        ({"mtime": 1.5}, 1.5),
+        ({"LastModified": datetime(2023, 1, 1, tzinfo=timezone.utc)}, 1672531200.0),
+        ({"updated": "2023-01-01T00:00:00.000Z"}, 1672531200.0),
+        ({"updated": "yesterday"}, None),
+        ({}, None),
+    ],
+)
+def test_modified_time(info: Dict[str, Any], expected: Optional[float]) -> None:
+    assert stactools.core.copy._modified_time(info) == expected
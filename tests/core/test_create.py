@@ -74,3 +74,18 @@ def test_read_href_modifer(asset_path: str) -> None:
     item = create.item(asset_path, read_href_modifier=do_it)
     assert did_it
     assert item.id == "20170831_172754_101c_3b_Visual"
+
+
+def test_items(asset_path: str) -> None:
+    other_path = test_data.get_path(
+        "data-files/raster_footprint/AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif"
+    )
+    items = create.items([asset_path, other_path, asset_path], roles=["data"])
+    assert [item.id for item in items] == [
+        create.item(href).id for href in (asset_path, other_path, asset_path)
+    ]
+    for href, item in zip((asset_path, other_path), items):
+        expected = create.item(href)
+        assert item.geometry == expected.geometry
+        assert item.bbox == expected.bbox
+        assert item.assets["data"].href == href
@@ -1,11 +1,13 @@
+import gzip
 import io
 from pathlib import Path
-from unittest.mock import create_autospec, patch
+from unittest.mock import patch
 
 import pystac
 
 import stactools.core.io
 from stactools.core import use_fsspec
+from stactools.core.utils.filesystem import filesystem_registry
 
 
 def test_fsspec_io(tmp_path: Path):
@@ -27,12 +29,48 @@ def test_fsspec_io(tmp_path: Path):
     assert len(list(col2.get_children())) == 2
 
 
-@patch("stactools.core.io.fsspec.open")
-def test_fsspec_kwargs(mock_open):
-    open_file = create_autospec(io.TextIOBase)
-    open_file.read.return_value = "string"
+@patch("stactools.core.io.get_filesystem")
+def test_fsspec_kwargs(mock_get_filesystem):
     use_fsspec()
     url = "url"
-    mock_open.return_value.__enter__.return_value = open_file
-    stactools.core.io.read_text(url, requester_pays=True)
-    mock_open.assert_called_with(url, "r", requester_pays=True)
+    fs = mock_get_filesystem.return_value[0]
+    mock_get_filesystem.return_value = (fs, "path")
+    fs.open.side_effect = lambda *args, **kwargs: io.BytesIO("stríng".encode())
+    assert stactools.core.io.read_text(url, requester_pays=True) == "stríng"
+    mock_get_filesystem.assert_called_with(url, requester_pays=True)
+    fs.open.assert_called_with("path", mode="rb")
+
+    assert (
+        stactools.core.io.read_text(url, requester_pays=True, encoding="latin-1")
+        == "strÃ\xadng"
+    )
+    mock_get_filesystem.assert_called_with(url, requester_pays=True)
+
+
+def test_fsspec_compression(tmp_path: Path):
+    use_fsspec()
+    stac_io = stactools.core.io.FsspecStacIO()
+    path = tmp_path / "a.json.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"a": 1}')
+    assert stac_io.read_text(str(path), compression="gzip") == '{"a": 1}'
+    assert stac_io.read_text(str(path), compression="infer") == '{"a": 1}'
+
+    path = tmp_path / "sub" / "b.json.gz"
+    stac_io.write_text(str(path), "\u00e9", compression="gzip", encoding="latin-1")
+    with gzip.open(path, "rb") as f:
+        assert f.read() == b"\xe9"
+
+
+def test_fsspec_io_shares_filesystem(tmp_path: Path):
+    use_fsspec()
+    stac_io = stactools.core.io.FsspecStacIO()
+    filesystem_registry.clear()
+    for i in range(3):
+        stac_io.write_text(str(tmp_path / "sub" / f"{i}.json"), str(i))
+    assert [stac_io.read_text(f"file://{tmp_path}/sub/{i}.json") for i in range(3)] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert len(filesystem_registry._filesystems) == 1
@@ -1,4 +1,7 @@
-from shapely.geometry import Point
+import shapely.affinity
+from rasterio.crs import CRS
+from rasterio.warp import transform_geom
+from shapely.geometry import LineString, Point, Polygon, mapping, shape
 
 from stactools.core import projection
 
@@ -6,3 +9,58 @@ from stactools.core import projection
 def test_no_precision() -> None:
     # This errors in stactools v0.5.0 because precision is None (needs to be an integer)
     projection.reproject_shape("EPSG:4326", "EPSG:4326", Point((0, 0)))
+
+
+def test_reproject_shape_matches_rasterio() -> None:
+    polygon = Polygon([(500000, 0), (600000, 0), (600000, 100000), (500000, 100000)])
+    reprojected = projection.reproject_shape(
+        "EPSG:32632", "EPSG:4326", polygon, precision=7
+    )
+    expected = shape(transform_geom("EPSG:32632", "EPSG:4326", polygon, precision=7))
+    assert reprojected.equals_exact(expected, 1e-7)
+
+
+def test_reproject_shape_antimeridian() -> None:
+    polygon = Polygon(
+        [(-170000, 0), (170000, 0), (170000, 100000), (-170000, 100000)]
+    ).buffer(0)
+    utm = CRS.from_dict({"proj": "utm", "zone": 60})
+    shifted = shapely.affinity.translate(polygon, 500000 + 333000)
+    reprojected = projection.reproject_shape(utm, "EPSG:4326", shifted)
+    assert reprojected.geom_type == "MultiPolygon"
+    xmin, _, xmax, _ = reprojected.bounds
+    assert xmin == -180 and xmax == 180
+
+
+def test_transformer_cache() -> None:
+    cache = projection.TransformerCache(maxsize=2)
+    transformer = cache.get("EPSG:32632", "EPSG:4326")
+    assert cache.get("EPSG:32632", "EPSG:4326") is transformer
+    assert cache.get(CRS.from_epsg(32632), "EPSG:4326") is not transformer
+    cache.get("EPSG:32633", "EPSG:4326")
+    assert cache.cache_info() == projection.TransformerCacheInfo(1, 3, 2, 2)
+    assert cache.get("EPSG:32632", "EPSG:4326") is not transformer
+
+    cache.clear()
+    assert cache.cache_info() == projection.TransformerCacheInfo(0, 0, 2, 0)
+
+
+def test_reproject_shapes() -> None:
+    geoms = [
+        Polygon([(500000, 0), (600000, 0), (600000, 100000), (500000, 100000)]),
+        Point(500000, 0),
+        mapping(LineString([(500000, 0), (500000, 1), (600000, 0)])),
+        Polygon(),
+    ]
+    reprojected = projection.reproject_shapes(
+        "EPSG:32632", "EPSG:4326", geoms, precision=4
+    )
+    assert len(reprojected) == 4
+    for geom, actual in zip(geoms, reprojected):
+        expected = projection.reproject_shape(
+            "EPSG:32632", "EPSG:4326", geom, precision=4
+        )
+        assert actual.equals_exact(expected, 0)
+    assert len(reprojected[2].coords) == 2
+    assert reprojected[3].is_empty
+    assert geoms[0].bounds == (500000, 0, 600000, 100000)
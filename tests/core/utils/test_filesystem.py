@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
+
+from stactools.core.utils import href_exists
+from stactools.core.utils.filesystem import FilesystemRegistry, get_filesystem
+
+
+def test_filesystem_registry_shares_instances() -> None:
+    registry = FilesystemRegistry()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        filesystems = list(pool.map(lambda _: registry.get("memory"), range(8)))
+    assert all(fs is filesystems[0] for fs in filesystems)
+    assert isinstance(filesystems[0], MemoryFileSystem)
+    assert registry.get() is registry.get("file")
+    assert registry.get("file") is not registry.get("file", auto_mkdir=True)
+
+    registry.clear()
+    assert not registry._filesystems
+
+
+def test_filesystem_registry_resolve(tmp_path: Path) -> None:
+    registry = FilesystemRegistry()
+    fs, path = registry.resolve(f"file://{tmp_path}/a.txt")
+    assert isinstance(fs, LocalFileSystem)
+    assert path == f"{tmp_path}/a.txt"
+    assert registry.resolve(str(tmp_path / "b.txt")) == (fs, f"{tmp_path}/b.txt")
+    fs, path = registry.resolve("memory://bucket/a.txt")
+    assert isinstance(fs, MemoryFileSystem)
+    assert path == "/bucket/a.txt"
+
+
+def test_href_exists(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    assert not href_exists(str(path))
+    path.write_text("a")
+    assert href_exists(str(path))
+    assert href_exists(f"file://{path}")
+    fs, _ = get_filesystem(str(path))
+    assert get_filesystem(f"file://{path}")[0] is fs
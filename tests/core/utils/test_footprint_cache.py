@@ -0,0 +1,108 @@
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+from pystac import Item
+
+from stactools.core.utils import file_identity
+from stactools.core.utils.footprint_cache import (
+    DirectoryFootprintCache,
+    footprint_cache_key,
+)
+from stactools.core.utils.raster_footprint import RasterFootprint
+from tests import test_data
+
+FOOTPRINT = {
+    "type": "Polygon",
+    "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+}
+
+
+def test_file_identity(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("foo")
+    identity = file_identity(str(path))
+    assert file_identity(str(path)) == identity
+    assert file_identity(str(path), checksum=True) != identity
+
+    path.write_text("foobar")
+    assert file_identity(str(path)) != identity
+
+
+def test_cache_key(tmp_path: Path) -> None:
+    path = tmp_path / "file.tif"
+    path.write_bytes(b"foo")
+    key = footprint_cache_key(str(path), {"bands": [1]})
+    assert footprint_cache_key(str(path), {"bands": [1]}) == key
+    assert footprint_cache_key(str(path), {"bands": [2]}) != key
+
+    path.write_bytes(b"foobar")
+    assert footprint_cache_key(str(path), {"bands": [1]}) != key
+
+
+def test_directory_cache(tmp_path: Path) -> None:
+    cache = DirectoryFootprintCache(str(tmp_path / "cache"))
+    assert cache.get("a") is None
+    cache.set("a", FOOTPRINT)
+    assert cache.get("a") == FOOTPRINT
+    assert len(cache) == 1
+
+    reopened = pickle.loads(pickle.dumps(cache))
+    assert reopened.get("a") == FOOTPRINT
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_directory_cache_eviction(tmp_path: Path) -> None:
+    cache = DirectoryFootprintCache(str(tmp_path), max_entries=2)
+    cache.set("a", FOOTPRINT)
+    cache.set("b", FOOTPRINT)
+    assert cache.get("a") == FOOTPRINT
+    cache.set("c", FOOTPRINT)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == FOOTPRINT
+
+    size = len(json.dumps(FOOTPRINT))
+    cache = DirectoryFootprintCache(str(tmp_path / "bytes"), max_bytes=2 * size)
+    for key in "abc":
+        cache.set(key, FOOTPRINT)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+
+def test_update_geometry_with_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    item_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.json"
+    )
+    asset_path = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+    )
+    item_path = shutil.copy(item_path, str(tmp_path))
+    asset_path = shutil.copy(asset_path, str(tmp_path))
+    cache = DirectoryFootprintCache(str(tmp_path / "cache"))
+
+    expected = Item.from_file(item_path)
+    assert RasterFootprint.update_geometry_from_asset_footprint(expected, cache=cache)
+    assert len(cache) == 1
+
+    def from_href(*args, **kwargs):  # type: ignore
+        raise AssertionError("footprint should be read from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(RasterFootprint, "from_href", from_href)
+        item = Item.from_file(item_path)
+        assert RasterFootprint.update_geometry_from_asset_footprint(item, cache=cache)
+        assert item.bbox == expected.bbox
+
+    stat = os.stat(asset_path)
+    os.utime(asset_path, (stat.st_atime, stat.st_mtime + 10))
+    item = Item.from_file(item_path)
+    assert RasterFootprint.update_geometry_from_asset_footprint(item, cache=cache)
+    assert len(cache) == 2
@@ -1,15 +1,31 @@
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 import pytest
-from pystac import Item
+import rasterio
+import rasterio.warp
+from pystac import Asset, Item
+from rasterio import Affine
 from rasterio.crs import CRS
-from shapely.geometry import shape
+from rasterio.enums import ColorInterp
+from shapely.geometry import LineString, Point, shape
 from shapely.geometry.multipolygon import MultiPolygon
 from shapely.geometry.polygon import Polygon, orient
 
 from stactools.core import use_fsspec
 from stactools.core.utils.raster_footprint import (
     FootprintMergeStrategy,
+    FootprintMode,
+    MaskSource,
     RasterFootprint,
     data_footprint,
+    densify_array_by_distance,
+    densify_array_by_factor,
+    densify_array_by_reprojection_error,
     densify_by_distance,
     densify_by_factor,
     densify_reproject_simplify,
@@ -445,6 +461,67 @@ def test_densify_by_factor() -> None:
     assert len(densified_coords) == 9
 
 
+def test_densify_array_by_distance() -> None:
+    points = np.array([(0.0, 0.0), (10.0, 0.0), (10.0, 0.0), (10.0, 10.0)])
+    densified = densify_array_by_distance(points, 3.33)
+    assert densified.shape == (9, 2)
+    np.testing.assert_array_equal(densified[[0, 4, -1]], points[[0, 1, 3]])
+    np.testing.assert_allclose(densified[1], (3.33, 0.0))
+    assert densify_by_distance(points, 3.33) == [tuple(p) for p in densified]
+
+
+def test_densify_array_by_factor() -> None:
+    points = np.array([(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)])
+    densified = densify_array_by_factor(points, 2)
+    np.testing.assert_array_equal(
+        densified, [(0.0, 0.0), (5.0, 0.0), (10.0, 0.0), (10.0, 5.0), (10.0, 10.0)]
+    )
+
+
+def test_densify_array_by_reprojection_error() -> None:
+    sinusoidal = CRS.from_string(
+        "+proj=sinu +lon_0=0 +x_0=0 +y_0=0 +R=6371007.181 +units=m +no_defs"
+    )
+    points = np.array([(-2e6, 7e6), (2e6, 7e6), (2e6, 6e6)])
+    coarse = densify_array_by_reprojection_error(points, sinusoidal, "EPSG:4326", 0.1)
+    fine = densify_array_by_reprojection_error(points, sinusoidal, "EPSG:4326", 1e-3)
+    assert len(points) < len(coarse) < len(fine)
+    np.testing.assert_array_equal(fine[[0, -1]], points[[0, -1]])
+
+    # sinusoidal parallels are straight in geographic coordinates
+    assert (fine[:, 1] == 7e6).sum() == 2
+
+    ys = np.linspace(7e6, 6e6, 1001)
+    lons, lats = rasterio.warp.transform(sinusoidal, "EPSG:4326", [2e6] * len(ys), ys)
+    lons_fine, lats_fine = rasterio.warp.transform(
+        sinusoidal, "EPSG:4326", fine[:, 0], fine[:, 1]
+    )
+    densified = LineString(zip(lons_fine, lats_fine))
+    assert max(densified.distance(Point(p)) for p in zip(lons, lats)) < 1e-3
+
+    utm = CRS.from_epsg(32632)
+    assert len(densify_array_by_reprojection_error(points, utm, utm, 1e-3)) == 3
+
+
+def test_densification_tolerance() -> None:
+    href = test_data.get_path(
+        "data-files/raster_footprint/AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif"
+    )
+    plain = RasterFootprint.from_href(href, no_data=0, bands=[])
+    adaptive = RasterFootprint.from_href(
+        href, no_data=0, bands=[], densification_tolerance=1e-7
+    )
+    polygon = plain.data_extent(plain.data_mask())
+    densified = adaptive.densify_polygon(polygon)
+    assert len(densified.exterior.coords) > len(polygon.exterior.coords)
+    assert densified.equals(polygon)
+
+    with pytest.raises(ValueError):
+        RasterFootprint.from_href(
+            href, densification_distance=10, densification_tolerance=1e-7
+        )
+
+
 def test_footprint_merge_strategies() -> None:
     item = Item.from_file(
         test_data.get_path(
@@ -506,3 +583,446 @@ def test_footprint_merge_strategies() -> None:
         .buffer(1e-8)
         .contains(manually_intersected_geoms)
     )
+
+
+@pytest.mark.parametrize(
+    "path,bands,no_data",
+    [
+        ("LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF", [1], None),
+        ("AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif", [], 0),
+        ("LC08_LST_crop.tif", [1], None),
+    ],
+)
+def test_windowed_matches_full_read(
+    path: str, bands: List[int], no_data: Optional[int]
+) -> None:
+    href = test_data.get_path(f"data-files/raster_footprint/{path}")
+    full = RasterFootprint.from_href(href, bands=bands, no_data=no_data)
+    windowed = RasterFootprint.from_href(
+        href, bands=bands, no_data=no_data, windowed=True
+    )
+    assert windowed.data_array.dtype == np.uint8
+    np.testing.assert_array_equal(windowed.data_mask(), full.data_mask())
+    assert windowed.footprint() == full.footprint()
+
+
+def test_windowed_tiled(tmp_path: Path) -> None:
+    data = np.zeros((1, 64, 64), dtype=np.uint8)
+    data[0, 10:50, 20:40] = 1
+    path = str(tmp_path / "tiled.tif")
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        count=1,
+        width=64,
+        height=64,
+        dtype="uint8",
+        nodata=0,
+        crs="EPSG:32632",
+        transform=Affine(10.0, 0.0, 500000.0, 0.0, -10.0, 5000000.0),
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+    ) as dst:
+        dst.write(data)
+
+    with rasterio.open(path) as reader:
+        assert len(list(reader.block_windows(1))) == 16
+        footprint = RasterFootprint.from_rasterio_dataset_reader(reader, windowed=True)
+    np.testing.assert_array_equal(footprint.data_mask(), data[0])
+
+
+def test_decimated_footprint_error_bound() -> None:
+    href = test_data.get_path(
+        "data-files/raster_footprint/LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF"
+    )
+    full = RasterFootprint.from_href(href)
+    assert full.error_bound == 0.0
+
+    decimated = RasterFootprint.from_href(href, max_pixels=10000)
+    assert decimated.data_array[0].size <= 10000
+    assert decimated.error_bound > 0
+    assert (
+        shape(decimated.footprint())
+        .buffer(decimated.error_bound)
+        .covers(shape(full.footprint()))
+    )
+
+    bounded = RasterFootprint.from_href(href, max_pixels=100, max_error=0.01)
+    assert 0 < bounded.error_bound <= 0.01
+
+
+def test_decimated_footprint_uses_overviews(tmp_path: Path) -> None:
+    data = np.zeros((1, 256, 256), dtype=np.uint8)
+    data[0, 32:224, 64:192] = 1
+    path = str(tmp_path / "overviews.tif")
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        count=1,
+        width=256,
+        height=256,
+        dtype="uint8",
+        nodata=0,
+        crs="EPSG:32632",
+        transform=Affine(10.0, 0.0, 500000.0, 0.0, -10.0, 5000000.0),
+    ) as dst:
+        dst.write(data)
+        dst.build_overviews([2, 4, 8])
+
+    footprint = RasterFootprint.from_href(path, max_pixels=5000)
+    assert footprint.data_array.shape == (1, 64, 64)
+    assert footprint.transform.a == 40.0
+
+
+@pytest.mark.parametrize(
+    "path,bands,no_data",
+    [
+        ("LC08_L1TP_198029_20220331_20220406_02_T1_B2.TIF", [1], None),
+        ("AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif", [], None),
+        ("LC08_LST_crop.tif", [1], None),
+    ],
+)
+@pytest.mark.parametrize("mask_source", [MaskSource.AUTO, MaskSource.GDAL_MASK])
+@pytest.mark.parametrize("windowed", [False, True])
+def test_mask_source_matches_nodata(
+    path: str,
+    bands: List[int],
+    no_data: Optional[int],
+    mask_source: MaskSource,
+    windowed: bool,
+) -> None:
+    href = test_data.get_path(f"data-files/raster_footprint/{path}")
+    expected = RasterFootprint.from_href(href, bands=bands, no_data=no_data)
+    actual = RasterFootprint.from_href(
+        href, bands=bands, no_data=no_data, mask_source=mask_source, windowed=windowed
+    )
+    np.testing.assert_array_equal(actual.data_mask(), expected.data_mask())
+
+
+def _write_masked_raster(path: str, alpha: bool) -> np.ndarray:
+    mask = np.zeros((64, 64), dtype=np.uint8)
+    mask[10:50, 20:40] = 255
+    profile = dict(
+        driver="GTiff",
+        count=2 if alpha else 1,
+        width=64,
+        height=64,
+        dtype="uint8",
+        crs="EPSG:32632",
+        transform=Affine(10.0, 0.0, 500000.0, 0.0, -10.0, 5000000.0),
+    )
+    with rasterio.Env(GDAL_TIFF_INTERNAL_MASK=True):
+        with rasterio.open(path, "w", **profile) as dst:
+            dst.write(np.full((64, 64), 7, dtype=np.uint8), 1)
+            if alpha:
+                dst.write(mask, 2)
+                dst.colorinterp = [ColorInterp.gray, ColorInterp.alpha]
+            else:
+                dst.write_mask(mask)
+    return mask // 255
+
+
+def test_mask_source_internal_mask(tmp_path: Path) -> None:
+    path = str(tmp_path / "masked.tif")
+    expected = _write_masked_raster(path, alpha=False)
+
+    footprint = RasterFootprint.from_href(path, mask_source=MaskSource.AUTO)
+    np.testing.assert_array_equal(footprint.data_mask(), expected)
+
+    footprint = RasterFootprint.from_href(path)
+    assert footprint.data_mask().all()
+
+    with pytest.raises(ValueError, match="alpha band"):
+        RasterFootprint.from_href(path, mask_source=MaskSource.ALPHA)
+
+
+def test_mask_source_alpha(tmp_path: Path) -> None:
+    path = str(tmp_path / "alpha.tif")
+    expected = _write_masked_raster(path, alpha=True)
+
+    for mask_source in (MaskSource.ALPHA, MaskSource.GDAL_MASK, MaskSource.AUTO):
+        footprint = RasterFootprint.from_href(path, mask_source=mask_source)
+        np.testing.assert_array_equal(footprint.data_mask(), expected)
+
+
+@pytest.mark.parametrize("no_data", [0, 3, np.nan, None])
+def test_data_mask(no_data: Optional[float]) -> None:
+    data = np.arange(3 * 4 * 5, dtype=np.float64).reshape(3, 4, 5) % 7
+    data[0, 0, :] = np.nan
+    footprint = RasterFootprint(
+        data, CRS.from_epsg(4326), Affine.identity(), no_data=no_data
+    )
+    mask = footprint.data_mask()
+    assert mask.dtype == np.uint8
+    assert mask.shape == (4, 5)
+    if no_data is None:
+        expected = np.ones((4, 5), dtype=np.uint8)
+    elif np.isnan(no_data):
+        expected = np.any(~np.isnan(data), axis=0).astype(np.uint8)
+    else:
+        expected = np.any(data != no_data, axis=0).astype(np.uint8)
+    np.testing.assert_array_equal(mask, expected)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_update_geometries(executor: str) -> None:
+    item = Item.from_file(
+        test_data.get_path(
+            "data-files/raster_footprint/aster/AST_L1T_00305032000040446_20150409135350.json"
+        )
+    )
+    kwargs = dict(no_data=0, bands=[], simplify_tolerance=0.001)
+
+    expected = item.clone()
+    assert RasterFootprint.update_geometry_from_asset_footprint(expected, **kwargs)
+
+    items = [item.clone()]
+    for asset_name in ("SWIR", "TIR", "does-not-exist"):
+        clone = item.clone()
+        clone.assets = {k: v for k, v in clone.assets.items() if k == asset_name}
+        items.append(clone)
+
+    results = RasterFootprint.update_geometries(
+        items, max_workers=2, executor=executor, **kwargs
+    )
+    assert results == [True, True, True, False]
+    assert shape(items[0].geometry) == shape(expected.geometry)
+    assert items[0].bbox == expected.bbox
+    assert items[3].geometry == item.geometry
+
+    with pytest.raises(ValueError, match="executor"):
+        RasterFootprint.update_geometries(items, executor="cluster")
+
+
+def test_concurrent_data_footprints_for_data_assets() -> None:
+    item = Item.from_file(
+        test_data.get_path(
+            "data-files/raster_footprint/aster/AST_L1T_00305032000040446_20150409135350.json"
+        )
+    )
+    kwargs = dict(no_data=0, bands=[], simplify_tolerance=0.001)
+
+    expected = list(RasterFootprint.data_footprints_for_data_assets(item, **kwargs))
+    actual = list(
+        RasterFootprint.data_footprints_for_data_assets(
+            item, max_asset_workers=3, **kwargs
+        )
+    )
+    assert [name for name, _ in actual] == list(item.assets.keys())
+    assert actual == expected
+
+    first = item.clone()
+    assert RasterFootprint.update_geometry_from_asset_footprint(
+        first, max_asset_workers=1, **kwargs
+    )
+    assert first.geometry == expected[0][1]
+
+
+def test_concurrent_data_footprints_for_data_assets_closed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    item = Item("an-id", None, None, datetime(2023, 1, 1), {})
+    for i in range(10):
+        item.add_asset(str(i), Asset(f"/data/{i}.tif"))
+    started = []
+    running = set()
+    lock = threading.Lock()
+
+    class SlowFootprint:
+        def __init__(self, href: str) -> None:
+            self.href = href
+
+        def footprint(self) -> Dict[str, Any]:
+            with lock:
+                started.append(self.href)
+                running.add(self.href)
+            time.sleep(0.05)
+            with lock:
+                running.remove(self.href)
+            return {"type": "Point", "coordinates": [0, 0]}
+
+    monkeypatch.setattr(
+        RasterFootprint,
+        "from_href",
+        classmethod(lambda cls, href, **kwargs: SlowFootprint(href)),
+    )
+    footprints = RasterFootprint.data_footprints_for_data_assets(
+        item, max_asset_workers=2
+    )
+    assert next(footprints)[0] == "0"
+    footprints.close()
+    assert not running
+    # The first asset, and at most two assets ahead of it
+    assert len(started) <= 3
+
+
+def test_convex_hull_mode() -> None:
+    data = np.zeros((40, 50), dtype=np.uint8)
+    data[5:10, 5:12] = 1
+    data[30:35, 40:48] = 1
+    data[20, 2] = 1
+    data[12:25, 20] = 1
+    transform = Affine(30.0, 0.0, 500000.0, 0.0, -30.0, 5000000.0)
+    crs = CRS.from_epsg(32632)
+
+    polygonized = RasterFootprint(data, crs, transform, no_data=0)
+    hull = RasterFootprint(
+        data,
+        crs,
+        transform,
+        no_data=0,
+        footprint_mode=FootprintMode.CONVEX_HULL,
+    )
+    expected = polygonized.data_extent(polygonized.data_mask())
+    actual = hull.data_extent(hull.data_mask())
+    assert actual.exterior.is_ccw
+    assert actual.equals(expected)
+
+    empty = RasterFootprint(
+        np.zeros((4, 4)),
+        crs,
+        transform,
+        no_data=0,
+        footprint_mode=FootprintMode.CONVEX_HULL,
+    )
+    assert empty.footprint() is None
+
+
+def test_convex_hull_mode_from_href() -> None:
+    href = test_data.get_path(
+        "data-files/raster_footprint/AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif"
+    )
+    polygonized = RasterFootprint.from_href(href, no_data=0, bands=[])
+    hull = RasterFootprint.from_href(
+        href, no_data=0, bands=[], footprint_mode=FootprintMode.CONVEX_HULL
+    )
+    mask = polygonized.data_mask()
+    assert hull.data_extent(mask).equals(polygonized.data_extent(mask).convex_hull)
+
+
+def test_outline_mode() -> None:
+    data = np.zeros((40, 50), dtype=np.uint8)
+    data[5:25, 5:25] = 1
+    data[10:12, 10:12] = 0
+    data[14:20, 14:20] = 0
+    data[30:35, 40:48] = 1
+    data[2, 45] = 1
+    transform = Affine(30.0, 0.0, 500000.0, 0.0, -30.0, 5000000.0)
+    crs = CRS.from_epsg(32632)
+
+    outline = RasterFootprint(
+        data, crs, transform, no_data=0, footprint_mode=FootprintMode.OUTLINE
+    )
+    extent = outline.data_extent(outline.data_mask())
+    assert isinstance(extent, MultiPolygon)
+    assert len(extent.geoms) == 3
+    assert sum(len(polygon.interiors) for polygon in extent.geoms) == 2
+    assert all(polygon.exterior.is_ccw for polygon in extent.geoms)
+    assert extent.area == (400 - 4 - 36 + 40 + 1) * 900
+
+    filtered = RasterFootprint(
+        data,
+        crs,
+        transform,
+        no_data=0,
+        footprint_mode=FootprintMode.OUTLINE,
+        min_hole_area=10,
+        min_island_area=10,
+    )
+    extent = filtered.data_extent(filtered.data_mask())
+    assert isinstance(extent, MultiPolygon)
+    assert len(extent.geoms) == 2
+    assert sum(len(polygon.interiors) for polygon in extent.geoms) == 1
+
+    footprint = filtered.footprint()
+    assert footprint is not None
+    assert footprint["type"] == "MultiPolygon"
+    assert sorted(len(rings) for rings in footprint["coordinates"]) == [1, 2]
+
+
+def test_outline_mode_closing() -> None:
+    data = np.zeros((20, 20), dtype=np.uint8)
+    data[2:18, 2:18] = 1
+    data[::3, :] = 0
+    transform = Affine(1.0, 0.0, 0.0, 0.0, -1.0, 20.0)
+    footprint = RasterFootprint(
+        data,
+        CRS.from_epsg(32632),
+        transform,
+        no_data=0,
+        footprint_mode=FootprintMode.OUTLINE,
+    )
+    assert isinstance(footprint.data_extent(footprint.data_mask()), MultiPolygon)
+
+    footprint.closing_size = 1
+    extent = footprint.data_extent(footprint.data_mask())
+    assert isinstance(extent, Polygon)
+    assert extent.contains(shape(footprint.data_extent(data)))
+
+
+def test_concave_hull_mode() -> None:
+    href = test_data.get_path(
+        "data-files/raster_footprint/AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif"
+    )
+    outline = RasterFootprint.from_href(
+        href, no_data=0, bands=[], footprint_mode=FootprintMode.OUTLINE
+    )
+    concave = RasterFootprint.from_href(
+        href,
+        no_data=0,
+        bands=[],
+        footprint_mode=FootprintMode.CONCAVE_HULL,
+        concave_hull_ratio=0.1,
+    )
+    convex = RasterFootprint.from_href(
+        href, no_data=0, bands=[], footprint_mode=FootprintMode.CONVEX_HULL
+    )
+    mask = outline.data_mask()
+    data_outline = outline.data_extent(mask)
+    hull = concave.data_extent(mask)
+    assert isinstance(hull, Polygon)
+    assert not hull.interiors
+    assert hull.covers(data_outline)
+    assert hull.area <= convex.data_extent(mask).area
+
+    concave.outline_tolerance = 2
+    simplified = concave.data_extent(mask)
+    assert len(simplified.exterior.coords) < len(hull.exterior.coords)
+
+
+@pytest.mark.parametrize("max_vertices", [5, 12, 40])
+def test_max_vertices(max_vertices: int) -> None:
+    href = test_data.get_path(
+        "data-files/raster_footprint/AST_L1T_00310012006175412_20150516104359-SWIR-cropped.tif"
+    )
+    unsimplified = RasterFootprint.from_href(
+        href, no_data=0, bands=[], footprint_mode=FootprintMode.OUTLINE
+    )
+    original = shape(unsimplified.footprint())
+    assert len(original.exterior.coords) > 40
+
+    bounded = RasterFootprint.from_href(
+        href,
+        no_data=0,
+        bands=[],
+        footprint_mode=FootprintMode.OUTLINE,
+        max_vertices=max_vertices,
+    )
+    footprint = shape(bounded.footprint())
+    assert len(footprint.exterior.coords) <= max_vertices
+    assert footprint.exterior.is_ccw
+    assert footprint.covers(original)
+
+
+def test_max_vertices_within_budget() -> None:
+    polygon = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    footprint = RasterFootprint(
+        np.ones((1, 1)), CRS.from_epsg(4326), Affine.identity(), max_vertices=10
+    )
+    assert footprint.simplify_polygon(polygon) is polygon
+    footprint.max_vertices = 4
+    with pytest.raises(ValueError):
+        footprint.simplify_polygon(polygon)
@@ -1,8 +1,13 @@
 from typing import Any, Iterable, Iterator
 
+import pytest
 from pystac import Collection, Item
 
-from stactools.core.utils.round import recursive_round, round_coordinates
+from stactools.core.utils.round import (
+    recursive_round,
+    round_coordinates,
+    round_coordinates_many,
+)
 from tests import test_data
 
 
@@ -97,3 +102,56 @@ def test_recursive_round() -> None:
     rounded = recursive_round(nested_tuples, precision=5)
     for coord in flatten(rounded):
         assert str(coord)[::-1].find(".") == 5
+
+
+def test_recursive_round_ragged() -> None:
+    polygon = [
+        [(0.123456, 1.123456), (2.123456, 3.123456), (4, 5), (0.123456, 1.123456)],
+        [(0.5, 0.5), (0.6, 0.5), (0.512345, 0.612345), (0.5, 0.5)],
+        [],
+    ]
+    rounded = recursive_round(polygon, precision=2)
+    assert rounded is polygon
+    assert rounded == [
+        [[0.12, 1.12], [2.12, 3.12], [4, 5], [0.12, 1.12]],
+        [[0.5, 0.5], [0.6, 0.5], [0.51, 0.61], [0.5, 0.5]],
+        [],
+    ]
+    assert [type(value) for value in rounded[0][2]] == [int, int]
+
+
+def test_recursive_round_mixed_int_float() -> None:
+    rounded = recursive_round([[1, 2.5], [3.0, -4], [5, 6]], 0)
+    assert rounded == [[1, 2.0], [3.0, -4], [5, 6]]
+    assert [[type(value) for value in pair] for pair in rounded] == [
+        [int, float],
+        [float, int],
+        [int, int],
+    ]
+
+
+@pytest.mark.parametrize("precision", [-1, 0, 2, 7])
+def test_recursive_round_matches_round(precision: int) -> None:
+    values = [2.675, 1.005, 0.125, -0.5, 1.5, 123.456789015, 1e300, -1e-9, 25, 35]
+    rounded = recursive_round([list(values), list(values)], precision)
+    expected = [round(value, precision) for value in values]
+    assert rounded == [expected, expected]
+    assert [type(value) for value in rounded[0]] == [type(value) for value in expected]
+    assert recursive_round([[2.675]], 2) == [[2.67]]
+
+
+def test_round_coordinates_many() -> None:
+    collection = Collection.from_file(
+        test_data.get_path("data-files/basic/country-1/area-1-1/collection.json")
+    )
+    items = list(collection.get_items(recursive=True))
+    items[0].bbox = None
+    expected = [round_coordinates(item.clone(), precision=3) for item in items]
+    expected_collection = round_coordinates(collection.clone(), precision=3)
+
+    rounded = round_coordinates_many([collection, *items], precision=3)
+    assert rounded[0] is collection
+    assert collection.extent.spatial.bboxes == expected_collection.extent.spatial.bboxes
+    for item, expected_item in zip(rounded[1:], expected):
+        assert item.geometry == expected_item.geometry
+        assert item.bbox == expected_item.bbox